@@ -6,10 +6,165 @@ authentication/authorization dependencies (e.g. `get_current_user`),
 rate limiting hooks, or correlation ID injection.
 """
 
+from typing import Optional
+
+from fastapi import Depends, Header, Request
+from starlette.requests import HTTPConnection
+
+from app.application.interview.interfaces import (
+    AsyncAIService,
+    EvaluationJobQueue,
+    ReferenceAnswers,
+    SessionStore,
+)
+from app.application.interview.use_cases import (
+    AsyncEvaluateAnswerUseCase,
+    AsyncGenerateQuestionsUseCase,
+    BatchEvaluateAnswersUseCase,
+    GetEvaluationJobUseCase,
+    InterviewSessionUseCase,
+    StreamEvaluateAnswerUseCase,
+    SubmitEvaluationJobUseCase,
+)
+from app.domain.interview.scoring import TrivialAnswerScorer
+from app.infrastructure.config.settings import Settings, get_settings
+from app.shared.errors import NotFoundError
+
+
+def get_ai_service(connection: HTTPConnection) -> AsyncAIService:
+    """
+    Provide the process-wide AsyncAIService built by the application lifespan
+    (for HTTP and WebSocket routes alike).
+    """
+    return connection.app.state.ai_service
+
+
+def get_reference_answers(connection: HTTPConnection) -> Optional[ReferenceAnswers]:
+    """
+    Provide the process-wide reference answer prefetcher (None when disabled).
+    """
+    return getattr(connection.app.state, "reference_answers", None)
+
+
+def get_answer_scorer(connection: HTTPConnection) -> Optional[TrivialAnswerScorer]:
+    """
+    Provide the process-wide local scorer for degenerate answers (None when
+    disabled).
+    """
+    return getattr(connection.app.state, "answer_scorer", None)
+
+
+def get_generate_questions_use_case(
+    ai_service: AsyncAIService = Depends(get_ai_service),
+    references: Optional[ReferenceAnswers] = Depends(get_reference_answers),
+) -> AsyncGenerateQuestionsUseCase:
+    """
+    Provide a question-generation use case bound to the shared AI service.
+    """
+    return AsyncGenerateQuestionsUseCase(ai_service, references)
+
+
+def get_evaluate_answer_use_case(
+    ai_service: AsyncAIService = Depends(get_ai_service),
+    references: Optional[ReferenceAnswers] = Depends(get_reference_answers),
+    scorer: Optional[TrivialAnswerScorer] = Depends(get_answer_scorer),
+) -> AsyncEvaluateAnswerUseCase:
+    """
+    Provide an answer-evaluation use case bound to the shared AI service.
+    """
+    return AsyncEvaluateAnswerUseCase(ai_service, references, scorer)
+
+
+def get_stream_evaluate_answer_use_case(
+    ai_service: AsyncAIService = Depends(get_ai_service),
+    references: Optional[ReferenceAnswers] = Depends(get_reference_answers),
+    scorer: Optional[TrivialAnswerScorer] = Depends(get_answer_scorer),
+) -> StreamEvaluateAnswerUseCase:
+    """
+    Provide a streaming answer-evaluation use case bound to the shared AI service.
+    """
+    return StreamEvaluateAnswerUseCase(ai_service, references, scorer)
+
+
+def get_batch_evaluate_answers_use_case(
+    ai_service: AsyncAIService = Depends(get_ai_service),
+    references: Optional[ReferenceAnswers] = Depends(get_reference_answers),
+    scorer: Optional[TrivialAnswerScorer] = Depends(get_answer_scorer),
+    settings: Settings = Depends(get_settings),
+) -> BatchEvaluateAnswersUseCase:
+    """
+    Provide a batch answer-evaluation use case bound to the shared AI service.
+    """
+    return BatchEvaluateAnswersUseCase(
+        ai_service,
+        max_items=settings.batch_max_items,
+        max_concurrency=settings.batch_max_concurrency,
+        references=references,
+        scorer=scorer,
+    )
+
+
+def get_evaluation_jobs(request: Request) -> EvaluationJobQueue:
+    """
+    Provide the process-wide evaluation job queue started by the lifespan.
+    """
+    jobs = getattr(request.app.state, "evaluation_jobs", None)
+    if jobs is None:
+        raise NotFoundError("Evaluation jobs are disabled")
+    return jobs
+
+
+def get_submit_evaluation_job_use_case(
+    jobs: EvaluationJobQueue = Depends(get_evaluation_jobs),
+) -> SubmitEvaluationJobUseCase:
+    """
+    Provide a use case that queues evaluations on the shared job queue.
+    """
+    return SubmitEvaluationJobUseCase(jobs)
+
+
+def get_evaluation_job_use_case(
+    jobs: EvaluationJobQueue = Depends(get_evaluation_jobs),
+    settings: Settings = Depends(get_settings),
+) -> GetEvaluationJobUseCase:
+    """
+    Provide a use case that looks up (or long-polls) evaluation jobs.
+    """
+    return GetEvaluationJobUseCase(jobs, max_wait=settings.job_max_wait_seconds)
+
+
+def get_session_store(connection: HTTPConnection) -> SessionStore:
+    """
+    Provide the process-wide interview session store.
+    """
+    return connection.app.state.session_store
+
+
+def get_interview_session_use_case(
+    ai_service: AsyncAIService = Depends(get_ai_service),
+    store: SessionStore = Depends(get_session_store),
+    references: Optional[ReferenceAnswers] = Depends(get_reference_answers),
+    scorer: Optional[TrivialAnswerScorer] = Depends(get_answer_scorer),
+) -> InterviewSessionUseCase:
+    """
+    Provide an interview session use case bound to the shared AI service.
+    """
+    return InterviewSessionUseCase(ai_service, store, references, scorer)
+
+
+def request_no_cache(cache_control: Optional[str] = Header(default=None)) -> bool:
+    """
+    True when the client sent `Cache-Control: no-cache` (or `no-store`).
+    """
+    if not cache_control:
+        return False
+    directives = {d.strip().lower() for d in cache_control.split(",")}
+    return bool(directives & {"no-cache", "no-store"})
+
+
 # Example placeholder for future auth dependency:
 #
 # from fastapi import Depends, HTTPException, status
 #
 # def get_current_user(...) -> User:
 #     ...
-
@@ -1,9 +1,15 @@
+import math
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from app.infrastructure.logging.logger import get_logger
 from app.shared.errors import AppError
 
 
+logger = get_logger(__name__)
+
+
 def register_error_handlers(app: FastAPI) -> None:
     """
     Register global exception handlers for application-specific errors.
@@ -11,5 +17,16 @@ def register_error_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(AppError)
     async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:  # type: ignore[unused-ignore]
-        return JSONResponse(status_code=exc.status_code, content=exc.to_dict())
+        if exc.status_code >= 500:
+            logger.warning(
+                exc.message,
+                extra={"code": exc.code, "path": request.url.path, "details": exc.details},
+            )
+        headers = None
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            headers = {"Retry-After": str(max(1, math.ceil(retry_after)))}
+        return JSONResponse(
+            status_code=exc.status_code, content=exc.to_dict(), headers=headers
+        )
 
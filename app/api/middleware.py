@@ -0,0 +1,95 @@
+"""
+ASGI middleware for cross-cutting HTTP concerns.
+"""
+
+import re
+import time
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.context import correlation_id
+from app.shared.metrics import REQUEST_SECONDS, REQUESTS_IN_PROGRESS
+
+
+REQUEST_ID_HEADER = "x-request-id"
+
+# Accept caller-supplied IDs only if they are short and log-safe.
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+
+class CorrelationIdMiddleware:
+    """
+    Give every request a correlation ID.
+
+    An incoming `X-Request-ID` is reused when well-formed (so IDs from a
+    proxy or the frontend carry through); otherwise a new one is generated.
+    The ID is stored in the `correlation_id` context variable for the
+    duration of the request and echoed in the response headers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        incoming = dict(scope["headers"]).get(REQUEST_ID_HEADER.encode(), b"").decode(
+            "latin-1"
+        )
+        request_id = incoming if _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = correlation_id.set(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            correlation_id.reset(token)
+
+
+class MetricsMiddleware:
+    """
+    Record per-route latency and in-flight request count.
+
+    Latency runs until the response body is fully sent, so streamed
+    responses are measured end to end. Requests are labelled by the matched
+    route's name (e.g. `evaluate_answer`), never by raw path, to keep label
+    cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_PROGRESS.dec()
+            route = scope.get("route")
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                handler=getattr(route, "name", None) or "unmatched",
+                status=status,
+            )
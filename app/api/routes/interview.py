@@ -2,64 +2,323 @@
 FastAPI routes for the Interview domain.
 """
 
-from fastapi import APIRouter
+import asyncio
+import json
+from typing import AsyncIterator, Optional
 
+from fastapi import (
+    APIRouter,
+    Depends,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies import (
+    get_batch_evaluate_answers_use_case,
+    get_evaluate_answer_use_case,
+    get_evaluation_job_use_case,
+    get_generate_questions_use_case,
+    get_interview_session_use_case,
+    get_stream_evaluate_answer_use_case,
+    get_submit_evaluation_job_use_case,
+    request_no_cache,
+)
 from app.application.interview.dto import (
+    BatchEvaluationRequest,
+    BatchEvaluationResponse,
+    EvaluationJob,
     EvaluationRequest,
     EvaluationResponse,
+    EvaluationStreamEvent,
     QuestionRequest,
     QuestionResponse,
+    SessionEvent,
+    SessionMessage,
 )
 from app.application.interview.use_cases import (
-    EvaluateAnswerUseCase,
-    GenerateQuestionsUseCase,
+    AsyncEvaluateAnswerUseCase,
+    AsyncGenerateQuestionsUseCase,
+    BatchEvaluateAnswersUseCase,
+    GetEvaluationJobUseCase,
+    InterviewSessionUseCase,
+    StreamEvaluateAnswerUseCase,
+    SubmitEvaluationJobUseCase,
 )
-from app.infrastructure.ai.groq_service import GroqAIService
+from app.infrastructure.config.settings import Settings, get_settings
+from app.shared.errors import AppError, InfrastructureError, ValidationError
 
 
 router = APIRouter()
 
 
-def get_ai_service() -> GroqAIService:
-    """
-    FastAPI dependency that provides an AIService instance.
-    """
-    return GroqAIService()
-
-
 @router.post("/generate-questions", response_model=QuestionResponse)
-def generate_questions(
+async def generate_questions(
     request: QuestionRequest,
+    use_case: AsyncGenerateQuestionsUseCase = Depends(get_generate_questions_use_case),
 ) -> QuestionResponse:
     """
     Generate interview questions for a given role and experience level.
-    
+
     No authentication required - open for trial use.
     """
-    ai_service = get_ai_service()
-    use_case = GenerateQuestionsUseCase(ai_service)
-    result = use_case.execute(request)
-    
+    result = await use_case.execute(request)
+
     if result.is_err:
         raise result.error  # type: ignore[misc]
-    
+
     return result.value  # type: ignore[return-value]
 
 
 @router.post("/evaluate", response_model=EvaluationResponse)
-def evaluate_answer(
+async def evaluate_answer(
     request: EvaluationRequest,
+    use_case: AsyncEvaluateAnswerUseCase = Depends(get_evaluate_answer_use_case),
+    no_cache: bool = Depends(request_no_cache),
 ) -> EvaluationResponse:
     """
     Evaluate an interview answer and provide feedback.
-    
+
+    Identical question/answer pairs are served from cache unless the body sets
+    `no_cache` or the request carries `Cache-Control: no-cache`.
+
+    No authentication required - open for trial use.
+    """
+    if no_cache:
+        request.no_cache = True
+    result = await use_case.execute(request)
+
+    if result.is_err:
+        raise result.error  # type: ignore[misc]
+
+    return result.value  # type: ignore[return-value]
+
+
+@router.post("/evaluate/batch", response_model=BatchEvaluationResponse)
+async def evaluate_answers(
+    request: BatchEvaluationRequest,
+    use_case: BatchEvaluateAnswersUseCase = Depends(
+        get_batch_evaluate_answers_use_case
+    ),
+    no_cache: bool = Depends(request_no_cache),
+) -> BatchEvaluationResponse:
+    """
+    Evaluate several interview answers concurrently (e.g. a whole session).
+
+    Results are returned in request order; each item carries either its
+    evaluation or its own error, so one failure does not fail the batch.
+
+    No authentication required - open for trial use.
+    """
+    if no_cache:
+        for item in request.items:
+            item.no_cache = True
+
+    result = await use_case.execute(request)
+
+    if result.is_err:
+        raise result.error  # type: ignore[misc]
+
+    return result.value  # type: ignore[return-value]
+
+
+@router.post(
+    "/evaluate/jobs",
+    response_model=EvaluationJob,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_evaluation_job(
+    request: EvaluationRequest,
+    http_request: Request,
+    response: Response,
+    use_case: SubmitEvaluationJobUseCase = Depends(
+        get_submit_evaluation_job_use_case
+    ),
+    no_cache: bool = Depends(request_no_cache),
+) -> EvaluationJob:
+    """
+    Queue an interview answer for evaluation and return its job at once.
+
+    Fetch the result from `GET /evaluate/jobs/{job_id}` (the `Location`
+    header); finished jobs are kept for a limited time.
+
     No authentication required - open for trial use.
     """
-    ai_service = get_ai_service()
-    use_case = EvaluateAnswerUseCase(ai_service)
-    result = use_case.execute(request)
-    
+    if no_cache:
+        request.no_cache = True
+    result = await use_case.execute(request)
+
+    if result.is_err:
+        raise result.error  # type: ignore[misc]
+
+    job: EvaluationJob = result.value  # type: ignore[assignment]
+    response.headers["Location"] = f"{http_request.url.path}/{job.job_id}"
+    return job
+
+
+@router.get("/evaluate/jobs/{job_id}", response_model=EvaluationJob)
+async def get_evaluation_job(
+    job_id: str,
+    wait: float = Query(
+        default=0.0,
+        ge=0.0,
+        description="Seconds to wait for the job to finish (long polling)",
+    ),
+    use_case: GetEvaluationJobUseCase = Depends(get_evaluation_job_use_case),
+) -> EvaluationJob:
+    """
+    Return an evaluation job: `queued`, `running`, `succeeded` (with
+    `result`) or `failed` (with `error`).
+
+    With `wait`, the response is held until the job finishes or the wait
+    (capped server-side) elapses.
+    """
+    result = await use_case.execute(job_id, wait)
+
     if result.is_err:
         raise result.error  # type: ignore[misc]
-    
+
     return result.value  # type: ignore[return-value]
+
+
+async def _server_sent_events(
+    events: AsyncIterator[EvaluationStreamEvent],
+) -> AsyncIterator[str]:
+    async for item in events:
+        yield f"event: {item.event}\ndata: {json.dumps(item.data)}\n\n"
+
+
+@router.post("/evaluate/stream")
+async def stream_evaluate_answer(
+    request: EvaluationRequest,
+    use_case: StreamEvaluateAnswerUseCase = Depends(
+        get_stream_evaluate_answer_use_case
+    ),
+    no_cache: bool = Depends(request_no_cache),
+) -> StreamingResponse:
+    """
+    Evaluate an interview answer, streaming feedback as Server-Sent Events.
+
+    Emits a `field` event per completed field (score first, then strengths
+    and weaknesses), `delta` events while `improved_answer` is generated, and
+    a final `done` event with the full evaluation (or an `error` event).
+
+    No authentication required - open for trial use.
+    """
+    if no_cache:
+        request.no_cache = True
+
+    return StreamingResponse(
+        _server_sent_events(use_case.execute(request)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/session")
+async def interview_session(
+    websocket: WebSocket,
+    use_case: InterviewSessionUseCase = Depends(get_interview_session_use_case),
+    settings: Settings = Depends(get_settings),
+) -> None:
+    """
+    Run a whole interview over one WebSocket.
+
+    Send `{"type": "start", "role", "experience"}` (or `resume` with a
+    `session_id`) to receive the `session` event with the questions, then
+    `{"type": "answer", "index", "answer"}` per question. Evaluations stream
+    back as they finish while more answers are accepted; `{"type": "end"}`
+    returns the `summary`. Messages are described by SessionMessage and
+    SessionEvent.
+    """
+    await websocket.accept()
+    send_lock = asyncio.Lock()
+    slots = asyncio.Semaphore(max(1, settings.session_max_concurrent_evaluations))
+    # Pending evaluations and the question index each one answers.
+    evaluations: dict["asyncio.Task[None]", Optional[int]] = {}
+    session_id: Optional[str] = None
+
+    async def send(event: SessionEvent) -> None:
+        async with send_lock:
+            await websocket.send_json(event.model_dump(mode="json"))
+
+    async def send_error(error: AppError) -> None:
+        await send(SessionEvent(event="error", data=error.to_dict()))
+
+    def evaluation_error(index: Optional[int], error: BaseException) -> SessionEvent:
+        if not isinstance(error, AppError):
+            error = InfrastructureError(
+                "Failed to evaluate answer", details={"error": str(error)}
+            )
+        return SessionEvent(event="error", data={"index": index, **error.to_dict()})
+
+    async def evaluate(message: SessionMessage, session_id: str) -> None:
+        # `session_id` is bound when the answer arrives: a later start or
+        # resume must not receive it.
+        async with slots:
+            try:
+                async for event in use_case.answer(
+                    session_id,
+                    message.index,  # type: ignore[arg-type]
+                    message.answer or "",
+                    no_cache=message.no_cache,
+                ):
+                    await send(event)
+            except Exception as e:
+                await send(evaluation_error(message.index, e))
+
+    try:
+        while True:
+            try:
+                message = SessionMessage.model_validate(await websocket.receive_json())
+            except ValueError as e:
+                await send_error(
+                    ValidationError("Invalid session message", details={"error": str(e)})
+                )
+                continue
+
+            if message.type in ("start", "resume"):
+                result = (
+                    await use_case.start(message.role or "", message.experience or "")
+                    if message.type == "start"
+                    else use_case.resume(message.session_id or "")
+                )
+                if result.is_err:
+                    await send_error(result.error)  # type: ignore[arg-type]
+                    continue
+                session_id = result.value.session_id  # type: ignore[union-attr]
+                await send(use_case.state(result.value))  # type: ignore[arg-type]
+            elif session_id is None:
+                await send_error(ValidationError("Start or resume a session first"))
+            elif message.type == "answer":
+                if message.index is None or not message.answer:
+                    await send_error(ValidationError("An answer needs an index and text"))
+                    continue
+                await send(SessionEvent(event="accepted", data={"index": message.index}))
+                task = asyncio.ensure_future(evaluate(message, session_id))
+                evaluations[task] = message.index
+                task.add_done_callback(lambda done: evaluations.pop(done, None))
+            else:  # end
+                pending = dict(evaluations)
+                # One failed evaluation must not keep the others from the summary.
+                results = await asyncio.gather(*pending, return_exceptions=True)
+                for index, outcome in zip(pending.values(), results):
+                    if isinstance(outcome, Exception):
+                        await send(evaluation_error(index, outcome))
+                result = use_case.end(session_id)
+                if result.is_err:
+                    await send_error(result.error)  # type: ignore[arg-type]
+                else:
+                    await send(result.value)  # type: ignore[arg-type]
+                await websocket.close()
+                return
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # Answers already saved stay in the session for a later `resume`.
+        for task in evaluations:
+            task.cancel()
@@ -0,0 +1,253 @@
+"""
+In-memory static file serving for the bundled frontend.
+
+The whole build is read once at startup. Compressible files are stored
+alongside their gzip and brotli encodings (taken from `.gz`/`.br` files
+precompressed by the build, or compressed at load; brotli needs the
+optional `brotli` package), so each request is a dict lookup and a single send:
+no disk reads and no per-request compression. Every representation has a
+strong ETag; content-hashed bundles (`main.3f2a1b9c.js`) are cached by
+browsers as immutable, everything else is revalidated, and matching
+conditional requests get 304 Not Modified.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+
+from starlette.types import Receive, Scope, Send
+
+from app.infrastructure.logging.logger import get_logger
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None  # type: ignore[assignment]
+
+
+logger = get_logger(__name__)
+
+# CRA/webpack put a content hash in the file name of every bundle.
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.(?:chunk\.)?[A-Za-z0-9]+$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+)
+# Below this, compression saves less than the header overhead.
+_MIN_COMPRESS_SIZE = 512
+
+# Preferred order when the client accepts several encodings equally.
+_ENCODINGS = ("br", "gzip")
+
+
+@dataclass
+class _Representation:
+    body: bytes
+    etag: str
+    encoding: Optional[str] = None
+
+
+@dataclass
+class _Asset:
+    media_type: str
+    cache_control: str
+    last_modified: str
+    mtime: int
+    identity: _Representation
+    encoded: dict[str, _Representation] = field(default_factory=dict)
+
+    def select(self, accept_encoding: str) -> _Representation:
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in _ENCODINGS:
+            if encoding in self.encoded and accepted.get(encoding, 0.0) > 0:
+                return self.encoded[encoding]
+        return self.identity
+
+
+def _accepted_encodings(header: str) -> dict[str, float]:
+    """Parse `Accept-Encoding` into {coding: q}; `*` covers unlisted codings."""
+    accepted: dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    if "*" in accepted:
+        for encoding in _ENCODINGS:
+            accepted.setdefault(encoding, accepted["*"])
+    return accepted
+
+
+def _route_path(scope: Scope) -> str:
+    """The request path relative to where this app is mounted."""
+    path, root_path = scope["path"], scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        return path[len(root_path):]
+    return path
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _compress(path: Path, body: bytes, encoding: str) -> Optional[bytes]:
+    """Use a precompressed sibling from the build if present, else compress."""
+    sibling = path.with_name(path.name + (".br" if encoding == "br" else ".gz"))
+    if sibling.is_file():
+        return sibling.read_bytes()
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9, mtime=0)
+    if brotli is not None:
+        return brotli.compress(body, quality=11)
+    return None
+
+
+def _load_asset(path: Path, relative: str) -> _Asset:
+    body = path.read_bytes()
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if media_type.startswith("text/") or media_type.endswith(("javascript", "json")):
+        media_type += "; charset=utf-8"
+    mtime = int(path.stat().st_mtime)
+    asset = _Asset(
+        media_type=media_type,
+        cache_control=IMMUTABLE if _HASHED_NAME.search(relative) else REVALIDATE,
+        last_modified=formatdate(mtime, usegmt=True),
+        mtime=mtime,
+        identity=_Representation(body, _etag(body)),
+    )
+    if len(body) >= _MIN_COMPRESS_SIZE and media_type.startswith(_COMPRESSIBLE_TYPES):
+        base = asset.identity.etag.strip('"')
+        for encoding in _ENCODINGS:
+            compressed = _compress(path, body, encoding)
+            if compressed is not None and len(compressed) < len(body):
+                asset.encoded[encoding] = _Representation(
+                    compressed, f'"{base}-{encoding}"', encoding
+                )
+    return asset
+
+
+class InMemoryStaticFiles:
+    """
+    ASGI app serving a directory from memory, like `StaticFiles(html=True)`:
+    directories map to their `index.html`, and a top-level `404.html` is
+    used for missing files when the build has one.
+    """
+
+    def __init__(self, directory: str) -> None:
+        root = Path(directory)
+        self._assets: dict[str, _Asset] = {}
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith((".gz", ".br")):
+                    continue
+                path = Path(dirpath) / filename
+                relative = path.relative_to(root).as_posix()
+                self._assets[relative] = _load_asset(path, relative)
+        logger.info(
+            "Loaded static files into memory",
+            extra={
+                "files": len(self._assets),
+                "bytes": sum(len(a.identity.body) for a in self._assets.values()),
+                "brotli": brotli is not None,
+            },
+        )
+
+    def _lookup(self, path: str) -> Optional[_Asset]:
+        relative = path.lstrip("/")
+        if relative in ("", ".") or relative.endswith("/"):
+            return self._assets.get(relative + "index.html")
+        return self._assets.get(relative) or self._assets.get(
+            relative + "/index.html"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            allow = [(b"allow", b"GET, HEAD")]
+            await self._send(send, 405, allow, b"Method Not Allowed", method)
+            return
+
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        asset = self._lookup(_route_path(scope))
+        status = 200
+        if asset is None:
+            asset, status = self._assets.get("404.html"), 404
+            if asset is None:
+                await self._send(send, 404, [], b"Not Found", method)
+                return
+
+        representation = asset.select(headers.get("accept-encoding", ""))
+        response_headers = [
+            (b"etag", representation.etag.encode()),
+            (b"cache-control", asset.cache_control.encode()),
+            (b"last-modified", asset.last_modified.encode()),
+        ]
+        if asset.encoded:
+            response_headers.append((b"vary", b"Accept-Encoding"))
+
+        if status == 200 and self._not_modified(headers, representation, asset):
+            await self._send(send, 304, response_headers, b"", method)
+            return
+
+        response_headers.append((b"content-type", asset.media_type.encode()))
+        if representation.encoding is not None:
+            response_headers.append((b"content-encoding", representation.encoding.encode()))
+        await self._send(send, status, response_headers, representation.body, method)
+
+    @staticmethod
+    def _not_modified(
+        headers: dict[str, str], representation: _Representation, asset: _Asset
+    ) -> bool:
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            # Weak comparison, as RFC 9110 requires for If-None-Match.
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or representation.etag in tags
+        if_modified_since = headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return asset.mtime <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    @staticmethod
+    async def _send(
+        send: Send,
+        status: int,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+        method: str,
+    ) -> None:
+        if status != 304:
+            headers = [*headers, (b"content-length", str(len(body)).encode())]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send(
+            {
+                "type": "http.response.body",
+                "body": body if method != "HEAD" and status != 304 else b"",
+            }
+        )
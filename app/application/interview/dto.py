@@ -2,6 +2,9 @@
 Data Transfer Objects for the Interview domain.
 """
 
+from datetime import datetime
+from typing import Any, Literal, Optional
+
 from pydantic import BaseModel
 
 
@@ -23,6 +26,8 @@ class EvaluationRequest(BaseModel):
 
     question: str
     answer: str
+    # Skip cached evaluations and always ask the model (e.g. "re-evaluate").
+    no_cache: bool = False
 
 
 class EvaluationResponse(BaseModel):
@@ -32,3 +37,91 @@ class EvaluationResponse(BaseModel):
     strengths: list[str]
     weaknesses: list[str]
     improved_answer: str
+
+
+class BatchEvaluationRequest(BaseModel):
+    """Request DTO for evaluating several interview answers at once."""
+
+    items: list[EvaluationRequest]
+
+
+class BatchEvaluationItem(BaseModel):
+    """Outcome of one item of a batch: an evaluation or an error payload."""
+
+    ok: bool
+    evaluation: Optional[EvaluationResponse] = None
+    error: Optional[dict[str, Any]] = None
+
+
+class BatchEvaluationResponse(BaseModel):
+    """Response DTO for batch evaluation; results are in request order."""
+
+    results: list[BatchEvaluationItem]
+
+
+class EvaluationStreamEvent(BaseModel):
+    """
+    One event of a streamed evaluation.
+
+    Events are `field` (a completed field), `delta` (more text of a field
+    still being generated), `done` (the full EvaluationResponse) and `error`.
+    """
+
+    event: str
+    data: Any
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class EvaluationJob(BaseModel):
+    """
+    State of an asynchronous evaluation job.
+
+    `result` is set once the job has succeeded and `error` (the usual error
+    payload) once it has failed.
+    """
+
+    job_id: str
+    status: JobStatus
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    result: Optional[EvaluationResponse] = None
+    error: Optional[dict[str, Any]] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+
+class SessionMessage(BaseModel):
+    """
+    Client message on the interview session WebSocket.
+
+    - `start`: open a session for `role` and `experience`
+    - `resume`: reattach to `session_id` after a reconnect
+    - `answer`: answer question `index` (0-based); evaluated in the background
+    - `end`: finish the session and receive its summary
+    """
+
+    type: Literal["start", "resume", "answer", "end"]
+    role: Optional[str] = None
+    experience: Optional[str] = None
+    session_id: Optional[str] = None
+    index: Optional[int] = None
+    answer: Optional[str] = None
+    no_cache: bool = False
+
+
+class SessionEvent(BaseModel):
+    """
+    Server message on the interview session WebSocket.
+
+    Events are `session` (session state), `accepted` (an answer was queued),
+    the evaluation stream events (`field`, `delta`, `done`, `error`) with the
+    question `index` added to their data, `summary`, and `error` for
+    rejected messages.
+    """
+
+    event: str
+    data: Any
@@ -4,9 +4,20 @@ Ports (interfaces) for the Interview domain.
 These define contracts that infrastructure must implement.
 """
 
-from typing import Protocol
+from typing import AsyncIterator, Optional, Protocol, Union
 
-from app.domain.interview.entities import InterviewEvaluation, InterviewQuestion
+from app.application.interview.dto import EvaluationJob, EvaluationRequest
+from app.domain.interview.entities import (
+    EvaluationUpdate,
+    InterviewEvaluation,
+    InterviewQuestion,
+    InterviewSession,
+    ReferenceAnswer,
+)
+
+
+# A streamed evaluation yields updates and ends with the validated evaluation.
+EvaluationStreamItem = Union[EvaluationUpdate, InterviewEvaluation]
 
 
 class AIService(Protocol):
@@ -21,3 +32,104 @@ class AIService(Protocol):
     def evaluate_answer(self, question: str, answer: str) -> InterviewEvaluation:
         """Evaluate an interview answer and provide feedback."""
         ...
+
+
+class AsyncAIService(Protocol):
+    """
+    Asynchronous port for AI/LLM service operations.
+
+    Implementations await upstream I/O on the event loop instead of blocking
+    a worker thread.
+    """
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        """Generate interview questions for a given role and experience level."""
+        ...
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        """
+        Evaluate an interview answer and provide feedback.
+
+        With a `reference`, the model only grades against its rubric and the
+        reference answer is returned as the improved answer.
+        """
+        ...
+
+    def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        """
+        Evaluate an interview answer, yielding each field as soon as it is
+        available and finally the complete InterviewEvaluation.
+        """
+        ...
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        """Write a model answer and grading rubric for a question."""
+        ...
+
+
+class ReferenceAnswers(Protocol):
+    """
+    Port for reference answers prepared ahead of evaluation.
+
+    Questions are handed over as soon as they are issued; references are
+    generated in the background while the candidate is still answering.
+    """
+
+    def prefetch(self, questions: list[str]) -> None:
+        """Start generating references for questions that have none (non-blocking)."""
+        ...
+
+    async def get(self, question: str) -> Optional[ReferenceAnswer]:
+        """Return the stored reference for a question, if it is ready."""
+        ...
+
+
+class EvaluationJobQueue(Protocol):
+    """
+    Port for running evaluations as background jobs.
+
+    Submitting returns immediately; the result is fetched later by job ID.
+    """
+
+    async def submit(self, request: EvaluationRequest) -> EvaluationJob:
+        """Queue an evaluation and return its job in the `queued` state."""
+        ...
+
+    async def get(
+        self, job_id: str, *, wait: float = 0.0
+    ) -> Optional[EvaluationJob]:
+        """
+        Return the job (None if unknown or expired), waiting up to `wait`
+        seconds for it to finish.
+        """
+        ...
+
+
+class SessionStore(Protocol):
+    """
+    Port for server-side interview session state.
+    """
+
+    def get(self, session_id: str) -> Optional[InterviewSession]:
+        """Return a live session, or None if it is unknown or has expired."""
+        ...
+
+    def save(self, session: InterviewSession) -> None:
+        """Insert or refresh a session."""
+        ...
+
+    def delete(self, session_id: str) -> None:
+        """Forget a session."""
+        ...
@@ -2,18 +2,55 @@
 Use cases for the Interview domain.
 """
 
+import asyncio
+import uuid
+from typing import AsyncIterator, Optional
+
 from app.application.interview.dto import (
+    BatchEvaluationItem,
+    BatchEvaluationRequest,
+    BatchEvaluationResponse,
+    EvaluationJob,
     EvaluationRequest,
     EvaluationResponse,
+    EvaluationStreamEvent,
     QuestionRequest,
     QuestionResponse,
+    SessionEvent,
+)
+from app.application.interview.interfaces import (
+    AIService,
+    AsyncAIService,
+    EvaluationJobQueue,
+    ReferenceAnswers,
+    SessionStore,
+)
+from app.domain.interview.entities import (
+    EvaluationUpdate,
+    InterviewEvaluation,
+    InterviewQuestion,
+    InterviewSession,
+    ReferenceAnswer,
 )
-from app.application.interview.interfaces import AIService
-from app.domain.interview.entities import InterviewEvaluation, InterviewQuestion
-from app.shared.errors import InfrastructureError
+from app.domain.interview.scoring import TrivialAnswerScorer
+from app.shared.context import bypassing_cache
+from app.shared.errors import (
+    AppError,
+    InfrastructureError,
+    NotFoundError,
+    ValidationError,
+)
+from app.shared.metrics import REGISTRY, timed
 from app.shared.result import Result
 
 
+_FAST_PATH = REGISTRY.counter(
+    "evaluation_fast_path_total",
+    "Evaluations scored locally (by reason) or by the model.",
+    ("result",),
+)
+
+
 class GenerateQuestionsUseCase:
     """
     Use case: generate interview questions for a role and experience level.
@@ -33,10 +70,15 @@ class GenerateQuestionsUseCase:
             Result containing list of questions or an error
         """
         try:
-            questions = self._ai_service.generate_questions(
-                role=request.role, experience=request.experience
-            )
-            return Result.ok(QuestionResponse(questions=questions))
+            with timed("questions", "ai_service"):
+                questions = self._ai_service.generate_questions(
+                    role=request.role, experience=request.experience
+                )
+            with timed("questions", "response"):
+                response = QuestionResponse(questions=questions)
+            return Result.ok(response)
+        except AppError as e:
+            return Result.err(e)
         except Exception as e:
             return Result.err(
                 InfrastructureError(
@@ -65,17 +107,138 @@ class EvaluateAnswerUseCase:
             Result containing evaluation (score, strengths, weaknesses, improved_answer)
         """
         try:
-            evaluation = self._ai_service.evaluate_answer(
-                question=request.question, answer=request.answer
+            with bypassing_cache(request.no_cache), timed("evaluation", "ai_service"):
+                evaluation = self._ai_service.evaluate_answer(
+                    question=request.question, answer=request.answer
+                )
+            with timed("evaluation", "response"):
+                response = _evaluation_response(evaluation)
+            return Result.ok(response)
+        except AppError as e:
+            return Result.err(e)
+        except Exception as e:
+            return Result.err(
+                InfrastructureError(
+                    "Failed to evaluate answer",
+                    details={"error": str(e)},
+                )
             )
-            return Result.ok(
-                EvaluationResponse(
-                    score=evaluation.score,
-                    strengths=evaluation.strengths,
-                    weaknesses=evaluation.weaknesses,
-                    improved_answer=evaluation.improved_answer,
+
+
+class AsyncGenerateQuestionsUseCase:
+    """
+    Use case: generate interview questions, awaiting an AsyncAIService.
+
+    Issued questions are handed to `references` (when given) so their
+    reference answers are ready by the time the answers come in.
+    """
+
+    def __init__(
+        self,
+        ai_service: AsyncAIService,
+        references: Optional[ReferenceAnswers] = None,
+    ) -> None:
+        self._ai_service = ai_service
+        self._references = references
+
+    async def execute(self, request: QuestionRequest) -> Result[QuestionResponse]:
+        """
+        Generate interview questions.
+
+        Args:
+            request: Contains role and experience level
+
+        Returns:
+            Result containing list of questions or an error
+        """
+        try:
+            with timed("questions", "ai_service"):
+                questions = await self._ai_service.generate_questions(
+                    role=request.role, experience=request.experience
+                )
+            with timed("questions", "response"):
+                response = QuestionResponse(questions=questions)
+            if self._references is not None:
+                self._references.prefetch(response.questions)
+            return Result.ok(response)
+        except AppError as e:
+            return Result.err(e)
+        except Exception as e:
+            return Result.err(
+                InfrastructureError(
+                    "Failed to generate questions",
+                    details={"error": str(e)},
                 )
             )
+
+
+async def _find_reference(
+    references: Optional[ReferenceAnswers], question: str
+) -> Optional[ReferenceAnswer]:
+    if references is None:
+        return None
+    with timed("evaluation", "reference"):
+        return await references.get(question)
+
+
+def _score_locally(
+    scorer: Optional[TrivialAnswerScorer],
+    request: EvaluationRequest,
+    reference: Optional[ReferenceAnswer],
+) -> Optional[InterviewEvaluation]:
+    if scorer is None:
+        return None
+    with timed("evaluation", "fast_path"):
+        triage = scorer.triage(request.question, request.answer, reference)
+    _FAST_PATH.inc(result=triage.reason if triage is not None else "model")
+    return triage.evaluation if triage is not None else None
+
+
+class AsyncEvaluateAnswerUseCase:
+    """
+    Use case: evaluate an interview answer, awaiting an AsyncAIService.
+
+    When `references` already holds a reference answer for the question, the
+    model only grades against it instead of writing an improved answer.
+    Degenerate answers (empty, "I don't know", gibberish, ...) are scored by
+    `scorer` without calling the model at all.
+    """
+
+    def __init__(
+        self,
+        ai_service: AsyncAIService,
+        references: Optional[ReferenceAnswers] = None,
+        scorer: Optional[TrivialAnswerScorer] = None,
+    ) -> None:
+        self._ai_service = ai_service
+        self._references = references
+        self._scorer = scorer
+
+    async def execute(self, request: EvaluationRequest) -> Result[EvaluationResponse]:
+        """
+        Evaluate an interview answer.
+
+        Args:
+            request: Contains question and answer
+
+        Returns:
+            Result containing evaluation (score, strengths, weaknesses, improved_answer)
+        """
+        try:
+            reference = await _find_reference(self._references, request.question)
+            evaluation = _score_locally(self._scorer, request, reference)
+            if evaluation is None:
+                with bypassing_cache(request.no_cache), timed("evaluation", "ai_service"):
+                    evaluation = await self._ai_service.evaluate_answer(
+                        question=request.question,
+                        answer=request.answer,
+                        reference=reference,
+                    )
+            with timed("evaluation", "response"):
+                response = _evaluation_response(evaluation)
+            return Result.ok(response)
+        except AppError as e:
+            return Result.err(e)
         except Exception as e:
             return Result.err(
                 InfrastructureError(
@@ -83,3 +246,329 @@ class EvaluateAnswerUseCase:
                     details={"error": str(e)},
                 )
             )
+
+
+class BatchEvaluateAnswersUseCase:
+    """
+    Use case: evaluate several interview answers concurrently.
+
+    Items are evaluated with at most `max_concurrency` upstream calls in
+    flight; a failing item is reported in place without failing the batch.
+    """
+
+    def __init__(
+        self,
+        ai_service: AsyncAIService,
+        *,
+        max_items: int,
+        max_concurrency: int,
+        references: Optional[ReferenceAnswers] = None,
+        scorer: Optional[TrivialAnswerScorer] = None,
+    ) -> None:
+        self._evaluate = AsyncEvaluateAnswerUseCase(ai_service, references, scorer)
+        self._max_items = max_items
+        self._max_concurrency = max(1, max_concurrency)
+
+    async def execute(
+        self, request: BatchEvaluationRequest
+    ) -> Result[BatchEvaluationResponse]:
+        """
+        Evaluate a batch of interview answers.
+
+        Args:
+            request: Question/answer items
+
+        Returns:
+            Result containing per-item outcomes in request order, or a
+            validation error when the batch is empty or too large
+        """
+        if not request.items:
+            return Result.err(ValidationError("Batch must contain at least one item"))
+        if len(request.items) > self._max_items:
+            return Result.err(
+                ValidationError(
+                    "Too many items in batch",
+                    details={"max_items": self._max_items},
+                )
+            )
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run(item: EvaluationRequest) -> Result[EvaluationResponse]:
+            async with semaphore:
+                return await self._evaluate.execute(item)
+
+        results = await asyncio.gather(*(run(item) for item in request.items))
+        return Result.ok(
+            BatchEvaluationResponse(
+                results=[
+                    BatchEvaluationItem(ok=True, evaluation=r.value)
+                    if r.is_ok
+                    else BatchEvaluationItem(ok=False, error=r.error.to_dict())  # type: ignore[union-attr]
+                    for r in results
+                ]
+            )
+        )
+
+
+class StreamEvaluateAnswerUseCase:
+    """
+    Use case: evaluate an interview answer, streaming fields as they complete.
+    """
+
+    def __init__(
+        self,
+        ai_service: AsyncAIService,
+        references: Optional[ReferenceAnswers] = None,
+        scorer: Optional[TrivialAnswerScorer] = None,
+    ) -> None:
+        self._ai_service = ai_service
+        self._references = references
+        self._scorer = scorer
+
+    async def execute(
+        self, request: EvaluationRequest
+    ) -> AsyncIterator[EvaluationStreamEvent]:
+        """
+        Evaluate an interview answer incrementally.
+
+        Args:
+            request: Contains question and answer
+
+        Yields:
+            `field`/`delta` events while the model generates, then a single
+            `done` event with the full evaluation, or an `error` event
+        """
+        try:
+            reference = await _find_reference(self._references, request.question)
+            local = _score_locally(self._scorer, request, reference)
+            if local is not None:
+                response = _evaluation_response(local)
+                for name, value in response.model_dump().items():
+                    yield EvaluationStreamEvent(
+                        event="field", data={"name": name, "value": value}
+                    )
+                yield EvaluationStreamEvent(event="done", data=response.model_dump())
+                return
+            with bypassing_cache(request.no_cache):
+                async for item in self._ai_service.stream_evaluate_answer(
+                    question=request.question,
+                    answer=request.answer,
+                    reference=reference,
+                ):
+                    if isinstance(item, EvaluationUpdate):
+                        if item.partial:
+                            yield EvaluationStreamEvent(
+                                event="delta",
+                                data={"name": item.field, "text": item.value},
+                            )
+                        else:
+                            yield EvaluationStreamEvent(
+                                event="field",
+                                data={"name": item.field, "value": item.value},
+                            )
+                    else:
+                        response = _evaluation_response(item)
+                        yield EvaluationStreamEvent(
+                            event="done", data=response.model_dump()
+                        )
+        except Exception as e:
+            error = e if isinstance(e, AppError) else InfrastructureError(
+                "Failed to evaluate answer",
+                details={"error": str(e)},
+            )
+            yield EvaluationStreamEvent(event="error", data=error.to_dict())
+
+
+class SubmitEvaluationJobUseCase:
+    """
+    Use case: queue an interview answer for evaluation in the background.
+    """
+
+    def __init__(self, jobs: EvaluationJobQueue) -> None:
+        self._jobs = jobs
+
+    async def execute(self, request: EvaluationRequest) -> Result[EvaluationJob]:
+        """
+        Submit an evaluation job.
+
+        Args:
+            request: Contains question and answer
+
+        Returns:
+            Result containing the queued job, or an error when the queue is full
+        """
+        try:
+            return Result.ok(await self._jobs.submit(request))
+        except AppError as e:
+            return Result.err(e)
+
+
+class GetEvaluationJobUseCase:
+    """
+    Use case: look up an evaluation job, optionally waiting for it to finish.
+    """
+
+    def __init__(self, jobs: EvaluationJobQueue, *, max_wait: float) -> None:
+        self._jobs = jobs
+        self._max_wait = max_wait
+
+    async def execute(self, job_id: str, wait: float = 0.0) -> Result[EvaluationJob]:
+        """
+        Fetch an evaluation job.
+
+        Args:
+            job_id: ID returned on submission
+            wait: Seconds to long-poll for completion (capped at `max_wait`)
+
+        Returns:
+            Result containing the job, or NotFoundError when it is unknown or
+            its result has expired
+        """
+        job = await self._jobs.get(job_id, wait=min(max(wait, 0.0), self._max_wait))
+        if job is None:
+            return Result.err(
+                NotFoundError("Evaluation job not found", details={"job_id": job_id})
+            )
+        return Result.ok(job)
+
+
+def _evaluation_response(evaluation: InterviewEvaluation) -> EvaluationResponse:
+    # The entity was validated when the model output was decoded; building
+    # the DTO without re-validating skips a second pass over every field.
+    return EvaluationResponse.model_construct(
+        score=evaluation.score,
+        strengths=evaluation.strengths,
+        weaknesses=evaluation.weaknesses,
+        improved_answer=evaluation.improved_answer,
+    )
+
+
+class InterviewSessionUseCase:
+    """
+    Use case: run a multi-question interview as one server-side session.
+
+    The session (questions, answers, evaluations) lives in a SessionStore, so
+    a client sends each answer once and can reconnect without resending
+    context. Answers to different questions may be evaluated concurrently.
+    """
+
+    def __init__(
+        self,
+        ai_service: AsyncAIService,
+        store: SessionStore,
+        references: Optional[ReferenceAnswers] = None,
+        scorer: Optional[TrivialAnswerScorer] = None,
+    ) -> None:
+        self._questions = AsyncGenerateQuestionsUseCase(ai_service, references)
+        self._evaluate = StreamEvaluateAnswerUseCase(ai_service, references, scorer)
+        self._store = store
+
+    @staticmethod
+    def state(session: InterviewSession) -> SessionEvent:
+        """The `session` event describing a session's current state."""
+        return SessionEvent(
+            event="session",
+            data={
+                "session_id": session.session_id,
+                "role": session.role,
+                "experience": session.experience,
+                "questions": session.questions,
+                "answered": sorted(session.answers),
+                "evaluations": {
+                    index: _evaluation_response(evaluation).model_dump()
+                    for index, evaluation in sorted(session.evaluations.items())
+                },
+            },
+        )
+
+    async def start(self, role: str, experience: str) -> Result[InterviewSession]:
+        """
+        Generate questions and open a new session for them.
+
+        Returns:
+            Result containing the session, or the question-generation error
+        """
+        result = await self._questions.execute(
+            QuestionRequest(role=role, experience=experience)
+        )
+        if result.is_err:
+            return Result.err(result.error)  # type: ignore[arg-type]
+        session = InterviewSession(
+            session_id=uuid.uuid4().hex,
+            role=role,
+            experience=experience,
+            questions=result.value.questions,  # type: ignore[union-attr]
+        )
+        self._store.save(session)
+        return Result.ok(session)
+
+    def resume(self, session_id: str) -> Result[InterviewSession]:
+        """
+        Look up a live session.
+
+        Returns:
+            Result containing the session, or NotFoundError once it expired
+        """
+        session = self._store.get(session_id)
+        if session is None:
+            return Result.err(
+                NotFoundError(
+                    "Interview session not found or expired",
+                    details={"session_id": session_id},
+                )
+            )
+        return Result.ok(session)
+
+    async def answer(
+        self, session_id: str, index: int, answer: str, *, no_cache: bool = False
+    ) -> AsyncIterator[SessionEvent]:
+        """
+        Record an answer and evaluate it.
+
+        Yields:
+            The evaluation stream events (`field`, `delta`, `done`, `error`),
+            each with the question `index` in its data
+        """
+        result = self.resume(session_id)
+        session = result.value
+        try:
+            if session is None:
+                raise result.error  # type: ignore[misc]
+            question = session.question(index)
+        except (AppError, ValueError) as e:
+            error = e if isinstance(e, AppError) else ValidationError(str(e))
+            yield SessionEvent(event="error", data={"index": index, **error.to_dict()})
+            return
+
+        session.answers[index] = answer
+        request = EvaluationRequest(question=question, answer=answer, no_cache=no_cache)
+        async for item in self._evaluate.execute(request):
+            if item.event == "done":
+                session.evaluations[index] = InterviewEvaluation(**item.data)
+                self._store.save(session)
+                payload = {"evaluation": item.data}
+            else:
+                payload = item.data
+            yield SessionEvent(event=item.event, data={"index": index, **payload})
+
+    def end(self, session_id: str) -> Result[SessionEvent]:
+        """
+        Close a session.
+
+        Returns:
+            Result containing the `summary` event (evaluations and average
+            score), or NotFoundError
+        """
+        result = self.resume(session_id)
+        if result.is_err:
+            return Result.err(result.error)  # type: ignore[arg-type]
+        session: InterviewSession = result.value  # type: ignore[assignment]
+        self._store.delete(session_id)
+        state = self.state(session).data
+        return Result.ok(
+            SessionEvent(
+                event="summary",
+                data={**state, "average_score": session.average_score},
+            )
+        )
@@ -2,8 +2,8 @@
 Domain entities for the Interview domain.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 
 @dataclass
@@ -39,3 +39,63 @@ class InterviewEvaluation:
             raise ValueError("Strengths must be a list")
         if not isinstance(self.weaknesses, list):
             raise ValueError("Weaknesses must be a list")
+
+
+@dataclass
+class ReferenceAnswer:
+    """
+    Model answer to an interview question, with the rubric points a good
+    answer covers. Generated once per question and reused when grading.
+    """
+
+    answer: str
+    rubric: list[str]
+
+    def __post_init__(self) -> None:
+        """Validate domain invariants."""
+        if not self.answer or not self.answer.strip():
+            raise ValueError("Reference answer cannot be empty")
+        if not isinstance(self.rubric, list):
+            raise ValueError("Rubric must be a list")
+
+
+@dataclass
+class EvaluationUpdate:
+    """
+    Incremental piece of an evaluation, produced while the model is generating.
+
+    When `partial` is true, `value` is a further text fragment of a string
+    field; otherwise it is the field's complete value.
+    """
+
+    field: str
+    value: Any
+    partial: bool = False
+
+
+@dataclass
+class InterviewSession:
+    """
+    Domain entity for one multi-question interview: the generated questions
+    and, by question index, the answers given and their evaluations.
+    """
+
+    session_id: str
+    role: str
+    experience: str
+    questions: list[str]
+    answers: dict[int, str] = field(default_factory=dict)
+    evaluations: dict[int, InterviewEvaluation] = field(default_factory=dict)
+
+    def question(self, index: int) -> str:
+        """Return the question at `index`, validating the index."""
+        if not 0 <= index < len(self.questions):
+            raise ValueError(f"No question {index} in this session")
+        return self.questions[index]
+
+    @property
+    def average_score(self) -> Optional[float]:
+        if not self.evaluations:
+            return None
+        scores = [e.score for e in self.evaluations.values()]
+        return round(sum(scores) / len(scores), 2)
@@ -0,0 +1,195 @@
+"""
+Local scoring of degenerate answers.
+
+Empty, "I don't know", one-word, copied-question and keyboard-mash answers
+always get the lowest scores. Recognising them with cheap lexical checks
+gives the same result as the model without the round-trip.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+
+
+_TOKEN = re.compile(r"[^\W_]+(?:['’][^\W_]+)*")
+_VOWELS = set("aeiouy")
+_CONSONANT_RUN = re.compile(r"[bcdfghjklmnpqrstvwxz]{5,}")
+
+_NON_ANSWERS = {
+    "i don't know",
+    "i do not know",
+    "i dont know",
+    "don't know",
+    "dont know",
+    "dunno",
+    "idk",
+    "no idea",
+    "no clue",
+    "not sure",
+    "i'm not sure",
+    "i am not sure",
+    "pass",
+    "skip",
+    "n a",
+    "na",
+    "none",
+    "nothing",
+    "no answer",
+    "i have no idea",
+}
+
+# Words too common to say anything about topic overlap.
+_STOPWORDS = set(
+    """
+    a an and are as at be but by can do does for from has have how i if in is
+    it its of on or so that the their then there these this to use used using
+    was we what when where which while who why will with would you your
+    """.split()
+)
+
+# Terse answers say too little to judge their topic.
+_MIN_TOPIC_WORDS = 3
+
+_IMPROVE_HINT = (
+    "Answer the question directly: state the key idea, explain how it works, "
+    "and back it up with a concrete example from your experience."
+)
+
+# Score and weakness for each kind of degenerate answer.
+_VERDICTS: dict[str, tuple[int, str]] = {
+    "empty": (1, "No answer was given."),
+    "no_answer": (1, "The answer does not attempt the question."),
+    "too_short": (2, "The answer is too brief to show any understanding."),
+    "gibberish": (1, "The answer is not intelligible."),
+    "copied_question": (1, "The answer only restates the question."),
+    "off_topic": (2, "The answer does not address the question."),
+}
+
+
+@dataclass(frozen=True)
+class TriageThresholds:
+    """
+    Limits for treating an answer as degenerate.
+
+    - `min_words`: answers with fewer words are too short to assess.
+    - `copy_threshold`: share of the answer's words taken from the question
+      above which the answer just restates it.
+    - `gibberish_threshold`: share of word-like tokens below which the
+      answer is gibberish.
+    - `off_topic_max_overlap`: with a reference answer, share of the
+      answer's content words found in the question or reference at or below
+      which the answer is off topic.
+    """
+
+    min_words: int = 2
+    copy_threshold: float = 0.9
+    gibberish_threshold: float = 0.5
+    off_topic_max_overlap: float = 0.0
+
+
+@dataclass(frozen=True)
+class Triage:
+    """A locally produced evaluation and the check that produced it."""
+
+    reason: str
+    evaluation: InterviewEvaluation
+
+
+def _tokens(text: str, *, casefold: bool = True) -> list[str]:
+    text = unicodedata.normalize("NFKC", text)
+    return _TOKEN.findall(text.casefold() if casefold else text)
+
+
+def _content_words(tokens: list[str]) -> set[str]:
+    return {t for t in tokens if t not in _STOPWORDS and not t.isdigit()}
+
+
+def _is_latin(token: str) -> bool:
+    return all(
+        not c.isalpha() or unicodedata.name(c, "").startswith("LATIN") for c in token
+    )
+
+
+def _word_like(token: str) -> bool:
+    """
+    Whether a token (in its original case) could be a word. Only lowercase
+    Latin-script words are checked; other scripts, acronyms and mixed-case
+    or alphanumeric names (TCP, gRPC, HTTP2) always pass.
+    """
+    if not _is_latin(token) or any(c.isdigit() for c in token):
+        return True
+    if not token[1:].islower():
+        return True
+    # Strip accents so that "é" counts as a vowel.
+    base = unicodedata.normalize("NFD", token.casefold())
+    base = base.encode("ascii", "ignore").decode()
+    return (
+        len(base) <= 20
+        and any(c in _VOWELS for c in base)
+        and not _CONSONANT_RUN.search(base)
+    )
+
+
+class TrivialAnswerScorer:
+    """
+    Scores clearly degenerate answers locally; anything else returns None
+    and goes to the model.
+    """
+
+    def __init__(self, thresholds: Optional[TriageThresholds] = None) -> None:
+        self.thresholds = thresholds or TriageThresholds()
+
+    def triage(
+        self,
+        question: str,
+        answer: str,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> Optional[Triage]:
+        reason = self._classify(question, answer, reference)
+        if reason is None:
+            return None
+        score, weakness = _VERDICTS[reason]
+        return Triage(
+            reason=reason,
+            evaluation=InterviewEvaluation(
+                score=score,
+                strengths=[],
+                weaknesses=[weakness],
+                improved_answer=(
+                    reference.answer if reference is not None else _IMPROVE_HINT
+                ),
+            ),
+        )
+
+    def _classify(
+        self, question: str, answer: str, reference: Optional[ReferenceAnswer]
+    ) -> Optional[str]:
+        t = self.thresholds
+        tokens = _tokens(answer)
+        if not tokens:
+            return "empty"
+        if " ".join(tokens) in _NON_ANSWERS:
+            return "no_answer"
+        if len(tokens) < t.min_words:
+            return "too_short"
+        raw = _tokens(answer, casefold=False)
+        if sum(map(_word_like, raw)) / len(raw) < t.gibberish_threshold:
+            return "gibberish"
+
+        question_words = set(_tokens(question))
+        if sum(tok in question_words for tok in tokens) / len(tokens) >= t.copy_threshold:
+            return "copied_question"
+
+        if reference is not None:
+            content = _content_words(tokens)
+            if len(content) >= _MIN_TOPIC_WORDS:
+                topic = _content_words(
+                    _tokens(" ".join([question, reference.answer, *reference.rubric]))
+                )
+                if len(content & topic) / len(content) <= t.off_topic_max_overlap:
+                    return "off_topic"
+        return None
+
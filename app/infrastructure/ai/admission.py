@@ -0,0 +1,200 @@
+"""
+Admission control for upstream AI calls.
+
+Past the point where the model is saturated, queueing more work only makes
+every request slower. A fixed number of calls may run at once and a bounded
+number may wait, each for at most `max_queue_time`; anything beyond that is
+rejected immediately with OverloadedError (503 + Retry-After) so clients can
+back off or go to another instance. Background work only ever takes a free
+slot; it never queues ahead of a waiting request.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from app.application.interview.interfaces import (
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+from app.shared.context import background_work
+from app.shared.errors import OverloadedError
+from app.shared.metrics import REGISTRY, timed
+
+
+T = TypeVar("T")
+
+_REJECTED = REGISTRY.counter(
+    "ai_admission_rejected_total", "AI calls shed by admission control.", ("reason",)
+)
+
+# Weight of the newest sample in the average slot hold time.
+_EWMA_ALPHA = 0.2
+
+
+class AdmissionController:
+    """
+    Concurrency limit with a bounded FIFO wait queue.
+
+    A released slot is handed directly to the oldest waiter, so waiters are
+    served in order and cannot be overtaken by new arrivals.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 32,
+        max_queue: int = 64,
+        max_queue_time: float = 10.0,
+    ) -> None:
+        self.limit = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self._max_queue_time = max_queue_time
+        self.in_flight = 0
+        self._waiters: "deque[asyncio.Future[None]]" = deque()
+        self.admitted = 0
+        self.rejected = 0
+        # Average time a call holds a slot, for Retry-After estimates.
+        self._hold_time: Optional[float] = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> float:
+        """Rough seconds until a slot frees up for a new arrival."""
+        hold = self._hold_time if self._hold_time is not None else self._max_queue_time
+        return max(1.0, math.ceil(hold * (self.queued + 1) / self.limit))
+
+    def _reject(self, reason: str) -> OverloadedError:
+        self.rejected += 1
+        _REJECTED.inc(reason=reason)
+        return OverloadedError(
+            "Server is busy, try again later",
+            retry_after=self.retry_after(),
+            details={"reason": reason},
+        )
+
+    async def acquire(self) -> None:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+        if background_work.get():
+            raise self._reject("background")
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject("queue_full")
+
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self._max_queue_time)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            raise self._reject("queue_timeout") from None
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._discard(waiter)
+            raise
+        self.admitted += 1
+
+    def _discard(self, waiter: "asyncio.Future[None]") -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, held: Optional[float] = None) -> None:
+        if held is not None:
+            self._hold_time = (
+                held
+                if self._hold_time is None
+                else self._hold_time + _EWMA_ALPHA * (held - self._hold_time)
+            )
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # the slot passes to this waiter
+                return
+        self.in_flight -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "limit": self.limit,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class AdmissionControlledAIService(AsyncAIService):
+    """
+    AsyncAIService decorator that runs each call under an AdmissionController.
+
+    Sits below the caches and single-flight coalescing, so cache hits and
+    coalesced followers never take a slot.
+    """
+
+    def __init__(self, inner: AsyncAIService, controller: AdmissionController) -> None:
+        self._inner = inner
+        self.controller = controller
+
+    async def _admit(self, operation: str, call: Callable[[], Awaitable[T]]) -> T:
+        with timed(operation, "admission"):
+            await self.controller.acquire()
+        started = time.monotonic()
+        try:
+            return await call()
+        finally:
+            self.controller.release(time.monotonic() - started)
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        return await self._admit(
+            "questions", lambda: self._inner.generate_questions(role, experience)
+        )
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        return await self._admit(
+            "evaluation",
+            lambda: self._inner.evaluate_answer(question, answer, reference=reference),
+        )
+
+    async def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        with timed("evaluation", "admission"):
+            await self.controller.acquire()
+        started = time.monotonic()
+        try:
+            async for item in self._inner.stream_evaluate_answer(
+                question, answer, reference=reference
+            ):
+                yield item
+        finally:
+            self.controller.release(time.monotonic() - started)
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        return await self._admit(
+            "reference", lambda: self._inner.generate_reference(question)
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,172 @@
+"""
+Caching decorators for the AI service ports.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+
+from app.application.interview.interfaces import (
+    AIService,
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import (
+    EvaluationUpdate,
+    InterviewEvaluation,
+    ReferenceAnswer,
+)
+from app.infrastructure.ai.evaluation_cache import EvaluationCache
+from app.infrastructure.ai.question_cache import QuestionCache
+from app.shared.context import cache_bypass
+
+
+T = TypeVar("T")
+
+
+class CachedAIService(AIService):
+    """
+    AIService decorator that serves repeated calls from the response caches.
+
+    Either cache may be omitted to disable caching for that operation.
+    """
+
+    def __init__(
+        self,
+        inner: AIService,
+        *,
+        question_cache: Optional[QuestionCache] = None,
+        evaluation_cache: Optional[EvaluationCache] = None,
+    ) -> None:
+        self._inner = inner
+        self.question_cache = question_cache
+        self.evaluation_cache = evaluation_cache
+
+    def generate_questions(self, role: str, experience: str) -> list[str]:
+        if self.question_cache is None:
+            return self._inner.generate_questions(role, experience)
+        questions = None
+        if not cache_bypass.get():
+            questions = self.question_cache.get(role, experience)
+        if questions is None:
+            questions = self._inner.generate_questions(role, experience)
+            self.question_cache.put(role, experience, questions)
+        return questions
+
+    def evaluate_answer(self, question: str, answer: str) -> InterviewEvaluation:
+        if self.evaluation_cache is None:
+            return self._inner.evaluate_answer(question, answer)
+        evaluation = None
+        if not cache_bypass.get():
+            evaluation = self.evaluation_cache.get(question, answer)
+        if evaluation is None:
+            evaluation = self._inner.evaluate_answer(question, answer)
+            self.evaluation_cache.put(question, answer, evaluation)
+        return evaluation
+
+    def close(self) -> None:
+        self._inner.close()  # type: ignore[attr-defined]
+        for cache in (self.question_cache, self.evaluation_cache):
+            if cache is not None:
+                cache.close()
+
+
+class AsyncCachedAIService(AsyncAIService):
+    """
+    AsyncAIService decorator that serves repeated calls from the response caches.
+
+    Either cache may be omitted to disable caching for that operation.
+    """
+
+    def __init__(
+        self,
+        inner: AsyncAIService,
+        *,
+        question_cache: Optional[QuestionCache] = None,
+        evaluation_cache: Optional[EvaluationCache] = None,
+    ) -> None:
+        self._inner = inner
+        self.question_cache = question_cache
+        self.evaluation_cache = evaluation_cache
+
+    @staticmethod
+    async def _io(cache: Any, call: Callable[..., T], *args: Any) -> T:
+        """Run a cache operation, off the event loop if it can block."""
+        if cache.blocking:
+            return await asyncio.to_thread(call, *args)
+        return call(*args)
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        if self.question_cache is None:
+            return await self._inner.generate_questions(role, experience)
+        questions = None
+        if not cache_bypass.get():
+            questions = await self._io(
+                self.question_cache, self.question_cache.get, role, experience
+            )
+        if questions is None:
+            questions = await self._inner.generate_questions(role, experience)
+            await self._io(
+                self.question_cache, self.question_cache.put, role, experience, questions
+            )
+        return questions
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        if self.evaluation_cache is None:
+            return await self._inner.evaluate_answer(
+                question, answer, reference=reference
+            )
+        evaluation = None
+        if not cache_bypass.get():
+            evaluation = await self._io(
+                self.evaluation_cache, self.evaluation_cache.get, question, answer
+            )
+        if evaluation is None:
+            evaluation = await self._inner.evaluate_answer(
+                question, answer, reference=reference
+            )
+            await self._io(
+                self.evaluation_cache,
+                self.evaluation_cache.put,
+                question,
+                answer,
+                evaluation,
+            )
+        return evaluation
+
+    async def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        cache = self.evaluation_cache
+        if cache is not None and not cache_bypass.get():
+            evaluation = await self._io(cache, cache.get, question, answer)
+            if evaluation is not None:
+                for name in ("score", "strengths", "weaknesses", "improved_answer"):
+                    yield EvaluationUpdate(field=name, value=getattr(evaluation, name))
+                yield evaluation
+                return
+
+        async for item in self._inner.stream_evaluate_answer(
+            question, answer, reference=reference
+        ):
+            if cache is not None and isinstance(item, InterviewEvaluation):
+                await self._io(cache, cache.put, question, answer, item)
+            yield item
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        return await self._inner.generate_reference(question)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()  # type: ignore[attr-defined]
+        for cache in (self.question_cache, self.evaluation_cache):
+            if cache is not None:
+                await self._io(cache, cache.close)
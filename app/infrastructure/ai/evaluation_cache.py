@@ -0,0 +1,98 @@
+"""
+Content-addressed cache for answer evaluations.
+
+Retries, double-submits and canonical answers produce byte-identical
+(question, answer) pairs. Evaluations are cached under a hash of the
+normalized pair together with the model name and prompt version, so a prompt
+or model change never serves stale results.
+"""
+
+import hashlib
+import re
+import unicodedata
+import zlib
+from typing import Optional
+
+from app.domain.interview.entities import InterviewEvaluation
+from app.infrastructure.cache.backends import CacheBackend, MemoryCacheBackend
+from app.infrastructure.cache.codec import decode_evaluation, encode_evaluation
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Unicode-normalize, casefold and collapse whitespace."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def evaluation_key(
+    question: str, answer: str, *, model: str, prompt_version: str
+) -> str:
+    """Return the content hash identifying one evaluation."""
+    digest = hashlib.sha256()
+    for part in (model, prompt_version, normalize_text(question), normalize_text(answer)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class EvaluationCache:
+    """
+    Cache of validated evaluations with a TTL, stored in a CacheBackend
+    (a process-local LRU unless one is given).
+    """
+
+    def __init__(
+        self,
+        *,
+        model: str,
+        prompt_version: str,
+        max_entries: int = 4096,
+        ttl_seconds: float = 24 * 3600,
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
+        self.backend = backend or MemoryCacheBackend(max_entries=max_entries)
+        self._model = model
+        self._prompt_version = prompt_version
+        self._ttl = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def blocking(self) -> bool:
+        """Whether lookups can block on I/O (and should run off the event loop)."""
+        return self.backend.blocking
+
+    def key(self, question: str, answer: str) -> str:
+        return evaluation_key(
+            question, answer, model=self._model, prompt_version=self._prompt_version
+        )
+
+    def get(self, question: str, answer: str) -> Optional[InterviewEvaluation]:
+        data = self.backend.get("eval:" + self.key(question, answer))
+        evaluation = None
+        if data is not None:
+            try:
+                evaluation = decode_evaluation(data)
+            except (ValueError, TypeError, zlib.error):
+                evaluation = None
+        if evaluation is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return evaluation
+
+    def put(self, question: str, answer: str, evaluation: InterviewEvaluation) -> None:
+        self.backend.set(
+            "eval:" + self.key(question, answer),
+            encode_evaluation(evaluation),
+            self._ttl,
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {**self.backend.stats(), "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        self.backend.close()
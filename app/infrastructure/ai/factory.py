@@ -0,0 +1,509 @@
+"""
+Composition of the process-wide AI service.
+
+The application lifespan calls into this module once at startup; request
+handlers receive the result through FastAPI dependencies.
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.application.interview.interfaces import AIService, AsyncAIService
+from app.domain.interview.scoring import TriageThresholds, TrivialAnswerScorer
+from app.infrastructure.ai.admission import (
+    AdmissionControlledAIService,
+    AdmissionController,
+)
+from app.infrastructure.ai.cached_service import AsyncCachedAIService, CachedAIService
+from app.infrastructure.ai.evaluation_cache import EvaluationCache
+from app.infrastructure.ai.fake_service import (
+    FAKE_MODEL,
+    AsyncFakeAIService,
+    FakeAIService,
+    FakeBehaviour,
+)
+from app.infrastructure.ai.groq_async_service import AsyncGroqAIService
+from app.infrastructure.ai.groq_service import DEFAULT_MODEL, GroqAIService
+from app.infrastructure.ai.http_client import (
+    ResponseHook,
+    build_async_http_client,
+    build_http_client,
+)
+from app.infrastructure.ai.prompts import EVALUATION, GRADING, QUESTIONS
+from app.infrastructure.ai.question_cache import QuestionCache
+from app.infrastructure.ai.rate_limiter import (
+    BudgetReserve,
+    ModelSchedulers,
+    RateLimitedAIService,
+    RateLimitScheduler,
+)
+from app.infrastructure.ai.resilience import CircuitBreaker, ResilientAIService
+from app.infrastructure.ai.router import (
+    AsyncRoutingAIService,
+    BackendRouter,
+    RoutedBackend,
+    RoutingAIService,
+    parse_model_list,
+)
+from app.infrastructure.ai.single_flight import (
+    AsyncCoalescingAIService,
+    AsyncSingleFlight,
+    CoalescingAIService,
+)
+from app.infrastructure.ai.token_budget import (
+    AsyncTokenBudgetedAIService,
+    TokenBudget,
+    TokenBudgetedAIService,
+)
+from app.infrastructure.cache import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SQLiteCacheBackend,
+)
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.logging.logger import get_logger
+from app.infrastructure.question_bank import QuestionBank, QuestionBankAIService
+from app.shared.metrics import REGISTRY
+
+
+logger = get_logger(__name__)
+
+
+def build_cache_backend(
+    settings: Settings, *, namespace: str, max_entries: int
+) -> CacheBackend:
+    """
+    Storage for one response cache; falls back to process memory when the
+    SQLite file cannot be opened. `namespace` keeps caches sharing a SQLite
+    file from pruning or counting each other's entries.
+    """
+    if settings.cache_backend == "redis":
+        return RedisCacheBackend(
+            settings.cache_redis_url,
+            timeout=settings.cache_redis_timeout,
+            key_prefix=settings.cache_key_prefix,
+        )
+    if settings.cache_backend == "sqlite":
+        try:
+            return SQLiteCacheBackend(
+                settings.cache_sqlite_path,
+                namespace=namespace,
+                max_entries=max_entries,
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(
+                "SQLite cache unavailable, caching in memory",
+                extra={"path": settings.cache_sqlite_path, "error": str(e)},
+            )
+    return MemoryCacheBackend(max_entries=max_entries)
+
+
+def build_question_cache(settings: Settings) -> Optional[QuestionCache]:
+    if not settings.question_cache_enabled:
+        return None
+    return QuestionCache(
+        pool_size=settings.question_cache_pool_size,
+        ttl_seconds=settings.question_cache_ttl_seconds,
+        prompt_version=QUESTIONS.version,
+        backend=build_cache_backend(
+            settings,
+            namespace="questions",
+            max_entries=settings.question_cache_max_keys,
+        ),
+    )
+
+
+def build_evaluation_cache(settings: Settings, model: str) -> Optional[EvaluationCache]:
+    if not settings.evaluation_cache_enabled:
+        return None
+    return EvaluationCache(
+        model=model,
+        # Either template can produce a cached evaluation.
+        prompt_version=f"{EVALUATION.version}+{GRADING.version}",
+        ttl_seconds=settings.evaluation_cache_ttl_seconds,
+        backend=build_cache_backend(
+            settings,
+            namespace="evaluations",
+            max_entries=settings.evaluation_cache_max_entries,
+        ),
+    )
+
+
+def build_answer_scorer(settings: Settings) -> Optional[TrivialAnswerScorer]:
+    if not settings.fast_path_enabled:
+        return None
+    return TrivialAnswerScorer(
+        TriageThresholds(
+            min_words=settings.fast_path_min_words,
+            copy_threshold=settings.fast_path_copy_threshold,
+            gibberish_threshold=settings.fast_path_gibberish_threshold,
+            off_topic_max_overlap=settings.fast_path_off_topic_max_overlap,
+        )
+    )
+
+
+def build_fake_behaviour(settings: Settings) -> FakeBehaviour:
+    return FakeBehaviour(
+        latency_ms=settings.fake_ai_latency_ms,
+        distribution=settings.fake_ai_latency_distribution,
+        spread=settings.fake_ai_latency_spread,
+        error_rate=settings.fake_ai_error_rate,
+        answer_words=settings.fake_ai_answer_words,
+        seed=settings.fake_ai_seed,
+    )
+
+
+def build_question_bank(settings: Settings) -> Optional[QuestionBank]:
+    if not settings.question_bank_enabled:
+        return None
+    try:
+        return QuestionBank(
+            settings.question_bank_path,
+            prompt_version=QUESTIONS.id,
+            dedupe_threshold=settings.question_bank_dedupe_threshold,
+        )
+    except (OSError, sqlite3.Error) as e:
+        # e.g. a read-only filesystem: serve questions without the bank.
+        logger.warning(
+            "Question bank unavailable",
+            extra={"path": settings.question_bank_path, "error": str(e)},
+        )
+        return None
+
+
+def build_token_budget(settings: Settings) -> Optional[TokenBudget]:
+    if not settings.ai_token_budget_enabled:
+        return None
+    return TokenBudget(
+        question_max_tokens=settings.ai_question_max_tokens,
+        answer_max_tokens=settings.ai_answer_max_tokens,
+        prompt_max_tokens=settings.ai_prompt_max_tokens,
+    )
+
+
+def build_router(
+    settings: Settings, services: list[Any], models: list[tuple[str, float]]
+) -> BackendRouter[Any]:
+    return BackendRouter(
+        [
+            RoutedBackend(service, model, weight)
+            for service, (model, weight) in zip(services, models)
+        ],
+        alpha=settings.ai_router_ewma_alpha,
+        error_threshold=settings.ai_router_error_threshold,
+        cooldown=settings.ai_router_cooldown,
+        explore_ratio=settings.ai_router_explore_ratio,
+    )
+
+
+def _models(settings: Settings) -> list[tuple[str, float]]:
+    default = FAKE_MODEL if settings.ai_backend == "fake" else DEFAULT_MODEL
+    return parse_model_list(settings.ai_models) or [(default, 1.0)]
+
+
+def build_backend(settings: Settings) -> AIService:
+    """
+    Blocking backend for `AI_BACKEND`: one model, or a router across
+    the `AI_MODELS` list.
+    """
+    models = _models(settings)
+    services: list[AIService]
+    if settings.ai_backend == "fake":
+        behaviour = build_fake_behaviour(settings)
+        services = [FakeAIService(behaviour, model=model) for model, _ in models]
+    else:
+        http_client = build_http_client(settings)
+        services = [
+            GroqAIService(
+                api_key=settings.groq_api_key,
+                model=model,
+                http_client=http_client,
+                questions_max_tokens=settings.ai_questions_completion_tokens,
+                evaluation_max_tokens=settings.ai_evaluation_completion_tokens,
+                max_regenerations=settings.ai_max_regenerations,
+            )
+            for model, _ in models
+        ]
+    if len(services) == 1:
+        return services[0]
+    return RoutingAIService(build_router(settings, services, models))
+
+
+def build_async_model_services(
+    settings: Settings, *, on_response: Optional[ResponseHook] = None
+) -> list[AsyncAIService]:
+    """
+    Async services for `AI_BACKEND`, one per `AI_MODELS` entry. All Groq
+    models share one connection pool, whose responses go to `on_response`.
+    """
+    models = _models(settings)
+    services: list[AsyncAIService]
+    if settings.ai_backend == "groq" and not settings.groq_api_key:
+        logger.warning("GROQ_API_KEY is not set; AI calls will fail until it is")
+    if settings.ai_backend == "fake":
+        behaviour = build_fake_behaviour(settings)
+        services = [AsyncFakeAIService(behaviour, model=model) for model, _ in models]
+    else:
+        http_client = build_async_http_client(settings, on_response=on_response)
+        services = [
+            AsyncGroqAIService(
+                api_key=settings.groq_api_key,
+                model=model,
+                http_client=http_client,
+                max_retries=settings.ai_sdk_max_retries,
+                questions_max_tokens=settings.ai_questions_completion_tokens,
+                evaluation_max_tokens=settings.ai_evaluation_completion_tokens,
+                max_regenerations=settings.ai_max_regenerations,
+            )
+            for model, _ in models
+        ]
+    return services
+
+
+def build_rate_limit_scheduler(settings: Settings) -> RateLimitScheduler:
+    return RateLimitScheduler(
+        requests_per_minute=settings.ai_requests_per_minute,
+        tokens_per_minute=settings.ai_tokens_per_minute,
+        max_wait_seconds=settings.ai_rate_limit_max_wait,
+    )
+
+
+def build_resilience(settings: Settings, service: AsyncAIService) -> ResilientAIService:
+    return ResilientAIService(
+        service,
+        CircuitBreaker(
+            failure_threshold=settings.ai_circuit_failure_threshold,
+            reset_timeout=settings.ai_circuit_reset_timeout,
+        ),
+        deadline=settings.ai_request_deadline,
+        max_retries=settings.ai_max_retries,
+        backoff_base=settings.ai_retry_backoff_base,
+        hedge=settings.ai_hedge_enabled,
+        hedge_min_samples=settings.ai_hedge_min_samples,
+    )
+
+
+def build_ai_service(settings: Settings) -> AIService:
+    """
+    Build a blocking AIService (for scripts and background jobs).
+    """
+    backend = build_backend(settings)
+    service = backend
+    budget = build_token_budget(settings)
+    if budget is not None:
+        service = TokenBudgetedAIService(service, budget)
+    if settings.ai_coalescing_enabled:
+        service = CoalescingAIService(service)
+    return CachedAIService(
+        service,
+        question_cache=build_question_cache(settings),
+        evaluation_cache=build_evaluation_cache(settings, backend.model),  # type: ignore[attr-defined]
+    )
+
+
+@dataclass
+class AIRuntime:
+    """
+    The process-wide AsyncAIService stack plus the components inside it that
+    health checks and metrics need to inspect.
+    """
+
+    service: AsyncAIService
+    model: str = ""
+    question_cache: Optional[QuestionCache] = None
+    evaluation_cache: Optional[EvaluationCache] = None
+    flight: Optional[AsyncSingleFlight] = None
+    schedulers: Optional[ModelSchedulers] = None
+    # Per model, like the schedulers.
+    resilience: dict[str, ResilientAIService] = field(default_factory=dict)
+    admission: Optional[AdmissionController] = None
+    question_bank: Optional[QuestionBankAIService] = None
+    router: Optional[BackendRouter[AsyncAIService]] = None
+
+    def health(self) -> dict[str, Any]:
+        """Upstream health summary for `/ping`."""
+        health: dict[str, Any] = {}
+        if self.resilience:
+            health["circuit"] = {
+                model: resilience.breaker.snapshot()
+                for model, resilience in self.resilience.items()
+            }
+        if self.schedulers is not None:
+            health["rate_limit"] = self.schedulers.stats()
+        if self.admission is not None:
+            health["admission"] = self.admission.stats()
+        if self.router is not None:
+            health["backends"] = self.router.snapshot()
+        return health
+
+    def collect_metrics(self) -> None:
+        """Refresh cache, queue and circuit gauges (a scrape-time collector)."""
+        caches = {"questions": self.question_cache, "evaluations": self.evaluation_cache}
+        for name, cache in caches.items():
+            if cache is None:
+                continue
+            for stat, value in cache.stats().items():
+                _CACHE.set(value, cache=name, stat=stat)
+        if self.question_bank is not None:
+            for stat, value in self.question_bank.stats().items():
+                _QUESTION_BANK.set(value, stat=stat)
+        if self.flight is not None:
+            for stat, value in self.flight.stats().items():
+                _COALESCING.set(value, stat=stat)
+        if self.schedulers is not None:
+            for model, stats in self.schedulers.stats().items():
+                for stat, value in stats.items():
+                    _RATE_LIMIT.set(value, model=model, stat=stat)
+        if self.admission is not None:
+            for stat, value in self.admission.stats().items():
+                _ADMISSION.set(value, stat=stat)
+        if self.router is not None:
+            for snapshot in self.router.snapshot():
+                model = snapshot.pop("model")
+                for stat, value in snapshot.items():
+                    if value is not None:
+                        _BACKEND.set(value, model=model, stat=stat)
+        for model, resilience in self.resilience.items():
+            state = resilience.breaker.state
+            for candidate in _CIRCUIT_STATES:
+                _CIRCUIT.set(1 if state == candidate else 0, model=model, state=candidate)
+            for stat in ("retries", "hedged", "timeouts"):
+                _RESILIENCE.set(getattr(resilience, stat), model=model, stat=stat)
+            _RESILIENCE.set(resilience.breaker.rejected, model=model, stat="rejected")
+
+    async def aclose(self) -> None:
+        await self.service.aclose()  # type: ignore[attr-defined]
+
+
+_CACHE = REGISTRY.gauge("ai_cache", "Response cache size and hit counts.", ("cache", "stat"))
+_QUESTION_BANK = REGISTRY.gauge(
+    "ai_question_bank", "Question bank size, hits and refills.", ("stat",)
+)
+_COALESCING = REGISTRY.gauge("ai_coalescing", "Single-flight call counts.", ("stat",))
+_RATE_LIMIT = REGISTRY.gauge(
+    "ai_rate_limit", "Upstream rate-limit queue depth and budgets.", ("model", "stat")
+)
+_ADMISSION = REGISTRY.gauge(
+    "ai_admission", "Admission control slots, queue depth and decisions.", ("stat",)
+)
+_BACKEND = REGISTRY.gauge(
+    "ai_backend", "Routed backend EWMA latency, error rate and call counts.", ("model", "stat")
+)
+_CIRCUIT = REGISTRY.gauge(
+    "ai_circuit_state", "Upstream circuit breaker state.", ("model", "state")
+)
+_CIRCUIT_STATES = (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN)
+_RESILIENCE = REGISTRY.gauge(
+    "ai_resilience", "Retries, hedges, timeouts and circuit rejections.", ("model", "stat")
+)
+
+
+def build_ai_runtime(settings: Settings) -> AIRuntime:
+    """
+    Build the AsyncAIService shared by all requests in this process.
+
+    Layers, outermost first: the question bank, caches, single-flight
+    coalescing, admission control, prompt token budgets, the router across
+    `AI_MODELS`, and for each model its rate-limit scheduling, resilience
+    (deadline/retry/hedge/circuit breaker) and the backend selected by
+    `AI_BACKEND` (Groq or the local fake).
+    """
+    models = _models(settings)
+    # The provider meters each model separately, so every model gets its
+    # own scheduler, and one model's limits never throttle another.
+    schedulers = None
+    if settings.ai_rate_limit_enabled:
+        schedulers = ModelSchedulers(
+            {model: build_rate_limit_scheduler(settings) for model, _ in models}
+        )
+
+    backends = build_async_model_services(
+        settings, on_response=schedulers.observe_response if schedulers else None
+    )
+    resilience: dict[str, ResilientAIService] = {}
+    services: list[AsyncAIService] = []
+    for (model, _), service in zip(models, backends):
+        # Below the rate limiter, so the deadline and circuit breaker measure
+        # only upstream calls, never time spent queued for local budget.
+        if settings.ai_resilience_enabled:
+            service = resilience[model] = build_resilience(settings, service)
+        if schedulers is not None:
+            service = RateLimitedAIService(
+                service,
+                schedulers[model],
+                max_retries=settings.ai_rate_limit_max_retries,
+                backoff_base=settings.ai_rate_limit_backoff_base,
+                questions_completion_tokens=settings.ai_questions_completion_tokens,
+                evaluation_completion_tokens=settings.ai_evaluation_completion_tokens,
+            )
+        services.append(service)
+
+    router = None
+    if len(services) == 1:
+        service = services[0]
+    else:
+        router = build_router(settings, services, models)
+        service = AsyncRoutingAIService(router)
+    model = "+".join(name for name, _ in models)
+
+    # Above the rate limiter, so it reserves tokens for the compacted prompt.
+    budget = build_token_budget(settings)
+    if budget is not None:
+        service = AsyncTokenBudgetedAIService(service, budget)
+
+    # Below coalescing and the caches: only real upstream work takes a slot.
+    admission = None
+    if settings.ai_admission_enabled:
+        admission = AdmissionController(
+            max_concurrency=settings.ai_max_concurrency,
+            max_queue=settings.ai_admission_max_queue,
+            max_queue_time=settings.ai_admission_max_queue_time,
+        )
+        service = AdmissionControlledAIService(service, admission)
+
+    flight = None
+    if settings.ai_coalescing_enabled:
+        coalescing = AsyncCoalescingAIService(service)
+        service, flight = coalescing, coalescing.flight
+
+    question_cache = build_question_cache(settings)
+    evaluation_cache = build_evaluation_cache(settings, model)
+    service = AsyncCachedAIService(
+        service,
+        question_cache=question_cache,
+        evaluation_cache=evaluation_cache,
+    )
+
+    question_bank = None
+    bank = build_question_bank(settings)
+    if bank is not None:
+        reserve = None
+        if schedulers is not None:
+            reserve = BudgetReserve(
+                schedulers,
+                tokens=settings.question_bank_reserve_tokens,
+                requests=settings.question_bank_reserve_requests,
+            )
+        service = question_bank = QuestionBankAIService(
+            service,
+            bank,
+            target_size=settings.question_bank_target_size,
+            refill=settings.question_bank_refill_enabled,
+            reserve=reserve,
+            completion_tokens=settings.ai_questions_completion_tokens,
+        )
+
+    return AIRuntime(
+        service=service,
+        model=model,
+        question_cache=question_cache,
+        evaluation_cache=evaluation_cache,
+        flight=flight,
+        schedulers=schedulers,
+        resilience=resilience,
+        admission=admission,
+        question_bank=question_bank,
+        router=router,
+    )
@@ -0,0 +1,233 @@
+"""
+Deterministic local stand-in for the upstream LLM.
+
+Used for load testing and offline development: responses are schema-valid,
+derived from a hash of the input (so the same input always gives the same
+output), and latency, error rate and response size are configurable. No
+network access or API key is needed.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Literal, Optional
+
+import httpx
+
+from app.application.interview.interfaces import (
+    AIService,
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import (
+    EvaluationUpdate,
+    InterviewEvaluation,
+    ReferenceAnswer,
+)
+from app.infrastructure.ai.output_parsing import evaluation_from_data, parse_evaluation
+from app.infrastructure.ai.incremental_json import IncrementalObjectParser
+from app.shared.errors import InfrastructureError
+from app.shared.metrics import timed
+
+
+FAKE_MODEL = "fake-llm"
+
+LatencyDistribution = Literal["constant", "uniform", "lognormal"]
+
+_WORDS = (
+    "design system latency cache queue service request trade-off scale "
+    "consistency index thread memory profile deploy monitor test failure "
+    "retry budget contract interface module refactor review metric"
+).split()
+
+
+@dataclass
+class FakeBehaviour:
+    """
+    Tunables for the fake backend.
+
+    Latency is drawn per call: `constant` always waits `latency_ms`;
+    `uniform` draws from latency_ms ± spread_ms; `lognormal` has median
+    `latency_ms` and shape `spread` (a heavy right tail, like real LLMs).
+    """
+
+    latency_ms: float = 300.0
+    distribution: LatencyDistribution = "lognormal"
+    spread: float = 0.5
+    error_rate: float = 0.0
+    answer_words: int = 120
+    stream_chunk_chars: int = 16
+    seed: int = 0
+
+
+class _FakeCore:
+    """Shared response generation for the sync and async fakes."""
+
+    def __init__(self, behaviour: FakeBehaviour, model: str) -> None:
+        self.behaviour = behaviour
+        self.model = model
+        self._random = random.Random(behaviour.seed)
+
+    def latency(self) -> float:
+        b = self.behaviour
+        if b.distribution == "constant":
+            ms = b.latency_ms
+        elif b.distribution == "uniform":
+            ms = self._random.uniform(b.latency_ms - b.spread, b.latency_ms + b.spread)
+        else:
+            ms = b.latency_ms * math.exp(self._random.gauss(0.0, b.spread))
+        return max(0.0, ms) / 1000.0
+
+    def maybe_fail(self, operation: str) -> None:
+        if self._random.random() < self.behaviour.error_rate:
+            raise InfrastructureError(
+                f"Failed to {operation}",
+                details={"error": "fake upstream failure"},
+            ) from httpx.RemoteProtocolError("fake upstream failure")
+
+    @staticmethod
+    def _rng(*parts: str) -> random.Random:
+        digest = hashlib.sha256("\x00".join(parts).encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    def _text(self, rng: random.Random, words: int) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+    def questions(self, role: str, experience: str) -> list[str]:
+        rng = self._rng("questions", role, experience)
+        return [
+            f"As a {role} with {experience} of experience, how would you "
+            f"approach {self._text(rng, 6).rstrip('.').lower()}?"
+            for _ in range(5)
+        ]
+
+    def evaluation_json(self, question: str, answer: str, *, graded: bool = False) -> str:
+        """An evaluation; `graded` ones (against a reference) omit the improved answer."""
+        rng = self._rng("evaluation", question, answer)
+        data = {
+            "score": rng.randint(1, 10),
+            "strengths": [self._text(rng, 8) for _ in range(rng.randint(1, 3))],
+            "weaknesses": [self._text(rng, 8) for _ in range(rng.randint(1, 3))],
+        }
+        if not graded:
+            data["improved_answer"] = self._text(rng, self.behaviour.answer_words)
+        return json.dumps(data)
+
+    def reference(self, question: str) -> ReferenceAnswer:
+        rng = self._rng("reference", question)
+        return ReferenceAnswer(
+            answer=self._text(rng, self.behaviour.answer_words),
+            rubric=[self._text(rng, 6) for _ in range(rng.randint(3, 6))],
+        )
+
+    def chunks(self, text: str) -> list[str]:
+        size = max(1, self.behaviour.stream_chunk_chars)
+        return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class FakeAIService(AIService):
+    """
+    Blocking fake implementation of the AIService port.
+    """
+
+    def __init__(
+        self, behaviour: Optional[FakeBehaviour] = None, *, model: str = FAKE_MODEL
+    ) -> None:
+        self._core = _FakeCore(behaviour or FakeBehaviour(), model)
+
+    @property
+    def model(self) -> str:
+        return self._core.model
+
+    def generate_questions(self, role: str, experience: str) -> list[str]:
+        with timed("questions", "upstream"):
+            time.sleep(self._core.latency())
+        self._core.maybe_fail("generate questions")
+        return self._core.questions(role, experience)
+
+    def evaluate_answer(self, question: str, answer: str) -> InterviewEvaluation:
+        with timed("evaluation", "upstream"):
+            time.sleep(self._core.latency())
+        self._core.maybe_fail("evaluate answer")
+        return parse_evaluation(self._core.evaluation_json(question, answer))
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncFakeAIService(AsyncAIService):
+    """
+    Asynchronous fake implementation of the AsyncAIService port.
+
+    Streaming runs the generated JSON through the same incremental parser as
+    the real backend, spreading the latency across the chunks.
+    """
+
+    def __init__(
+        self, behaviour: Optional[FakeBehaviour] = None, *, model: str = FAKE_MODEL
+    ) -> None:
+        self._core = _FakeCore(behaviour or FakeBehaviour(), model)
+
+    @property
+    def model(self) -> str:
+        return self._core.model
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        with timed("questions", "upstream"):
+            await asyncio.sleep(self._core.latency())
+        self._core.maybe_fail("generate questions")
+        return self._core.questions(role, experience)
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        with timed("evaluation", "upstream"):
+            await asyncio.sleep(self._core.latency())
+        self._core.maybe_fail("evaluate answer")
+        content = self._core.evaluation_json(
+            question, answer, graded=reference is not None
+        )
+        return parse_evaluation(content, reference)
+
+    async def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        content = self._core.evaluation_json(
+            question, answer, graded=reference is not None
+        )
+        chunks = self._core.chunks(content)
+        delay = self._core.latency() / len(chunks)
+        self._core.maybe_fail("evaluate answer")
+
+        parser = IncrementalObjectParser(stream_keys=("improved_answer",))
+        data: dict = {}
+        for chunk in chunks:
+            await asyncio.sleep(delay)
+            for kind, key, value in parser.feed(chunk):
+                if kind == "value":
+                    data[key] = value
+                yield EvaluationUpdate(field=key, value=value, partial=kind == "delta")
+        if reference is not None:
+            yield EvaluationUpdate(field="improved_answer", value=reference.answer)
+        yield evaluation_from_data(data, reference)
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        with timed("reference", "upstream"):
+            await asyncio.sleep(self._core.latency())
+        self._core.maybe_fail("generate reference answer")
+        return self._core.reference(question)
+
+    async def aclose(self) -> None:
+        pass
@@ -0,0 +1,337 @@
+"""
+Asynchronous Groq AI service implementation.
+"""
+
+import json
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Optional, TypeVar
+
+import httpx
+
+from app.application.interview.interfaces import (
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import (
+    EvaluationUpdate,
+    InterviewEvaluation,
+    ReferenceAnswer,
+)
+from app.infrastructure.ai.groq_service import (
+    DEFAULT_MODEL,
+    EVALUATION_MAX_COMPLETION_TOKENS,
+    GRADING_MAX_COMPLETION_TOKENS,
+    MAX_REGENERATIONS,
+    QUESTIONS_MAX_COMPLETION_TOKENS,
+    REFERENCE_MAX_COMPLETION_TOKENS,
+    grading_fields,
+    groq_sdk,
+    rate_limit_error,
+    require_api_key,
+)
+from app.infrastructure.ai.incremental_json import IncrementalObjectParser
+from app.infrastructure.ai.output_parsing import (
+    count_regeneration,
+    evaluation_from_data,
+    parse_evaluation,
+    parse_questions,
+    parse_reference,
+)
+from app.infrastructure.ai.prompts import (
+    EVALUATION,
+    GRADING,
+    QUESTIONS,
+    REFERENCE,
+    PromptTemplate,
+)
+from app.shared.errors import InfrastructureError, MalformedOutputError
+from app.shared.metrics import record_usage, timed
+
+if TYPE_CHECKING:
+    import groq
+
+
+T = TypeVar("T")
+
+
+class AsyncGroqAIService(AsyncAIService):
+    """
+    Groq API implementation of the AsyncAIService port.
+
+    Calls are awaited on the event loop instead of occupying a threadpool
+    worker, so a single process can hold many in-flight evaluations.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        *,
+        model: str = DEFAULT_MODEL,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_retries: int = 2,
+        questions_max_tokens: int = QUESTIONS_MAX_COMPLETION_TOKENS,
+        evaluation_max_tokens: int = EVALUATION_MAX_COMPLETION_TOKENS,
+        max_regenerations: int = MAX_REGENERATIONS,
+    ) -> None:
+        """
+        Configure the async Groq client; it is created on the first call.
+
+        Args:
+            api_key: Groq API key. If not provided, reads from GROQ_API_KEY env var.
+            model: Groq model to call.
+            http_client: Shared pooled async HTTP client. If not provided, the
+                Groq SDK creates its own.
+            max_retries: Retries performed inside the Groq SDK.
+            questions_max_tokens: Completion cap for question generation.
+            evaluation_max_tokens: Completion cap for evaluations.
+            max_regenerations: Further completions requested when the output
+                cannot be repaired.
+        """
+        self._api_key = api_key
+        self._http_client = http_client
+        self._max_retries = max_retries
+        self._sdk_client: Optional["groq.AsyncGroq"] = None
+        self._model = model
+        self._questions_max_tokens = questions_max_tokens
+        self._evaluation_max_tokens = evaluation_max_tokens
+        self._max_regenerations = max(0, max_regenerations)
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    @property
+    def _client(self) -> "groq.AsyncGroq":
+        if self._sdk_client is None:
+            self._sdk_client = groq_sdk().AsyncGroq(
+                api_key=require_api_key(self._api_key),
+                http_client=self._http_client,
+                max_retries=self._max_retries,
+            )
+        return self._sdk_client
+
+    def _evaluation_request(
+        self, question: str, answer: str, reference: Optional[ReferenceAnswer]
+    ) -> tuple[PromptTemplate, list[dict[str, str]], int]:
+        """The template, messages and completion cap for an evaluation."""
+        if reference is not None:
+            return (
+                GRADING,
+                GRADING.messages(**grading_fields(question, answer, reference)),
+                min(self._evaluation_max_tokens, GRADING_MAX_COMPLETION_TOKENS),
+            )
+        return (
+            EVALUATION,
+            EVALUATION.messages(question=question, answer=answer),
+            self._evaluation_max_tokens,
+        )
+
+    async def aclose(self) -> None:
+        """Release pooled upstream connections."""
+        if self._sdk_client is not None:
+            await self._sdk_client.close()
+        elif self._http_client is not None:
+            await self._http_client.aclose()
+
+    async def _complete(
+        self,
+        operation: str,
+        template: PromptTemplate,
+        messages: list[dict[str, str]],
+        *,
+        temperature: float,
+        max_tokens: int,
+        decode: Callable[[Optional[str]], T],
+    ) -> T:
+        """
+        Run a JSON-mode completion and decode it, asking again when the
+        output cannot be repaired.
+        """
+        attempt = 0
+        while True:
+            with timed(operation, "upstream"):
+                response = await self._client.chat.completions.create(
+                    model=self._model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format={"type": "json_object"},
+                )
+            record_usage(self._model, operation, response.usage, prompt=template.id)
+            try:
+                return decode(response.choices[0].message.content)
+            except MalformedOutputError:
+                if attempt >= self._max_regenerations:
+                    raise
+                attempt += 1
+                count_regeneration(operation)
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        """
+        Generate interview questions using Groq API.
+
+        Raises:
+            InfrastructureError: If API call fails
+        """
+        try:
+            with timed("questions", "prompt"):
+                messages = QUESTIONS.messages(role=role, experience=experience)
+            return await self._complete(
+                "questions",
+                QUESTIONS,
+                messages,
+                temperature=0.7,
+                max_tokens=self._questions_max_tokens,
+                decode=parse_questions,
+            )
+
+        except groq_sdk().RateLimitError as e:
+            raise rate_limit_error(e)
+        except MalformedOutputError:
+            raise
+        except Exception as e:
+            raise InfrastructureError(
+                "Failed to generate questions",
+                details={"error": str(e)},
+            )
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        """
+        Evaluate an interview answer using Groq API.
+
+        Raises:
+            InfrastructureError: If API call fails
+        """
+        try:
+            with timed("evaluation", "prompt"):
+                template, messages, max_tokens = self._evaluation_request(
+                    question, answer, reference
+                )
+            return await self._complete(
+                "evaluation",
+                template,
+                messages,
+                temperature=0.7,
+                max_tokens=max_tokens,
+                decode=lambda content: parse_evaluation(content, reference),
+            )
+
+        except groq_sdk().RateLimitError as e:
+            raise rate_limit_error(e)
+        except MalformedOutputError:
+            raise
+        except Exception as e:
+            raise InfrastructureError(
+                "Failed to evaluate answer",
+                details={"error": str(e)},
+            )
+
+    async def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        """
+        Evaluate an interview answer using Groq's streaming mode.
+
+        Completed fields are yielded as soon as the model closes them, and
+        `improved_answer` is additionally yielded fragment by fragment (or,
+        when grading against a reference, whole at the end). Fields already
+        sent cannot be taken back, so a stream is never regenerated.
+
+        Raises:
+            MalformedOutputError: If the output is incomplete or cannot be
+                repaired
+            InfrastructureError: If API call fails
+        """
+        parser = IncrementalObjectParser(stream_keys=("improved_answer",))
+        data: dict = {}
+        try:
+            template, messages, max_tokens = self._evaluation_request(
+                question, answer, reference
+            )
+            # JSON mode is not used here: the provider does not stream it.
+            stream = await self._client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            async for chunk in stream:
+                x_groq = getattr(chunk, "x_groq", None)
+                if x_groq is not None:
+                    # Groq reports usage on the final chunk of a stream.
+                    record_usage(
+                        self._model,
+                        "evaluation",
+                        getattr(x_groq, "usage", None),
+                        prompt=template.id,
+                    )
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                for kind, key, value in parser.feed(chunk.choices[0].delta.content):
+                    if kind == "value":
+                        data[key] = value
+                    yield EvaluationUpdate(
+                        field=key, value=value, partial=kind == "delta"
+                    )
+
+            if not parser.done:
+                raise MalformedOutputError("Incomplete response from AI service")
+            evaluation = evaluation_from_data(data, reference)
+
+        except groq_sdk().RateLimitError as e:
+            raise rate_limit_error(e)
+        except MalformedOutputError:
+            raise
+        except json.JSONDecodeError as e:
+            raise MalformedOutputError(
+                "Invalid JSON response from AI service",
+                details={"operation": "evaluation", "error": str(e)},
+            )
+        except Exception as e:
+            raise InfrastructureError(
+                "Failed to evaluate answer",
+                details={"error": str(e)},
+            )
+
+        if reference is not None:
+            yield EvaluationUpdate(field="improved_answer", value=reference.answer)
+        yield evaluation
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        """
+        Write a reference answer and rubric using Groq API.
+
+        Raises:
+            InfrastructureError: If API call fails
+        """
+        try:
+            with timed("reference", "prompt"):
+                messages = REFERENCE.messages(question=question)
+            return await self._complete(
+                "reference",
+                REFERENCE,
+                messages,
+                temperature=0.3,
+                max_tokens=REFERENCE_MAX_COMPLETION_TOKENS,
+                decode=parse_reference,
+            )
+
+        except groq_sdk().RateLimitError as e:
+            raise rate_limit_error(e)
+        except MalformedOutputError:
+            raise
+        except Exception as e:
+            raise InfrastructureError(
+                "Failed to generate reference answer",
+                details={"error": str(e)},
+            )
@@ -2,15 +2,87 @@
 Groq AI service implementation.
 """
 
-import json
 import os
-from typing import Optional
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
 
-from groq import Groq
+import httpx
 
 from app.application.interview.interfaces import AIService
-from app.domain.interview.entities import InterviewEvaluation
-from app.shared.errors import InfrastructureError
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+from app.infrastructure.ai.output_parsing import (
+    count_regeneration,
+    parse_evaluation,
+    parse_questions,
+)
+from app.infrastructure.ai.prompts import EVALUATION, QUESTIONS, PromptTemplate
+from app.shared.errors import InfrastructureError, MalformedOutputError, RateLimitError
+from app.shared.metrics import record_usage, timed
+
+if TYPE_CHECKING:
+    import groq
+
+
+DEFAULT_MODEL = "llama-3.1-8b-instant"
+
+# Completion caps sized from the response schemas: five short questions, or
+# a score, up to three strengths/weaknesses and one improved answer.
+QUESTIONS_MAX_COMPLETION_TOKENS = 400
+EVALUATION_MAX_COMPLETION_TOKENS = 700
+# A reference answer plus up to six rubric points; grading against a
+# reference skips the improved answer, the bulk of an evaluation.
+REFERENCE_MAX_COMPLETION_TOKENS = 600
+GRADING_MAX_COMPLETION_TOKENS = 300
+
+# Completions whose output cannot be repaired locally are requested again
+# this many times before the call fails.
+MAX_REGENERATIONS = 1
+
+T = TypeVar("T")
+
+
+def grading_fields(
+    question: str, answer: str, reference: ReferenceAnswer
+) -> dict[str, str]:
+    """Fill-ins for the GRADING template."""
+    return {
+        "question": question,
+        "reference": reference.answer,
+        "rubric": "\n".join(f"- {point}" for point in reference.rubric),
+        "answer": answer,
+    }
+
+
+def groq_sdk() -> ModuleType:
+    """
+    The Groq SDK, imported on first use rather than at startup; it is the
+    heaviest import in the app and not needed by the fake backend at all.
+    """
+    import groq
+
+    return groq
+
+
+def require_api_key(api_key: Optional[str]) -> str:
+    """Return the API key, failing the call (not startup) if it is missing."""
+    api_key = api_key or os.getenv("GROQ_API_KEY")
+    if not api_key:
+        raise InfrastructureError("GROQ_API_KEY is not configured")
+    return api_key
+
+
+def rate_limit_error(error: "groq.RateLimitError") -> RateLimitError:
+    """Translate the SDK's 429 error, keeping the provider's retry hint."""
+    retry_after: Optional[float]
+    try:
+        retry_after = float(error.response.headers["retry-after"])
+    except (KeyError, ValueError):
+        retry_after = None
+    return RateLimitError(
+        "AI service rate limit exceeded",
+        retry_after=retry_after,
+        details={"error": str(error)},
+    )
 
 
 class GroqAIService(AIService):
@@ -18,18 +90,91 @@ class GroqAIService(AIService):
     Groq API implementation of the AIService port.
     """
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        *,
+        model: str = DEFAULT_MODEL,
+        http_client: Optional[httpx.Client] = None,
+        max_retries: int = 2,
+        questions_max_tokens: int = QUESTIONS_MAX_COMPLETION_TOKENS,
+        evaluation_max_tokens: int = EVALUATION_MAX_COMPLETION_TOKENS,
+        max_regenerations: int = MAX_REGENERATIONS,
+    ) -> None:
         """
-        Initialize Groq client.
+        Configure the Groq client; it is created on the first call.
 
         Args:
             api_key: Groq API key. If not provided, reads from GROQ_API_KEY env var.
+            model: Groq model to call.
+            http_client: Shared pooled HTTP client. If not provided, the Groq SDK
+                creates its own.
+            questions_max_tokens: Completion cap for question generation.
+            evaluation_max_tokens: Completion cap for evaluations.
+            max_regenerations: Further completions requested when the output
+                cannot be repaired.
+        """
+        self._api_key = api_key
+        self._http_client = http_client
+        self._max_retries = max_retries
+        self._sdk_client: Optional["groq.Groq"] = None
+        self._model = model
+        self._questions_max_tokens = questions_max_tokens
+        self._evaluation_max_tokens = evaluation_max_tokens
+        self._max_regenerations = max(0, max_regenerations)
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    @property
+    def _client(self) -> "groq.Groq":
+        if self._sdk_client is None:
+            self._sdk_client = groq_sdk().Groq(
+                api_key=require_api_key(self._api_key),
+                http_client=self._http_client,
+                max_retries=self._max_retries,
+            )
+        return self._sdk_client
+
+    def close(self) -> None:
+        """Release pooled upstream connections."""
+        if self._sdk_client is not None:
+            self._sdk_client.close()
+        elif self._http_client is not None:
+            self._http_client.close()
+
+    def _complete(
+        self,
+        operation: str,
+        template: PromptTemplate,
+        messages: list[dict[str, str]],
+        *,
+        max_tokens: int,
+        decode: Callable[[Optional[str]], T],
+    ) -> T:
         """
-        api_key = api_key or os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise ValueError("GROQ_API_KEY environment variable is required")
-        self._client = Groq(api_key=api_key)
-        self._model = "llama-3.1-8b-instant"
+        Run a JSON-mode completion and decode it, asking again when the
+        output cannot be repaired.
+        """
+        attempt = 0
+        while True:
+            with timed(operation, "upstream"):
+                response = self._client.chat.completions.create(
+                    model=self._model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=max_tokens,
+                    response_format={"type": "json_object"},
+                )
+            record_usage(self._model, operation, response.usage, prompt=template.id)
+            try:
+                return decode(response.choices[0].message.content)
+            except MalformedOutputError:
+                if attempt >= self._max_regenerations:
+                    raise
+                attempt += 1
+                count_regeneration(operation)
 
     def generate_questions(self, role: str, experience: str) -> list[str]:
         """
@@ -46,36 +191,20 @@ class GroqAIService(AIService):
             InfrastructureError: If API call fails
         """
         try:
-            prompt = f"""
-            Generate 5 realistic technical interview questions 
-            for a {role} with {experience} of experience.
-            Return a JSON object with a key "questions" containing a list of strings.
-            Output ONLY the raw JSON.
-            """
-
-            response = self._client.chat.completions.create(
-                model=self._model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                response_format={"type": "json_object"},
+            with timed("questions", "prompt"):
+                messages = QUESTIONS.messages(role=role, experience=experience)
+            return self._complete(
+                "questions",
+                QUESTIONS,
+                messages,
+                max_tokens=self._questions_max_tokens,
+                decode=parse_questions,
             )
 
-            content = response.choices[0].message.content
-            if not content:
-                raise InfrastructureError("Empty response from AI service")
-
-            data = json.loads(content)
-            questions = data.get("questions", [])
-            if not questions:
-                raise InfrastructureError("No questions returned from AI service")
-
-            return questions
-
-        except json.JSONDecodeError as e:
-            raise InfrastructureError(
-                "Invalid JSON response from AI service",
-                details={"error": str(e)},
-            )
+        except groq_sdk().RateLimitError as e:
+            raise rate_limit_error(e)
+        except MalformedOutputError:
+            raise
         except Exception as e:
             raise InfrastructureError(
                 "Failed to generate questions",
@@ -97,46 +226,20 @@ class GroqAIService(AIService):
             InfrastructureError: If API call fails
         """
         try:
-            prompt = f"""
-            You are an expert technical interviewer.
-            
-            Question: {question}
-            Candidate Answer: {answer}
-
-            Provide a JSON object with the following keys:
-            - "score": integer (1-10)
-            - "strengths": list of strings
-            - "weaknesses": list of strings
-            - "improved_answer": string
-
-            Output ONLY the raw JSON.
-            """
-
-            response = self._client.chat.completions.create(
-                model=self._model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                response_format={"type": "json_object"},
+            with timed("evaluation", "prompt"):
+                messages = EVALUATION.messages(question=question, answer=answer)
+            return self._complete(
+                "evaluation",
+                EVALUATION,
+                messages,
+                max_tokens=self._evaluation_max_tokens,
+                decode=parse_evaluation,
             )
 
-            content = response.choices[0].message.content
-            if not content:
-                raise InfrastructureError("Empty response from AI service")
-
-            data = json.loads(content)
-
-            return InterviewEvaluation(
-                score=data.get("score", 5),
-                strengths=data.get("strengths", []),
-                weaknesses=data.get("weaknesses", []),
-                improved_answer=data.get("improved_answer", ""),
-            )
-
-        except json.JSONDecodeError as e:
-            raise InfrastructureError(
-                "Invalid JSON response from AI service",
-                details={"error": str(e)},
-            )
+        except groq_sdk().RateLimitError as e:
+            raise rate_limit_error(e)
+        except MalformedOutputError:
+            raise
         except Exception as e:
             raise InfrastructureError(
                 "Failed to evaluate answer",
@@ -0,0 +1,74 @@
+"""
+HTTP client construction for upstream AI providers.
+
+Clients built here are meant to be created once per process and shared, so
+that TLS sessions and keep-alive connections are reused across requests.
+"""
+
+from typing import Callable, Optional
+
+import httpx
+
+from app.infrastructure.config.settings import Settings
+
+
+def _limits(settings: Settings) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.ai_max_connections,
+        max_keepalive_connections=settings.ai_max_keepalive_connections,
+        keepalive_expiry=settings.ai_keepalive_expiry,
+    )
+
+
+def _timeout(settings: Settings) -> httpx.Timeout:
+    return httpx.Timeout(
+        connect=settings.ai_connect_timeout,
+        read=settings.ai_read_timeout,
+        write=settings.ai_write_timeout,
+        pool=settings.ai_pool_timeout,
+    )
+
+
+ResponseHook = Callable[[httpx.Response], None]
+
+
+def build_http_client(
+    settings: Settings, *, on_response: Optional[ResponseHook] = None
+) -> httpx.Client:
+    """
+    Build a pooled, keep-alive HTTP client configured from settings.
+
+    `on_response` is called with every upstream response (including ones the
+    SDK retries internally), e.g. to track rate-limit headers.
+    """
+    return httpx.Client(
+        limits=_limits(settings),
+        timeout=_timeout(settings),
+        follow_redirects=True,
+        event_hooks={"response": [on_response]} if on_response else None,
+    )
+
+
+def build_async_http_client(
+    settings: Settings, *, on_response: Optional[ResponseHook] = None
+) -> httpx.AsyncClient:
+    """
+    Build a pooled, keep-alive async HTTP client configured from settings.
+
+    `on_response` is called with every upstream response (including ones the
+    SDK retries internally), e.g. to track rate-limit headers.
+    """
+    hooks = None
+    if on_response is not None:
+        callback = on_response
+
+        async def hook(response: httpx.Response) -> None:
+            callback(response)
+
+        hooks = {"response": [hook]}
+    return httpx.AsyncClient(
+        limits=_limits(settings),
+        timeout=_timeout(settings),
+        follow_redirects=True,
+        event_hooks=hooks,
+    )
@@ -0,0 +1,192 @@
+"""
+Incremental parser for a streamed top-level JSON object.
+
+Model output arrives a few characters at a time. This parser reports each
+top-level member as soon as its value is complete, and can additionally
+report decoded fragments of selected string members while they are still
+being generated (e.g. a long `improved_answer`).
+"""
+
+import json
+from typing import Any, Iterable, Literal, Tuple
+
+from app.infrastructure.ai.output_parsing import drop_trailing_commas
+
+
+Event = Tuple[Literal["value", "delta"], str, Any]
+
+_WHITESPACE = " \t\r\n"
+
+# Parser states
+_START = 0
+_KEY_OR_END = 1
+_KEY = 2
+_COLON = 3
+_VALUE_START = 4
+_VALUE = 5
+_PRIMITIVE = 6
+_AFTER_VALUE = 7
+_DONE = 8
+
+
+class IncrementalObjectParser:
+    """
+    Feed text chunks with `feed()`; each call returns the events completed
+    by that chunk:
+
+    - ("value", key, value): a top-level member is complete.
+    - ("delta", key, text): more decoded text of a streamed string member.
+
+    Text before the opening brace (e.g. a code fence) and after the closing
+    brace is ignored, as are trailing commas.
+    """
+
+    def __init__(self, stream_keys: Iterable[str] = ()) -> None:
+        self._stream_keys = frozenset(stream_keys)
+        self._state = _START
+        self._raw: list[str] = []
+        self._key = ""
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._streaming = False
+        self._pending_escape = ""
+        self._delta: list[str] = []
+
+    @property
+    def done(self) -> bool:
+        """True once the closing brace of the object has been read."""
+        return self._state == _DONE
+
+    def feed(self, text: str) -> list[Event]:
+        events: list[Event] = []
+        for ch in text:
+            self._consume(ch, events)
+        if self._delta:
+            events.append(("delta", self._key, "".join(self._delta)))
+            self._delta.clear()
+        return events
+
+    def _consume(self, ch: str, events: list[Event]) -> None:
+        state = self._state
+
+        if state == _START:
+            if ch == "{":
+                self._state = _KEY_OR_END
+        elif state == _KEY_OR_END:
+            if ch == '"':
+                self._raw = [ch]
+                self._escape = False
+                self._state = _KEY
+            elif ch == "}":
+                self._state = _DONE
+            elif ch not in _WHITESPACE:
+                raise json.JSONDecodeError("Expected object key", ch, 0)
+        elif state == _KEY:
+            self._raw.append(ch)
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._key = json.loads("".join(self._raw))
+                self._state = _COLON
+        elif state == _COLON:
+            if ch == ":":
+                self._state = _VALUE_START
+            elif ch not in _WHITESPACE:
+                raise json.JSONDecodeError("Expected ':'", ch, 0)
+        elif state == _VALUE_START:
+            if ch in _WHITESPACE:
+                return
+            self._raw = [ch]
+            self._escape = False
+            if ch == '"':
+                self._in_string = True
+                self._depth = 0
+                self._streaming = self._key in self._stream_keys
+                self._state = _VALUE
+            elif ch in "{[":
+                self._in_string = False
+                self._depth = 1
+                self._streaming = False
+                self._state = _VALUE
+            else:
+                self._state = _PRIMITIVE
+        elif state == _VALUE:
+            self._consume_value(ch, events)
+        elif state == _PRIMITIVE:
+            if ch in ",}" or ch in _WHITESPACE:
+                self._finish_value(events)
+                self._consume(ch, events)
+            else:
+                self._raw.append(ch)
+        elif state == _AFTER_VALUE:
+            if ch == ",":
+                self._state = _KEY_OR_END
+            elif ch == "}":
+                self._state = _DONE
+            elif ch not in _WHITESPACE:
+                raise json.JSONDecodeError("Expected ',' or '}'", ch, 0)
+
+    def _consume_value(self, ch: str, events: list[Event]) -> None:
+        self._raw.append(ch)
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+                if self._streaming:
+                    self._pending_escape += ch
+                    self._flush_escape()
+            elif self._streaming and self._pending_escape:
+                self._pending_escape += ch
+                self._flush_escape()
+            elif ch == "\\":
+                self._escape = True
+                if self._streaming:
+                    self._pending_escape = ch
+            elif ch == '"':
+                self._in_string = False
+                if self._depth == 0:
+                    self._finish_value(events)
+            elif self._streaming:
+                self._delta.append(ch)
+            return
+
+        if ch == '"':
+            self._in_string = True
+        elif ch in "{[":
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            if self._depth == 0:
+                self._finish_value(events)
+
+    def _flush_escape(self) -> None:
+        """Decode a pending escape sequence once it is complete."""
+        pending = self._pending_escape
+        if pending.startswith("\\u"):
+            if len(pending) < 6 or (len(pending) > 6 and len(pending) < 12):
+                return
+            decoded = json.loads(f'"{pending}"')
+            if len(pending) == 6 and "\ud800" <= decoded <= "\udbff":
+                # High surrogate: wait for the low half before emitting.
+                return
+        elif len(pending) < 2:
+            return
+        else:
+            decoded = json.loads(f'"{pending}"')
+        self._delta.append(decoded)
+        self._pending_escape = ""
+
+    def _finish_value(self, events: list[Event]) -> None:
+        if self._delta:
+            events.append(("delta", self._key, "".join(self._delta)))
+            self._delta.clear()
+        raw = "".join(self._raw)
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            value = json.loads(drop_trailing_commas(raw))
+        events.append(("value", self._key, value))
+        self._streaming = False
+        self._state = _AFTER_VALUE
@@ -0,0 +1,245 @@
+"""
+Decoding of model completions.
+
+Each completion is decoded once and validated field by field straight into
+its domain entity. Common defects are repaired locally rather than failing
+the call: Markdown code fences, prose around the JSON object, trailing
+commas, scores given as strings ("7", "8/10") or outside 1-10, and single
+strings where a list was asked for. Output that still does not fit the
+schema raises MalformedOutputError, which the backend answers by asking
+the model again.
+"""
+
+import json
+import math
+import re
+from typing import Any, Optional
+
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+from app.shared.errors import MalformedOutputError
+from app.shared.metrics import REGISTRY, timed
+
+
+_PARSES = REGISTRY.counter(
+    "ai_output_parse_total",
+    "Decoded model completions, by result (clean, repaired, invalid).",
+    ("operation", "result"),
+)
+_REPAIRS = REGISTRY.counter(
+    "ai_output_repairs_total",
+    "Local repairs applied to model completions, by kind.",
+    ("operation", "repair"),
+)
+_REGENERATIONS = REGISTRY.counter(
+    "ai_output_regenerations_total",
+    "Completions requested again because their output could not be repaired.",
+    ("operation",),
+)
+
+_FENCE = re.compile(r"^\s*```[\w+-]*[ \t]*\n?(.*?)\n?[ \t]*```\s*$", re.DOTALL)
+_SCORE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(?:/\s*10)?\s*$")
+
+MIN_SCORE, MAX_SCORE = 1, 10
+
+
+def _invalid(operation: str, message: str, **details: Any) -> MalformedOutputError:
+    _PARSES.inc(operation=operation, result="invalid")
+    return MalformedOutputError(message, details={"operation": operation, **details})
+
+
+def _parsed(operation: str, repairs: list[str]) -> None:
+    for repair in repairs:
+        _REPAIRS.inc(operation=operation, repair=repair)
+    _PARSES.inc(operation=operation, result="repaired" if repairs else "clean")
+
+
+def drop_trailing_commas(text: str) -> str:
+    """Remove commas directly before `}` or `]`, leaving string contents alone."""
+    out: list[str] = []
+    in_string = escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == ",":
+            rest = text[i + 1:].lstrip()
+            if rest[:1] in ("}", "]"):
+                continue
+        out.append(ch)
+    return "".join(out)
+
+
+def repair_json(content: str) -> tuple[str, list[str]]:
+    """Apply the local repairs to a completion; returns the text and what was fixed."""
+    repairs: list[str] = []
+    text = content.strip()
+    fenced = _FENCE.match(text)
+    if fenced:
+        text = fenced.group(1).strip()
+        repairs.append("code_fence")
+    start, end = text.find("{"), text.rfind("}")
+    if start > 0 or (start == 0 and end != len(text) - 1):
+        if end > start:
+            text = text[start:end + 1]
+            repairs.append("surrounding_text")
+    without_commas = drop_trailing_commas(text)
+    if without_commas != text:
+        text = without_commas
+        repairs.append("trailing_comma")
+    return text, repairs
+
+
+def count_regeneration(operation: str) -> None:
+    _REGENERATIONS.inc(operation=operation)
+
+
+def _load_object(content: Optional[str], operation: str) -> tuple[dict[str, Any], list[str]]:
+    if not content or not content.strip():
+        raise _invalid(operation, "Empty response from AI service")
+    with timed(operation, "decode"):
+        try:
+            data, repairs = json.loads(content), []
+        except json.JSONDecodeError as e:
+            text, repairs = repair_json(content)
+            try:
+                data = json.loads(text)
+            except json.JSONDecodeError:
+                raise _invalid(
+                    operation, "Invalid JSON response from AI service", error=str(e)
+                )
+    if not isinstance(data, dict):
+        raise _invalid(operation, "AI service did not return a JSON object")
+    return data, repairs
+
+
+def _score(value: Any, operation: str, repairs: list[str]) -> int:
+    if value is None:
+        raise _invalid(operation, "AI service returned no score")
+    if isinstance(value, str):
+        match = _SCORE.match(value)
+        if match is None:
+            raise _invalid(operation, "AI service returned an invalid score", score=value)
+        value = float(match.group(1))
+        repairs.append("score_string")
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, (int, float))
+        or not math.isfinite(value)
+    ):
+        raise _invalid(operation, "AI service returned an invalid score", score=repr(value))
+    score = round(value)
+    if not MIN_SCORE <= score <= MAX_SCORE:
+        score = min(MAX_SCORE, max(MIN_SCORE, score))
+        repairs.append("score_clamped")
+    return score
+
+
+def _strings(value: Any, name: str, operation: str, repairs: list[str]) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = [value]
+        repairs.append("list_coerced")
+    if not isinstance(value, list):
+        raise _invalid(operation, f"AI service returned an invalid {name} list")
+    items = []
+    for item in value:
+        if isinstance(item, (dict, list)):
+            raise _invalid(operation, f"AI service returned an invalid {name} list")
+        if isinstance(item, str):
+            text = item.strip()
+        else:
+            text = str(item)
+            repairs.append("list_coerced")
+        if text:
+            items.append(text)
+    return items
+
+
+def evaluation_from_data(
+    data: dict[str, Any],
+    reference: Optional[ReferenceAnswer] = None,
+    *,
+    repairs: Optional[list[str]] = None,
+) -> InterviewEvaluation:
+    """
+    Validate decoded evaluation fields into a domain entity; a graded answer
+    takes its improved answer from the reference.
+
+    Raises:
+        MalformedOutputError: If the score is missing or unusable, or a field
+            has the wrong shape
+    """
+    repairs = repairs if repairs is not None else []
+    with timed("evaluation", "validate"):
+        score = _score(data.get("score"), "evaluation", repairs)
+        strengths = _strings(data.get("strengths"), "strengths", "evaluation", repairs)
+        weaknesses = _strings(data.get("weaknesses"), "weaknesses", "evaluation", repairs)
+        if reference is not None:
+            improved_answer = reference.answer
+        else:
+            improved = data.get("improved_answer")
+            if improved is not None and not isinstance(improved, str):
+                raise _invalid("evaluation", "AI service returned an invalid improved answer")
+            improved_answer = (improved or "").strip()
+        evaluation = InterviewEvaluation(
+            score=score,
+            strengths=strengths,
+            weaknesses=weaknesses,
+            improved_answer=improved_answer,
+        )
+    _parsed("evaluation", repairs)
+    return evaluation
+
+
+def parse_evaluation(
+    content: Optional[str], reference: Optional[ReferenceAnswer] = None
+) -> InterviewEvaluation:
+    """
+    Decode an evaluation completion into a domain entity.
+
+    Raises:
+        MalformedOutputError: If the completion cannot be repaired into an
+            evaluation
+    """
+    data, repairs = _load_object(content, "evaluation")
+    return evaluation_from_data(data, reference, repairs=repairs)
+
+
+def parse_questions(content: Optional[str]) -> list[str]:
+    """
+    Decode a question-generation completion.
+
+    Raises:
+        MalformedOutputError: If the completion cannot be repaired into a
+            non-empty list of questions
+    """
+    data, repairs = _load_object(content, "questions")
+    questions = _strings(data.get("questions"), "questions", "questions", repairs)
+    if not questions:
+        raise _invalid("questions", "No questions returned from AI service")
+    _parsed("questions", repairs)
+    return questions
+
+
+def parse_reference(content: Optional[str]) -> ReferenceAnswer:
+    """
+    Decode a reference-answer completion.
+
+    Raises:
+        MalformedOutputError: If the completion cannot be repaired into a
+            reference answer
+    """
+    data, repairs = _load_object(content, "reference")
+    answer = data.get("answer")
+    if not isinstance(answer, str) or not answer.strip():
+        raise _invalid("reference", "No reference answer returned from AI service")
+    rubric = _strings(data.get("rubric"), "rubric", "reference", repairs)
+    _parsed("reference", repairs)
+    return ReferenceAnswer(answer=answer.strip(), rubric=rubric)
@@ -0,0 +1,183 @@
+"""
+Versioned prompt templates.
+
+Every prompt is a static system message followed by a user message that
+holds only the call's variable fields, so all calls of one kind share a
+byte-identical prefix the provider can cache. Templates are compiled once
+at import: text is dedented, the variable fields are checked, and each
+gets a version made of its declared version plus a hash of its text. That
+version goes into cache keys and metric labels, so editing a prompt never
+serves results produced by the old wording.
+"""
+
+import hashlib
+import string
+import textwrap
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.shared.metrics import REGISTRY
+
+
+_PROMPT_INFO = REGISTRY.gauge(
+    "ai_prompt_template_info", "Loaded prompt templates (always 1).", ("name", "version")
+)
+
+
+def _compile(text: str) -> str:
+    return textwrap.dedent(text).strip()
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """
+    One compiled prompt: `system` is static; `user` is a format string whose
+    fields are filled per call.
+    """
+
+    name: str
+    declared_version: str
+    system: str
+    user: str
+    fields: tuple[str, ...] = field(init=False)
+    version: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        system, user = _compile(self.system), _compile(self.user)
+        if "{" in system:
+            raise ValueError(f"Prompt {self.name!r}: the system message must be static")
+        names = tuple(
+            name for _, name, _, _ in string.Formatter().parse(user) if name is not None
+        )
+        digest = hashlib.sha256(f"{system}\x00{user}".encode("utf-8")).hexdigest()
+        object.__setattr__(self, "system", system)
+        object.__setattr__(self, "user", user)
+        object.__setattr__(self, "fields", names)
+        object.__setattr__(self, "version", f"{self.declared_version}-{digest[:8]}")
+
+    @property
+    def id(self) -> str:
+        """`name@version`, used as a metric label."""
+        return f"{self.name}@{self.version}"
+
+    def user_message(self, **values: Any) -> str:
+        return self.user.format(**values)
+
+    def messages(self, **values: Any) -> list[dict[str, str]]:
+        """Chat messages for one call."""
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.user_message(**values)},
+        ]
+
+    def render(self, **values: Any) -> str:
+        """The full prompt text, for local token estimates."""
+        return f"{self.system}\n{self.user_message(**values)}"
+
+
+class PromptRegistry:
+    """Templates by name; each name is registered once."""
+
+    def __init__(self) -> None:
+        self._templates: dict[str, PromptTemplate] = {}
+
+    def register(self, template: PromptTemplate) -> PromptTemplate:
+        if template.name in self._templates:
+            raise ValueError(f"Prompt {template.name!r} is already registered")
+        self._templates[template.name] = template
+        _PROMPT_INFO.set(1, name=template.name, version=template.version)
+        return template
+
+    def get(self, name: str) -> PromptTemplate:
+        return self._templates[name]
+
+    def versions(self) -> dict[str, str]:
+        return {name: t.version for name, t in self._templates.items()}
+
+
+PROMPTS = PromptRegistry()
+
+# Bump a declared version when a template's meaning changes in a way its
+# text does not show (e.g. a different parser for its output).
+
+QUESTIONS = PROMPTS.register(
+    PromptTemplate(
+        name="questions",
+        declared_version="2",
+        system="""
+            You are an expert technical interviewer.
+            Generate 5 realistic technical interview questions for the role and
+            experience level given by the user.
+            Return a JSON object with a key "questions" containing a list of strings.
+            Output ONLY the raw JSON.
+        """,
+        user="""
+            Role: {role}
+            Experience: {experience}
+        """,
+    )
+)
+
+EVALUATION = PROMPTS.register(
+    PromptTemplate(
+        name="evaluation",
+        declared_version="2",
+        system="""
+            You are an expert technical interviewer.
+            Evaluate the candidate's answer to the interview question given by
+            the user.
+            Provide a JSON object with the following keys:
+            - "score": integer (1-10)
+            - "strengths": list of strings
+            - "weaknesses": list of strings
+            - "improved_answer": string
+            Output ONLY the raw JSON.
+        """,
+        user="""
+            Question: {question}
+            Candidate Answer: {answer}
+        """,
+    )
+)
+
+REFERENCE = PROMPTS.register(
+    PromptTemplate(
+        name="reference",
+        declared_version="2",
+        system="""
+            You are an expert technical interviewer.
+            Write a reference answer to the interview question given by the user.
+            Provide a JSON object with the following keys:
+            - "answer": string, a concise model answer
+            - "rubric": list of up to 6 strings, the points a strong answer covers
+            Output ONLY the raw JSON.
+        """,
+        user="""
+            Question: {question}
+        """,
+    )
+)
+
+GRADING = PROMPTS.register(
+    PromptTemplate(
+        name="grading",
+        declared_version="2",
+        system="""
+            You are an expert technical interviewer.
+            Grade the candidate's answer to the interview question given by the
+            user against the reference answer and rubric.
+            Provide a JSON object with the following keys:
+            - "score": integer (1-10)
+            - "strengths": list of strings
+            - "weaknesses": list of strings
+            Output ONLY the raw JSON.
+        """,
+        user="""
+            Question: {question}
+            Reference Answer: {reference}
+            Rubric:
+            {rubric}
+            Candidate Answer: {answer}
+        """,
+    )
+)
@@ -0,0 +1,133 @@
+"""
+Response cache for question generation.
+
+Most traffic asks for a small number of (role, experience) pairs, so the
+generated question sets are cached per normalized key. Each key keeps a pool
+of several previously generated sets and serves a random one, so repeat
+visitors still see some variety.
+"""
+
+import random
+import re
+import threading
+import time
+import zlib
+from typing import Optional
+
+from app.infrastructure.cache.backends import CacheBackend, MemoryCacheBackend
+from app.infrastructure.cache.codec import decode_question_pool, encode_question_pool
+
+
+_WHITESPACE = re.compile(r"\s+")
+_NON_WORD = re.compile(r"[^\w\s+#.]")
+_EXPERIENCE_UNITS = {
+    "y": "years",
+    "yr": "years",
+    "yrs": "years",
+    "year": "years",
+    "years": "years",
+    "m": "months",
+    "mo": "months",
+    "mos": "months",
+    "month": "months",
+    "months": "months",
+}
+
+
+def normalize_role(role: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace in a role name."""
+    role = _NON_WORD.sub(" ", role.lower())
+    return _WHITESPACE.sub(" ", role).strip()
+
+
+def normalize_experience(experience: str) -> str:
+    """
+    Canonicalize an experience string (e.g. "2 Yrs", "2y" -> "2 years").
+    """
+    text = _WHITESPACE.sub(" ", experience.lower()).strip()
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\+?\s*([a-z]+)?(?: of experience)?", text)
+    if not match:
+        return text
+    amount, unit = match.groups()
+    unit = _EXPERIENCE_UNITS.get(unit or "years", unit)
+    return f"{amount} {unit}"
+
+
+class QuestionCache:
+    """
+    Cache of question-set pools with per-set TTL, stored in a CacheBackend
+    (a process-local LRU over `max_keys` keys unless one is given).
+
+    A key is a miss until its pool holds `pool_size` fresh sets; after that,
+    lookups return a random set from the pool. Sets are stamped with
+    wall-clock time so that pools shared between processes agree on age.
+    Keys include `prompt_version`, so a changed prompt starts fresh pools.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_keys: int = 1024,
+        pool_size: int = 3,
+        ttl_seconds: float = 6 * 3600,
+        prompt_version: str = "",
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
+        self.backend = backend or MemoryCacheBackend(max_entries=max_keys)
+        self._prompt_version = prompt_version
+        self._lock = threading.Lock()
+        self._pool_size = max(1, pool_size)
+        self._ttl = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def blocking(self) -> bool:
+        """Whether lookups can block on I/O (and should run off the event loop)."""
+        return self.backend.blocking
+
+    @staticmethod
+    def key(role: str, experience: str) -> tuple[str, str]:
+        return normalize_role(role), normalize_experience(experience)
+
+    def _storage_key(self, role: str, experience: str) -> str:
+        return "questions:" + "\x00".join(
+            (self._prompt_version, *self.key(role, experience))
+        )
+
+    def _load(self, key: str) -> list[tuple[float, list[str]]]:
+        data = self.backend.get(key)
+        if data is None:
+            return []
+        try:
+            pool = decode_question_pool(data)
+        except (ValueError, TypeError, zlib.error):
+            return []
+        now = time.time()
+        return [s for s in pool if now - s[0] < self._ttl]
+
+    def get(self, role: str, experience: str) -> Optional[list[str]]:
+        """Return a cached question set, or None when the pool is not full."""
+        pool = self._load(self._storage_key(role, experience))
+        if len(pool) < self._pool_size:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return list(random.choice(pool)[1])
+
+    def put(self, role: str, experience: str, questions: list[str]) -> None:
+        """Add a freshly generated question set to the key's pool."""
+        key = self._storage_key(role, experience)
+        # Read-modify-write: concurrent writers in other processes may drop
+        # one another's set, which only delays filling the pool.
+        with self._lock:
+            pool = self._load(key)
+            pool.append((time.time(), list(questions)))
+            del pool[: -self._pool_size]
+            self.backend.set(key, encode_question_pool(pool), self._ttl)
+
+    def stats(self) -> dict[str, int]:
+        return {**self.backend.stats(), "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        self.backend.close()
@@ -0,0 +1,545 @@
+"""
+Client-side rate-limit scheduling for the upstream LLM.
+
+Instead of discovering the provider's request/token limits through failures,
+calls acquire capacity from local token buckets before going upstream:
+
+- a requests-per-minute bucket and an estimated tokens-per-minute bucket;
+- a priority queue so interactive evaluations go ahead of question
+  generation and background work;
+- `x-ratelimit-*` response headers re-synchronize the buckets with the
+  provider's view, and 429 responses pause all callers for `retry-after`.
+
+The provider meters each model separately, so a routed deployment keeps one
+scheduler per model (ModelSchedulers). Layers below the scheduler that send
+a call again (retries, hedges) charge each extra request to the CallBudget
+of the call in progress.
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, Mapping, Optional
+
+import httpx
+
+from app.application.interview.interfaces import (
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+from app.infrastructure.ai.groq_service import (
+    EVALUATION_MAX_COMPLETION_TOKENS,
+    GRADING_MAX_COMPLETION_TOKENS,
+    QUESTIONS_MAX_COMPLETION_TOKENS,
+    REFERENCE_MAX_COMPLETION_TOKENS,
+    grading_fields,
+)
+from app.infrastructure.ai.prompts import EVALUATION, GRADING, QUESTIONS, REFERENCE
+from app.infrastructure.ai.token_budget import estimate_tokens
+from app.shared.context import background_work
+from app.shared.errors import RateLimitError
+
+
+# Lower values are served first.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_STANDARD = 1
+PRIORITY_BACKGROUND = 2
+
+
+def estimate_questions_tokens(
+    role: str,
+    experience: str,
+    completion_tokens: int = QUESTIONS_MAX_COMPLETION_TOKENS,
+) -> int:
+    """Tokens a question-generation call reserves: its prompt plus completion cap."""
+    return (
+        estimate_tokens(QUESTIONS.render(role=role, experience=experience))
+        + completion_tokens
+    )
+
+
+def estimate_reference_tokens(question: str) -> int:
+    """Tokens a reference-answer call reserves: its prompt plus completion cap."""
+    return (
+        estimate_tokens(REFERENCE.render(question=question))
+        + REFERENCE_MAX_COMPLETION_TOKENS
+    )
+
+
+def _priority(default: int) -> int:
+    """`default`, or background priority for calls made as background work."""
+    return PRIORITY_BACKGROUND if background_work.get() else default
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse provider reset durations such as "7.66s", "2m59.56s" or "450ms".
+    """
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(amount) * scale[unit] for amount, unit in parts)
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    try:
+        return int(float(headers[name]))
+    except (KeyError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `per_minute / 60` tokens per second.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._level = float(per_minute)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)."""
+        self._refill()
+        # Requests larger than the bucket are admitted once it is full.
+        amount = min(amount, self.capacity)
+        if self._level >= amount:
+            return 0.0
+        return (amount - self._level) / self._rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self._level -= min(amount, self.capacity)
+
+    def set_limit(self, per_minute: float) -> None:
+        self._refill()
+        self.capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._level = min(self._level, self.capacity)
+
+    def clamp(self, remaining: float) -> None:
+        """Lower the level to the provider-reported remaining capacity."""
+        self._refill()
+        self._level = min(self._level, float(remaining))
+
+    @property
+    def level(self) -> float:
+        self._refill()
+        return self._level
+
+
+class RateLimitScheduler:
+    """
+    Priority-ordered admission of upstream calls under RPM/TPM budgets.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_wait_seconds: float = 30.0,
+    ) -> None:
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._max_wait = max_wait_seconds
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition: Optional[asyncio.Condition] = None
+        self.throttled = 0
+        self.rate_limited = 0
+
+    def _cond(self) -> asyncio.Condition:
+        # Created lazily so the scheduler can be built outside an event loop.
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _wait_time(self, tokens: int) -> float:
+        return max(
+            self._paused_until - time.monotonic(),
+            self._requests.wait_time(1),
+            self._tokens.wait_time(tokens),
+        )
+
+    async def acquire(self, priority: int, tokens: int) -> None:
+        """
+        Wait for this call's turn and budget, then reserve it.
+
+        Raises:
+            RateLimitError: If no capacity frees up within `max_wait_seconds`
+        """
+        entry = (priority, next(self._sequence))
+        heapq.heappush(self._waiters, entry)
+        deadline = time.monotonic() + self._max_wait
+        cond = self._cond()
+        async with cond:
+            try:
+                while True:
+                    wait: Optional[float] = None
+                    if self._waiters[0] == entry:
+                        wait = self._wait_time(tokens)
+                        if wait <= 0:
+                            heapq.heappop(self._waiters)
+                            self._requests.take(1)
+                            self._tokens.take(tokens)
+                            cond.notify_all()
+                            return
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or (wait is not None and wait > remaining):
+                        raise RateLimitError(
+                            "AI service is at its rate limit",
+                            retry_after=wait if wait is not None else remaining,
+                        )
+                    self.throttled += 1
+                    try:
+                        await asyncio.wait_for(
+                            cond.wait(), timeout=min(wait or remaining, remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    cond.notify_all()
+                raise
+
+    def try_acquire(self, priority: int, tokens: int) -> bool:
+        """
+        Reserve budget only if it is available now without queueing; returns
+        whether it was reserved. `priority` is accepted for symmetry with
+        `acquire`: nothing may jump a non-empty queue.
+        """
+        if self._waiters or self._wait_time(tokens) > 0:
+            return False
+        self._requests.take(1)
+        self._tokens.take(tokens)
+        return True
+
+    def has_headroom(
+        self,
+        tokens: int,
+        *,
+        requests: int = 1,
+        reserve_tokens: int = 0,
+        reserve_requests: int = 0,
+    ) -> bool:
+        """
+        Whether `requests` calls needing `tokens` in total could start now and
+        still leave the reserves for other callers; optional work checks this
+        before queueing.
+        """
+        return (
+            not self._waiters
+            and self._paused_until <= time.monotonic()
+            and self._requests.level >= requests + reserve_requests
+            and self._tokens.level >= tokens + reserve_tokens
+        )
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for `seconds` (e.g. after a 429)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def observe_response(self, response: httpx.Response) -> None:
+        """
+        Re-synchronize buckets from the provider's rate-limit headers.
+
+        Groq reports tokens per minute and requests per day; the token headers
+        adjust the TPM bucket, and an exhausted request budget pauses calls
+        until its reset time.
+        """
+        headers = response.headers
+        token_limit = _int_header(headers, "x-ratelimit-limit-tokens")
+        if token_limit:
+            if token_limit != self._tokens.capacity:
+                self._tokens.set_limit(token_limit)
+            remaining_tokens = _int_header(headers, "x-ratelimit-remaining-tokens")
+            if remaining_tokens is not None:
+                self._tokens.clamp(remaining_tokens)
+        if _int_header(headers, "x-ratelimit-remaining-requests") == 0:
+            reset = parse_duration(headers.get("x-ratelimit-reset-requests"))
+            if reset:
+                self.pause(reset)
+        if response.status_code == 429:
+            self.rate_limited += 1
+            retry_after = parse_duration(headers.get("retry-after"))
+            self.pause(retry_after if retry_after is not None else 1.0)
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "queued": len(self._waiters),
+            "throttled": self.throttled,
+            "rate_limited": self.rate_limited,
+            "requests_available": round(self._requests.level, 2),
+            "tokens_available": round(self._tokens.level, 2),
+        }
+
+
+_MODEL_FIELD = re.compile(rb'"model"\s*:\s*"([^"\\]+)"')
+
+
+def _request_model(request: httpx.Request) -> Optional[str]:
+    try:
+        match = _MODEL_FIELD.search(request.content)
+    except httpx.RequestNotRead:
+        return None
+    return match.group(1).decode() if match else None
+
+
+class ModelSchedulers:
+    """
+    One RateLimitScheduler per model, for models sharing a connection pool.
+
+    Responses are handed to the scheduler of the model named in their
+    request body, so one model's rate-limit headers never resize another's
+    buckets.
+    """
+
+    def __init__(self, schedulers: Mapping[str, RateLimitScheduler]) -> None:
+        self._schedulers = dict(schedulers)
+
+    def __getitem__(self, model: str) -> RateLimitScheduler:
+        return self._schedulers[model]
+
+    def observe_response(self, response: httpx.Response) -> None:
+        scheduler = self._schedulers.get(_request_model(response.request) or "")
+        if scheduler is not None:
+            scheduler.observe_response(response)
+
+    def has_headroom(
+        self,
+        tokens: int,
+        *,
+        requests: int = 1,
+        reserve_tokens: int = 0,
+        reserve_requests: int = 0,
+    ) -> bool:
+        """Whether every model has headroom, since a router may pick any of them."""
+        return all(
+            scheduler.has_headroom(
+                tokens,
+                requests=requests,
+                reserve_tokens=reserve_tokens,
+                reserve_requests=reserve_requests,
+            )
+            for scheduler in self._schedulers.values()
+        )
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {model: s.stats() for model, s in self._schedulers.items()}
+
+
+@dataclass
+class CallBudget:
+    """The scheduler, priority and token estimate one upstream request is charged."""
+
+    scheduler: RateLimitScheduler
+    priority: int
+    tokens: int
+
+    async def acquire(self) -> None:
+        await self.scheduler.acquire(self.priority, self.tokens)
+
+    def try_acquire(self) -> bool:
+        return self.scheduler.try_acquire(self.priority, self.tokens)
+
+
+_call_budget: ContextVar[Optional[CallBudget]] = ContextVar(
+    "call_budget", default=None
+)
+
+
+def current_call_budget() -> Optional[CallBudget]:
+    """Budget of the rate-limited call in progress, if any."""
+    return _call_budget.get()
+
+
+@contextmanager
+def _charging(budget: CallBudget) -> Iterator[None]:
+    token = _call_budget.set(budget)
+    try:
+        yield
+    finally:
+        _call_budget.reset(token)
+
+
+@dataclass
+class BudgetReserve:
+    """
+    Rate-limit budget that optional background work must leave free for
+    interactive calls. Background priority only reorders calls already
+    queued, so such work checks `allows` before it starts.
+    """
+
+    schedulers: ModelSchedulers
+    tokens: int = 0
+    requests: int = 0
+
+    def allows(self, tokens: int, requests: int = 1) -> bool:
+        """Whether `requests` calls needing `tokens` in total leave the reserve."""
+        return self.schedulers.has_headroom(
+            tokens,
+            requests=requests,
+            reserve_tokens=self.tokens,
+            reserve_requests=self.requests,
+        )
+
+
+class RateLimitedAIService(AsyncAIService):
+    """
+    AsyncAIService decorator that schedules calls through a RateLimitScheduler
+    and retries upstream 429s with jittered exponential backoff.
+
+    Each call reserves its estimated prompt tokens plus the completion cap
+    the backend will request. The reservation covers the first upstream
+    request; layers below charge any further ones to `current_call_budget()`.
+    """
+
+    def __init__(
+        self,
+        inner: AsyncAIService,
+        scheduler: RateLimitScheduler,
+        *,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        questions_completion_tokens: int = QUESTIONS_MAX_COMPLETION_TOKENS,
+        evaluation_completion_tokens: int = EVALUATION_MAX_COMPLETION_TOKENS,
+    ) -> None:
+        self._inner = inner
+        self.scheduler = scheduler
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._questions_completion_tokens = questions_completion_tokens
+        self._evaluation_completion_tokens = evaluation_completion_tokens
+
+    def _evaluation_tokens(
+        self, question: str, answer: str, reference: Optional[ReferenceAnswer]
+    ) -> int:
+        if reference is not None:
+            return estimate_tokens(
+                GRADING.render(**grading_fields(question, answer, reference))
+            ) + min(self._evaluation_completion_tokens, GRADING_MAX_COMPLETION_TOKENS)
+        return (
+            estimate_tokens(EVALUATION.render(question=question, answer=answer))
+            + self._evaluation_completion_tokens
+        )
+
+    def _backoff(self, attempt: int, error: RateLimitError) -> float:
+        if error.retry_after is not None:
+            return error.retry_after
+        return random.uniform(0, self._backoff_base * 2**attempt)
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        tokens = estimate_questions_tokens(
+            role, experience, self._questions_completion_tokens
+        )
+        budget = CallBudget(self.scheduler, _priority(PRIORITY_STANDARD), tokens)
+        for attempt in itertools.count():
+            await budget.acquire()
+            try:
+                with _charging(budget):
+                    return await self._inner.generate_questions(role, experience)
+            except RateLimitError as e:
+                if attempt >= self._max_retries:
+                    raise
+                self.scheduler.pause(self._backoff(attempt, e))
+        raise AssertionError("unreachable")
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        tokens = self._evaluation_tokens(question, answer, reference)
+        budget = CallBudget(self.scheduler, _priority(PRIORITY_INTERACTIVE), tokens)
+        for attempt in itertools.count():
+            await budget.acquire()
+            try:
+                with _charging(budget):
+                    return await self._inner.evaluate_answer(
+                        question, answer, reference=reference
+                    )
+            except RateLimitError as e:
+                if attempt >= self._max_retries:
+                    raise
+                self.scheduler.pause(self._backoff(attempt, e))
+        raise AssertionError("unreachable")
+
+    async def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        tokens = self._evaluation_tokens(question, answer, reference)
+        budget = CallBudget(self.scheduler, _priority(PRIORITY_INTERACTIVE), tokens)
+        for attempt in itertools.count():
+            await budget.acquire()
+            started = False
+            stream = self._inner.stream_evaluate_answer(
+                question, answer, reference=reference
+            )
+            try:
+                # Only the request that opens the stream is charged, and the
+                # budget must not stay set across yields to the consumer.
+                with _charging(budget):
+                    try:
+                        first = await stream.__anext__()
+                    except StopAsyncIteration:
+                        return
+                started = True
+                yield first
+                async for item in stream:
+                    yield item
+                return
+            except RateLimitError as e:
+                # Only retry if nothing has been sent to the client yet.
+                if started or attempt >= self._max_retries:
+                    raise
+                self.scheduler.pause(self._backoff(attempt, e))
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        budget = CallBudget(
+            self.scheduler, PRIORITY_BACKGROUND, estimate_reference_tokens(question)
+        )
+        for attempt in itertools.count():
+            await budget.acquire()
+            try:
+                with _charging(budget):
+                    return await self._inner.generate_reference(question)
+            except RateLimitError as e:
+                if attempt >= self._max_retries:
+                    raise
+                self.scheduler.pause(self._backoff(attempt, e))
+        raise AssertionError("unreachable")
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,328 @@
+"""
+Resilience policies around upstream AI calls.
+
+- Every call runs under a deadline budget; retries share that budget.
+- Only transient failures (timeouts, connection errors, 5xx) are retried,
+  with jittered exponential backoff.
+- Optionally, a second "hedged" request is sent when the first one is slower
+  than the recent p95 latency; the first success wins.
+- A circuit breaker fails calls fast while the upstream is unhealthy and lets
+  a single trial call through after a cool-down.
+
+Under a rate limiter, every retry waits for its own budget (time spent
+queued does not count against the deadline), and a hedge is only sent when
+budget is free right away.
+"""
+
+import asyncio
+import random
+import sys
+import time
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+from app.application.interview.interfaces import (
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+from app.infrastructure.ai.rate_limiter import CallBudget, current_call_budget
+from app.shared.errors import (
+    CircuitOpenError,
+    InfrastructureError,
+    ServiceUnavailableError,
+)
+
+
+T = TypeVar("T")
+
+_TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    httpx.TransportError,
+    asyncio.TimeoutError,
+)
+
+
+def _transient_errors() -> tuple[type[BaseException], ...]:
+    # The Groq SDK is imported lazily; if it is not loaded, none of its
+    # errors can have been raised.
+    groq = sys.modules.get("groq")
+    if groq is None:
+        return _TRANSIENT_ERRORS
+    return _TRANSIENT_ERRORS + (
+        groq.APIConnectionError,  # includes APITimeoutError
+        groq.InternalServerError,
+    )
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True if `error` (or an error it was raised from) is transient."""
+    transient = _transient_errors()
+    seen: set[int] = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        if isinstance(current, transient):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed -> open after `failure_threshold` transient failures in a row;
+    open -> half_open after `reset_timeout` seconds, admitting one trial call;
+    the trial's outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, *, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self._reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> None:
+        """
+        Raises:
+            CircuitOpenError: If the call must not go upstream right now
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        self.rejected += 1
+        retry_after = self._reset_timeout
+        if self._opened_at is not None:
+            retry_after = max(
+                0.0, self._reset_timeout - (time.monotonic() - self._opened_at)
+            )
+        raise CircuitOpenError(
+            "AI service is temporarily unavailable",
+            retry_after=retry_after,
+        )
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Forget a trial call that ended without a verdict (e.g. cancelled)."""
+        self._trial_in_flight = False
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "rejected": self.rejected,
+        }
+
+
+class ResilientAIService(AsyncAIService):
+    """
+    AsyncAIService decorator applying deadline, retry, hedging and circuit
+    breaker policies to every call.
+    """
+
+    def __init__(
+        self,
+        inner: AsyncAIService,
+        breaker: CircuitBreaker,
+        *,
+        deadline: float = 30.0,
+        max_retries: int = 2,
+        backoff_base: float = 0.25,
+        hedge: bool = False,
+        hedge_min_samples: int = 20,
+    ) -> None:
+        self._inner = inner
+        self.breaker = breaker
+        self._deadline = deadline
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._hedge = hedge
+        self._hedge_min_samples = hedge_min_samples
+        self._latencies: deque[float] = deque(maxlen=256)
+        self.retries = 0
+        self.hedged = 0
+        self.timeouts = 0
+
+    def _p95(self) -> Optional[float]:
+        if len(self._latencies) < self._hedge_min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+    async def _timed(self, fn: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await fn()
+        self._latencies.append(time.monotonic() - started)
+        return result
+
+    async def _attempt(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        hedge: bool,
+        budget: Optional[CallBudget],
+    ) -> T:
+        if not hedge:
+            return await fn()
+        threshold = self._p95()
+        if threshold is None:
+            return await self._timed(fn)
+
+        tasks = [asyncio.ensure_future(self._timed(fn))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=threshold)
+            # A hedge is optional: never queue for its budget.
+            if not done and (budget is None or budget.try_acquire()):
+                self.hedged += 1
+                tasks.append(asyncio.ensure_future(self._timed(fn)))
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _call(
+        self, fn: Callable[[], Awaitable[T]], *, hedge: bool = True
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._deadline
+        # The rate limiter above charged the first request; retries pay again.
+        budget = current_call_budget()
+        attempt = 0
+        while True:
+            if attempt and budget is not None:
+                queued_at = loop.time()
+                await budget.acquire()
+                deadline += loop.time() - queued_at
+            self.breaker.allow()
+            settled = False
+            try:
+                result = await asyncio.wait_for(
+                    self._attempt(fn, hedge and self._hedge, budget),
+                    timeout=max(0.0, deadline - loop.time()),
+                )
+                self.breaker.record_success()
+                settled = True
+                return result
+            except asyncio.TimeoutError as e:
+                self.timeouts += 1
+                self.breaker.record_failure()
+                settled = True
+                raise InfrastructureError(
+                    "AI service did not respond in time",
+                    details={"deadline_seconds": self._deadline},
+                ) from e
+            except Exception as e:
+                if isinstance(e, ServiceUnavailableError):
+                    # Rejected before reaching the upstream (rate limit, etc.).
+                    raise
+                if not is_retryable(e):
+                    # The upstream answered; the failure is not about its health.
+                    self.breaker.record_success()
+                    settled = True
+                    raise
+                self.breaker.record_failure()
+                settled = True
+                delay = random.uniform(0, self._backoff_base * 2**attempt)
+                if attempt >= self._max_retries or loop.time() + delay >= deadline:
+                    raise
+            finally:
+                if not settled:
+                    self.breaker.release()
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        return await self._call(
+            lambda: self._inner.generate_questions(role, experience)
+        )
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        return await self._call(
+            lambda: self._inner.evaluate_answer(question, answer, reference=reference)
+        )
+
+    async def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        """
+        The deadline bounds the wait for the first event; retries happen only
+        before anything has been yielded. Streams are never hedged.
+        """
+        first: Optional[EvaluationStreamItem] = None
+        stream: Optional[AsyncIterator[EvaluationStreamItem]] = None
+
+        async def open_stream() -> EvaluationStreamItem:
+            nonlocal stream
+            stream = self._inner.stream_evaluate_answer(
+                question, answer, reference=reference
+            )
+            return await stream.__anext__()
+
+        try:
+            first = await self._call(open_stream, hedge=False)
+        except StopAsyncIteration:
+            return
+
+        assert stream is not None
+        yield first
+        async for item in stream:
+            yield item
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        return await self._call(lambda: self._inner.generate_reference(question))
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()  # type: ignore[attr-defined]
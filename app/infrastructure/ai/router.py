@@ -0,0 +1,292 @@
+"""
+Latency-aware routing across several AI backends or models.
+
+Every backend keeps an exponentially weighted moving average (EWMA) of its
+latency and error rate. Each call goes to the best-scoring healthy backend
+and falls back down the ranking on failure, so tail latency follows the
+best available backend rather than the worst. A backend whose error rate
+crosses the threshold sits out a cool-down before being tried again.
+
+Only upstream and transport failures count against a backend. Local ones
+(rate-limit budget exhausted, an open circuit, malformed output) still fall
+back to the next backend, but say nothing about this one's health.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Optional,
+    TypeVar,
+)
+
+from app.application.interview.interfaces import (
+    AIService,
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+from app.infrastructure.ai.resilience import is_retryable
+
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+# How strongly recent errors push a backend down the ranking.
+_ERROR_PENALTY = 4.0
+
+
+def parse_model_list(value: str) -> list[tuple[str, float]]:
+    """
+    Parse "model-a:2,model-b" into [("model-a", 2.0), ("model-b", 1.0)].
+
+    A higher weight makes a backend preferred at equal latency.
+    """
+    models: list[tuple[str, float]] = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, weight = item.partition(":")
+        models.append((name.strip(), float(weight) if weight else 1.0))
+    return models
+
+
+@dataclass
+class RoutedBackend(Generic[S]):
+    """One routing target and its running health statistics."""
+
+    service: S
+    model: str
+    weight: float = 1.0
+    latency: Optional[float] = None
+    error_rate: float = 0.0
+    down_until: float = 0.0
+    calls: int = 0
+    failures: int = 0
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "model": self.model,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "healthy": self.down_until <= time.monotonic(),
+            "calls": self.calls,
+            "failures": self.failures,
+        }
+
+
+class BackendRouter(Generic[S]):
+    """
+    Ranks backends by weighted EWMA latency, penalized by recent errors.
+
+    Backends without samples rank first so each one gets measured; a small
+    `explore_ratio` of calls goes to a runner-up to keep its numbers fresh.
+    """
+
+    def __init__(
+        self,
+        backends: list[RoutedBackend[S]],
+        *,
+        alpha: float = 0.2,
+        error_threshold: float = 0.5,
+        cooldown: float = 30.0,
+        explore_ratio: float = 0.05,
+    ) -> None:
+        if not backends:
+            raise ValueError("At least one backend is required")
+        self.backends = backends
+        self._alpha = alpha
+        self._error_threshold = error_threshold
+        self._cooldown = cooldown
+        self._explore_ratio = explore_ratio
+
+    @property
+    def model(self) -> str:
+        return "+".join(b.model for b in self.backends)
+
+    def _score(self, backend: RoutedBackend[S]) -> float:
+        if backend.latency is None:
+            return 0.0
+        penalty = 1.0 + _ERROR_PENALTY * backend.error_rate
+        return backend.latency * penalty / max(backend.weight, 1e-6)
+
+    def ranked(self) -> list[RoutedBackend[S]]:
+        """Backends in the order they should be tried for the next call."""
+        now = time.monotonic()
+        healthy = sorted(
+            (b for b in self.backends if b.down_until <= now), key=self._score
+        )
+        # Backends in cool-down remain last-resort fallbacks.
+        cooling = sorted(
+            (b for b in self.backends if b.down_until > now),
+            key=lambda b: b.down_until,
+        )
+        if len(healthy) > 1 and random.random() < self._explore_ratio:
+            healthy.insert(0, healthy.pop(random.randrange(1, len(healthy))))
+        return healthy + cooling
+
+    def record_success(
+        self, backend: RoutedBackend[S], elapsed: Optional[float]
+    ) -> None:
+        backend.calls += 1
+        backend.error_rate *= 1 - self._alpha
+        if elapsed is not None:
+            backend.latency = (
+                elapsed
+                if backend.latency is None
+                else backend.latency + self._alpha * (elapsed - backend.latency)
+            )
+
+    def record_error(self, backend: RoutedBackend[S], error: Exception) -> None:
+        """Record a failed call, if `error` reflects on the backend's health."""
+        if is_retryable(error):
+            self.record_failure(backend)
+
+    def record_failure(self, backend: RoutedBackend[S]) -> None:
+        backend.calls += 1
+        backend.failures += 1
+        backend.error_rate += self._alpha * (1 - backend.error_rate)
+        if backend.error_rate >= self._error_threshold:
+            backend.down_until = time.monotonic() + self._cooldown
+
+    def snapshot(self) -> list[dict[str, object]]:
+        return [b.snapshot() for b in self.backends]
+
+
+class RoutingAIService(AIService):
+    """
+    AIService that routes each call across several blocking backends.
+    """
+
+    def __init__(self, router: BackendRouter[AIService]) -> None:
+        self.router = router
+
+    @property
+    def model(self) -> str:
+        return self.router.model
+
+    def _route(self, call: Callable[[AIService], T]) -> T:
+        error: Optional[Exception] = None
+        for backend in self.router.ranked():
+            started = time.monotonic()
+            try:
+                result = call(backend.service)
+            except Exception as e:
+                self.router.record_error(backend, e)
+                error = e
+                continue
+            self.router.record_success(backend, time.monotonic() - started)
+            return result
+        assert error is not None
+        raise error
+
+    def generate_questions(self, role: str, experience: str) -> list[str]:
+        return self._route(lambda s: s.generate_questions(role, experience))
+
+    def evaluate_answer(self, question: str, answer: str) -> InterviewEvaluation:
+        return self._route(lambda s: s.evaluate_answer(question, answer))
+
+    def close(self) -> None:
+        for backend in self.router.backends:
+            backend.service.close()  # type: ignore[attr-defined]
+
+
+class AsyncRoutingAIService(AsyncAIService):
+    """
+    AsyncAIService that routes each call across several backends.
+
+    Cancelled calls are not counted against a backend.
+    """
+
+    def __init__(self, router: BackendRouter[AsyncAIService]) -> None:
+        self.router = router
+
+    @property
+    def model(self) -> str:
+        return self.router.model
+
+    async def _route(self, call: Callable[[AsyncAIService], Awaitable[T]]) -> T:
+        error: Optional[Exception] = None
+        for backend in self.router.ranked():
+            started = time.monotonic()
+            try:
+                result = await call(backend.service)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.router.record_error(backend, e)
+                error = e
+                continue
+            self.router.record_success(backend, time.monotonic() - started)
+            return result
+        assert error is not None
+        raise error
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        return await self._route(lambda s: s.generate_questions(role, experience))
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        return await self._route(
+            lambda s: s.evaluate_answer(question, answer, reference=reference)
+        )
+
+    async def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        """
+        Falls back only until the first event; once streaming has started the
+        client is committed to that backend. Time to first event is not mixed
+        into the latency average, which tracks whole calls.
+        """
+        error: Optional[Exception] = None
+        for backend in self.router.ranked():
+            stream = backend.service.stream_evaluate_answer(
+                question, answer, reference=reference
+            )
+            try:
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                self.router.record_success(backend, None)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.router.record_error(backend, e)
+                error = e
+                continue
+            yield first
+            try:
+                async for item in stream:
+                    yield item
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.router.record_error(backend, e)
+                raise
+            self.router.record_success(backend, None)
+            return
+        assert error is not None
+        raise error
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        return await self._route(lambda s: s.generate_reference(question))
+
+    async def aclose(self) -> None:
+        for backend in self.router.backends:
+            await backend.service.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,219 @@
+"""
+Single-flight coalescing of identical in-flight AI calls.
+
+When many clients ask for the same thing at once (e.g. a class loading the
+same role), only the first call goes upstream; concurrent duplicates wait for
+it and receive the same result or exception.
+
+The shared call runs with its leader's request context, so calls only
+coalesce with others in the same mode: a background or cache-bypassing
+leader never serves an interactive or ordinary caller (which would inherit
+its priority, admission policy or fresh lookup).
+"""
+
+import asyncio
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Optional,
+    TypeVar,
+)
+
+from app.application.interview.interfaces import (
+    AIService,
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+from app.infrastructure.ai.evaluation_cache import normalize_text
+from app.infrastructure.ai.question_cache import QuestionCache
+from app.shared.context import background_work, cache_bypass
+
+
+T = TypeVar("T")
+
+
+def _flight_key(key: Hashable) -> Hashable:
+    return key, background_work.get(), cache_bypass.get()
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-based single-flight group for blocking callables.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        key = _flight_key(key)
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        assert call is not None
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """
+    Event-loop single-flight group for coroutine functions.
+
+    The shared upstream call runs as its own task, so cancelling one waiter
+    does not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        key = _flight_key(key)
+        self.calls += 1
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away.
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._tasks),
+        }
+
+
+def _questions_key(role: str, experience: str) -> Hashable:
+    return ("questions",) + QuestionCache.key(role, experience)
+
+
+def _evaluation_key(question: str, answer: str) -> Hashable:
+    return ("evaluation", normalize_text(question), normalize_text(answer))
+
+
+class CoalescingAIService(AIService):
+    """
+    AIService decorator that shares one upstream call among identical
+    concurrent calls.
+    """
+
+    def __init__(self, inner: AIService) -> None:
+        self._inner = inner
+        self.flight = SingleFlight()
+
+    def generate_questions(self, role: str, experience: str) -> list[str]:
+        return self.flight.do(
+            _questions_key(role, experience),
+            lambda: self._inner.generate_questions(role, experience),
+        )
+
+    def evaluate_answer(self, question: str, answer: str) -> InterviewEvaluation:
+        return self.flight.do(
+            _evaluation_key(question, answer),
+            lambda: self._inner.evaluate_answer(question, answer),
+        )
+
+    def close(self) -> None:
+        self._inner.close()  # type: ignore[attr-defined]
+
+
+class AsyncCoalescingAIService(AsyncAIService):
+    """
+    AsyncAIService decorator that shares one upstream call among identical
+    concurrent calls.
+    """
+
+    def __init__(self, inner: AsyncAIService) -> None:
+        self._inner = inner
+        self.flight = AsyncSingleFlight()
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        return await self.flight.do(
+            _questions_key(role, experience),
+            lambda: self._inner.generate_questions(role, experience),
+        )
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        return await self.flight.do(
+            _evaluation_key(question, answer),
+            lambda: self._inner.evaluate_answer(question, answer, reference=reference),
+        )
+
+    def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        # Streams are consumed incrementally by a single client; not coalesced.
+        return self._inner.stream_evaluate_answer(question, answer, reference=reference)
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        return await self.flight.do(
+            ("reference", normalize_text(question)),
+            lambda: self._inner.generate_reference(question),
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()  # type: ignore[attr-defined]
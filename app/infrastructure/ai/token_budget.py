@@ -0,0 +1,242 @@
+"""
+Token budgets for upstream prompts.
+
+Prompt size is checked locally (no tokenizer call) before anything goes
+upstream. Inputs over their budget are compacted in increasing order of
+intrusiveness, stopping as soon as they fit:
+
+1. collapse runs of whitespace and blank lines;
+2. drop sentences repeated verbatim (pasted-twice passages);
+3. keep the beginning and end, replacing the middle with a marker.
+
+Together with the completion caps in `groq_service`, this bounds both
+halves of a call's token cost.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from app.application.interview.interfaces import (
+    AIService,
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+from app.infrastructure.ai.groq_service import grading_fields
+from app.infrastructure.ai.prompts import EVALUATION, GRADING
+from app.shared.metrics import REGISTRY
+
+
+# About four characters per token for English text and code.
+_CHARS_PER_TOKEN = 4
+
+# Shorter repeats ("Yes.", "For example:") are legitimate and kept.
+_MIN_DEDUPE_CHARS = 24
+
+# Never squeeze an answer below this, whatever the question costs.
+_MIN_ANSWER_TOKENS = 64
+
+# Share of a truncated text kept from its beginning; the rest from its end.
+_HEAD_SHARE = 0.7
+
+_INLINE_WHITESPACE = re.compile(r"[ \t\f\v\r]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])(\s+)")
+_WORD = re.compile(r"\S+")
+
+_COMPACTED = REGISTRY.counter(
+    "ai_prompt_compactions_total",
+    "Prompt fields compacted to fit a token budget, by technique.",
+    ("field", "action"),
+)
+_TOKENS_SAVED = REGISTRY.counter(
+    "ai_prompt_tokens_saved_total",
+    "Estimated prompt tokens removed by compaction.",
+    ("field",),
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap local token estimate (about four characters per token)."""
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def collapse_whitespace(text: str) -> str:
+    """Collapse spaces/tabs to one space and at most one blank line."""
+    text = _INLINE_WHITESPACE.sub(" ", text)
+    text = "\n".join(line.strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def drop_repeated_sentences(text: str) -> str:
+    """Remove sentences that already appeared earlier in the text."""
+    seen: set[str] = set()
+    out: list[str] = []
+    parts = _SENTENCE_BREAK.split(text)
+    # parts alternates sentence, separator, sentence, ...
+    for i in range(0, len(parts), 2):
+        sentence = parts[i]
+        key = " ".join(sentence.lower().split())
+        if len(key) >= _MIN_DEDUPE_CHARS:
+            if key in seen:
+                continue
+            seen.add(key)
+        if out:
+            out.append(parts[i - 1])
+        out.append(sentence)
+    return "".join(out).strip()
+
+
+def truncate_middle(text: str, max_tokens: int) -> str:
+    """
+    Keep the start and end of `text` within `max_tokens`, cutting at
+    whitespace and marking how much was left out. Where no whitespace falls
+    inside the kept span (CJK text, minified code), the cut is by character.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    words = list(_WORD.finditer(text))
+    # Leave room for the marker itself.
+    budget_chars = max(0, (max_tokens - 1) * _CHARS_PER_TOKEN - 40)
+    head_chars = int(budget_chars * _HEAD_SHARE)
+    tail_chars = budget_chars - head_chars
+
+    head_words = 0
+    for word in words:
+        if word.end() > head_chars:
+            break
+        head_words += 1
+    tail_words = 0
+    for word in reversed(words[head_words:]):
+        if len(text) - word.start() > tail_chars:
+            break
+        tail_words += 1
+
+    if head_words and tail_words:
+        head = text[: words[head_words - 1].end()]
+        tail = text[words[len(words) - tail_words].start():]
+        omitted = f"{len(words) - head_words - tail_words} words"
+    else:
+        head = text[:head_chars]
+        tail = text[len(text) - tail_chars:] if tail_chars else ""
+        omitted = f"{len(text) - len(head) - len(tail)} characters"
+    return f"{head.rstrip()} [... {omitted} omitted ...] {tail.lstrip()}".strip()
+
+
+def fit_to_budget(text: str, max_tokens: int, *, field: str = "text") -> str:
+    """Return `text`, compacted only as far as needed to fit `max_tokens`."""
+    original = estimate_tokens(text)
+    if original <= max_tokens:
+        return text
+
+    steps = (
+        ("whitespace", collapse_whitespace),
+        ("dedupe", drop_repeated_sentences),
+        ("truncate", lambda t: truncate_middle(t, max_tokens)),
+    )
+    for action, step in steps:
+        text = step(text)
+        _COMPACTED.inc(field=field, action=action)
+        if estimate_tokens(text) <= max_tokens:
+            break
+    _TOKENS_SAVED.inc(original - estimate_tokens(text), field=field)
+    return text
+
+
+@dataclass(frozen=True)
+class TokenBudget:
+    """
+    Per-field and whole-prompt input budgets for evaluation calls.
+    """
+
+    question_max_tokens: int = 300
+    answer_max_tokens: int = 1500
+    prompt_max_tokens: int = 2000
+
+    def fit_evaluation(
+        self,
+        question: str,
+        answer: str,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> tuple[str, str]:
+        """
+        Compact a question/answer pair so the full evaluation prompt fits.
+
+        The question is fitted first; whatever the prompt budget has left
+        after the template (the grading one, with a reference) and question
+        bounds the answer.
+        """
+        question = fit_to_budget(question, self.question_max_tokens, field="question")
+        if reference is not None:
+            prompt = GRADING.render(**grading_fields(question, "", reference))
+        else:
+            prompt = EVALUATION.render(question=question, answer="")
+        overhead = estimate_tokens(prompt)
+        answer_budget = min(
+            self.answer_max_tokens,
+            max(_MIN_ANSWER_TOKENS, self.prompt_max_tokens - overhead),
+        )
+        return question, fit_to_budget(answer, answer_budget, field="answer")
+
+
+class TokenBudgetedAIService(AIService):
+    """
+    AIService decorator that fits evaluation inputs to a TokenBudget.
+    """
+
+    def __init__(self, inner: AIService, budget: TokenBudget) -> None:
+        self._inner = inner
+        self.budget = budget
+
+    def generate_questions(self, role: str, experience: str) -> list[str]:
+        return self._inner.generate_questions(role, experience)
+
+    def evaluate_answer(self, question: str, answer: str) -> InterviewEvaluation:
+        question, answer = self.budget.fit_evaluation(question, answer)
+        return self._inner.evaluate_answer(question, answer)
+
+    def close(self) -> None:
+        self._inner.close()  # type: ignore[attr-defined]
+
+
+class AsyncTokenBudgetedAIService(AsyncAIService):
+    """
+    AsyncAIService decorator that fits evaluation inputs to a TokenBudget.
+    """
+
+    def __init__(self, inner: AsyncAIService, budget: TokenBudget) -> None:
+        self._inner = inner
+        self.budget = budget
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        return await self._inner.generate_questions(role, experience)
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        question, answer = self.budget.fit_evaluation(question, answer, reference)
+        return await self._inner.evaluate_answer(question, answer, reference=reference)
+
+    def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        question, answer = self.budget.fit_evaluation(question, answer, reference)
+        return self._inner.stream_evaluate_answer(question, answer, reference=reference)
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        question = fit_to_budget(
+            question, self.budget.question_max_tokens, field="question"
+        )
+        return await self._inner.generate_reference(question)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()  # type: ignore[attr-defined]
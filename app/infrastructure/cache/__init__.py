@@ -0,0 +1,11 @@
+"""
+Pluggable storage for the AI response caches.
+
+The question and evaluation caches keep their keys and policies; where the
+entries live is a CacheBackend chosen by `CACHE_BACKEND`: process memory,
+a SQLite file shared by the workers on one host, or a Redis server shared
+by the fleet.
+"""
+
+from .backends import CacheBackend, MemoryCacheBackend, SQLiteCacheBackend  # noqa: F401
+from .redis_backend import RedisCacheBackend  # noqa: F401
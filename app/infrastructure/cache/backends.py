@@ -0,0 +1,233 @@
+"""
+Key-value stores behind the response caches.
+
+Backends store opaque bytes with a per-entry TTL. They are best-effort:
+an unavailable backend behaves like an empty one, so caching can never fail
+a request.
+
+- MemoryCacheBackend: per-process LRU; the default.
+- SQLiteCacheBackend: one WAL-mode file shared by every worker on a host.
+- RedisCacheBackend (`redis_backend`): shared by the whole fleet.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Protocol
+
+from app.infrastructure.logging.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class CacheBackend(Protocol):
+    """
+    Bytes-in, bytes-out store with expiry.
+
+    `blocking` backends do network or file I/O that can wait (on Redis, or on
+    another process's SQLite write lock); async callers run them off the
+    event loop.
+    """
+
+    blocking: bool
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value, or None if missing, expired or unavailable."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value for `ttl` seconds."""
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+    def stats(self) -> dict[str, int]:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Thread-safe, size-bounded LRU with per-entry expiry.
+    """
+
+    blocking = False
+
+    def __init__(self, *, max_entries: int = 4096) -> None:
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max(1, max_entries)
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "evictions": self.evictions}
+
+    def close(self) -> None:
+        pass
+
+
+# Several caches can share one file; each owns the rows of its namespace.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_entries_expires_at
+    ON cache_entries (namespace, expires_at);
+"""
+
+# Expired and excess rows are pruned once every this many writes.
+_PRUNE_EVERY = 256
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache in a SQLite file in WAL mode, shared by all worker processes on a
+    host: readers never block each other or the writer, so a value computed
+    by one worker is a local read for the rest.
+
+    Expiry uses wall-clock time, which all processes agree on. When more
+    than `max_entries` rows of this `namespace` remain after dropping
+    expired ones, those closest to expiry are removed first; pruning and
+    stats never touch other caches' rows in the same file.
+    """
+
+    # Statements can wait up to the 1s busy timeout behind other workers.
+    blocking = True
+
+    def __init__(
+        self, path: str, *, namespace: str = "default", max_entries: int = 100_000
+    ) -> None:
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=1.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._namespace = namespace
+        self._max_entries = max(1, max_entries)
+        self._writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _failed(self, error: sqlite3.Error) -> None:
+        self.errors += 1
+        logger.warning("SQLite cache operation failed", extra={"error": str(error)})
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache_entries "
+                    "WHERE namespace = ? AND key = ?",
+                    (self._namespace, key),
+                ).fetchone()
+        except sqlite3.Error as e:
+            self._failed(e)
+            return None
+        if row is None or row[1] <= time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (self._namespace, key, value, time.time() + ttl),
+                )
+                self._writes += 1
+                if self._writes % _PRUNE_EVERY == 0:
+                    self._prune()
+        except sqlite3.Error as e:
+            self._failed(e)
+
+    def _prune(self) -> None:
+        # Caller holds the lock.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+                (self._namespace, time.time()),
+            )
+            removed = cursor.rowcount
+            count = self._count()
+            if count > self._max_entries:
+                cursor = self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key IN "
+                    "(SELECT key FROM cache_entries WHERE namespace = ? "
+                    "ORDER BY expires_at LIMIT ?)",
+                    (self._namespace, self._namespace, count - self._max_entries),
+                )
+                removed += cursor.rowcount
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self.evictions += removed
+
+    def _count(self) -> int:
+        # Caller holds the lock.
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self._namespace,)
+        ).fetchone()
+        return count
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self._namespace, key),
+                )
+        except sqlite3.Error as e:
+            self._failed(e)
+
+    def stats(self) -> dict[str, int]:
+        try:
+            with self._lock:
+                entries = self._count()
+        except sqlite3.Error:
+            entries = 0
+        return {"entries": entries, "evictions": self.evictions, "errors": self.errors}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,77 @@
+"""
+Compact serialization of cached AI results.
+
+Values are minified JSON arrays (no field names), zlib-compressed when that
+makes them smaller, behind a one-byte format tag so the encoding can change
+without breaking readers of older entries.
+"""
+
+import json
+import zlib
+from typing import Any
+
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+
+
+_JSON = b"j"
+_ZLIB = b"z"
+
+# Shorter payloads rarely shrink enough to pay for decompression.
+_COMPRESS_OVER = 256
+
+
+def dumps(value: Any) -> bytes:
+    raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if len(raw) > _COMPRESS_OVER:
+        compressed = zlib.compress(raw, 6)
+        if len(compressed) < len(raw):
+            return _ZLIB + compressed
+    return _JSON + raw
+
+
+def loads(data: bytes) -> Any:
+    tag, body = data[:1], data[1:]
+    if tag == _ZLIB:
+        body = zlib.decompress(body)
+    elif tag != _JSON:
+        raise ValueError(f"Unknown cache value format {tag!r}")
+    return json.loads(body)
+
+
+def encode_evaluation(evaluation: InterviewEvaluation) -> bytes:
+    return dumps(
+        [
+            evaluation.score,
+            evaluation.strengths,
+            evaluation.weaknesses,
+            evaluation.improved_answer,
+        ]
+    )
+
+
+def decode_evaluation(data: bytes) -> InterviewEvaluation:
+    score, strengths, weaknesses, improved_answer = loads(data)
+    return InterviewEvaluation(
+        score=score,
+        strengths=strengths,
+        weaknesses=weaknesses,
+        improved_answer=improved_answer,
+    )
+
+
+def encode_question_pool(pool: list[tuple[float, list[str]]]) -> bytes:
+    """Question sets, each with the wall-clock time it was generated."""
+    return dumps([[round(created, 3), questions] for created, questions in pool])
+
+
+def decode_question_pool(data: bytes) -> list[tuple[float, list[str]]]:
+    return [(created, questions) for created, questions in loads(data)]
+
+
+def encode_reference(reference: ReferenceAnswer) -> bytes:
+    return dumps([reference.answer, reference.rubric])
+
+
+def decode_reference(data: bytes) -> ReferenceAnswer:
+    answer, rubric = loads(data)
+    return ReferenceAnswer(answer=answer, rubric=rubric)
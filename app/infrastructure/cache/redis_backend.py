@@ -0,0 +1,167 @@
+"""
+Redis cache backend over a minimal built-in RESP client.
+
+Only GET, SET PX and DEL are needed, so this speaks the protocol directly
+instead of pulling in a client library; any Redis-compatible server works.
+"""
+
+import socket
+import threading
+import time
+from typing import Any, Optional
+from urllib.parse import unquote, urlparse
+
+from app.infrastructure.cache.backends import CacheBackend
+from app.infrastructure.logging.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class RedisProtocolError(Exception):
+    pass
+
+
+def _command(*args: Any) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode("utf-8")
+        elif isinstance(arg, int):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+class _Connection:
+    """One blocking socket speaking RESP2."""
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._sock.makefile("rb")
+
+    def call(self, *args: Any) -> Any:
+        self._sock.sendall(_command(*args))
+        return self._read()
+
+    def _read(self) -> Any:
+        line = self._file.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise RedisProtocolError(payload.decode(errors="replace"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._file.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Connection closed by server")
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            return None if count < 0 else [self._read() for _ in range(count)]
+        raise RedisProtocolError(f"Unexpected reply type {kind!r}")
+
+    def close(self) -> None:
+        try:
+            self._file.close()
+            self._sock.close()
+        except OSError:
+            pass
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by every instance through a Redis-protocol server.
+
+    `url` is `redis://[:password@]host[:port][/db]`. The connection is opened
+    on first use and reused under a lock. After a failure the backend acts
+    as an empty cache for `retry_interval` seconds, so an outage costs one
+    timeout rather than one per request.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        timeout: float = 0.25,
+        key_prefix: str = "",
+        retry_interval: float = 5.0,
+    ) -> None:
+        parsed = urlparse(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"Unsupported cache URL scheme: {parsed.scheme!r}")
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 6379
+        self._username = unquote(parsed.username) if parsed.username else None
+        self._password = unquote(parsed.password) if parsed.password else None
+        self._db = int(parsed.path.strip("/") or 0)
+        self._timeout = timeout
+        self._prefix = key_prefix
+        self._retry_interval = retry_interval
+        self._conn: Optional[_Connection] = None
+        self._lock = threading.Lock()
+        self._down_until = 0.0
+        self.errors = 0
+
+    def _connect(self) -> _Connection:
+        conn = _Connection(self._host, self._port, self._timeout)
+        try:
+            if self._password is not None:
+                if self._username:
+                    conn.call("AUTH", self._username, self._password)
+                else:
+                    conn.call("AUTH", self._password)
+            if self._db:
+                conn.call("SELECT", self._db)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _call(self, *args: Any) -> Any:
+        if time.monotonic() < self._down_until:
+            return None
+        with self._lock:
+            try:
+                if self._conn is None:
+                    self._conn = self._connect()
+                return self._conn.call(*args)
+            except (OSError, RedisProtocolError) as e:
+                self.errors += 1
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+                self._down_until = time.monotonic() + self._retry_interval
+                logger.warning(
+                    "Redis cache unavailable",
+                    extra={"error": str(e), "retry_in_s": self._retry_interval},
+                )
+                return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._call("GET", self._prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._call("SET", self._prefix + key, value, "PX", max(1, int(ttl * 1000)))
+
+    def delete(self, key: str) -> None:
+        self._call("DEL", self._prefix + key)
+
+    def stats(self) -> dict[str, int]:
+        return {"errors": self.errors}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
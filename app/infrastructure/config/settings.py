@@ -6,6 +6,10 @@ from pydantic_settings import BaseSettings
 
 
 Environment = Literal["development", "staging", "production", "test"]
+AIBackend = Literal["groq", "fake"]
+LatencyDistribution = Literal["constant", "uniform", "lognormal"]
+LogFormat = Literal["json", "text"]
+CacheBackendName = Literal["memory", "sqlite", "redis"]
 
 
 class Settings(BaseSettings):
@@ -21,9 +25,206 @@ class Settings(BaseSettings):
     environment: Environment = Field(default="development", alias="APP_ENV")
     version: str = Field(default="0.1.0", alias="APP_VERSION")
     enable_docs: bool = Field(default=True, alias="ENABLE_DOCS")
+    log_format: LogFormat = Field(default="json", alias="LOG_FORMAT")
     
-    groq_api_key: str = Field(alias="GROQ_API_KEY")
-    
+    # Only needed once the Groq backend makes its first call.
+    groq_api_key: str = Field(default="", alias="GROQ_API_KEY")
+
+    # "fake" swaps the LLM for a deterministic local stand-in (load tests)
+    ai_backend: AIBackend = Field(default="groq", alias="AI_BACKEND")
+    fake_ai_latency_ms: float = Field(default=300.0, alias="FAKE_AI_LATENCY_MS")
+    fake_ai_latency_distribution: LatencyDistribution = Field(
+        default="lognormal", alias="FAKE_AI_LATENCY_DISTRIBUTION"
+    )
+    fake_ai_latency_spread: float = Field(default=0.5, alias="FAKE_AI_LATENCY_SPREAD")
+    fake_ai_error_rate: float = Field(default=0.0, alias="FAKE_AI_ERROR_RATE")
+    fake_ai_answer_words: int = Field(default=120, alias="FAKE_AI_ANSWER_WORDS")
+    fake_ai_seed: int = Field(default=0, alias="FAKE_AI_SEED")
+
+    # Models to route across as "name[:weight],..." (empty: the backend's default).
+    # With several, each call goes to the fastest healthy one, with fallback.
+    ai_models: str = Field(default="", alias="AI_MODELS")
+    ai_router_ewma_alpha: float = Field(default=0.2, alias="AI_ROUTER_EWMA_ALPHA")
+    ai_router_error_threshold: float = Field(
+        default=0.5, alias="AI_ROUTER_ERROR_THRESHOLD"
+    )
+    ai_router_cooldown: float = Field(default=30.0, alias="AI_ROUTER_COOLDOWN")
+    ai_router_explore_ratio: float = Field(
+        default=0.05, alias="AI_ROUTER_EXPLORE_RATIO"
+    )
+
+    # Upstream AI HTTP connection pool (shared by every request in the process)
+    ai_max_connections: int = Field(default=100, alias="AI_MAX_CONNECTIONS")
+    ai_max_keepalive_connections: int = Field(
+        default=20, alias="AI_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    ai_keepalive_expiry: float = Field(default=30.0, alias="AI_KEEPALIVE_EXPIRY")
+    ai_connect_timeout: float = Field(default=5.0, alias="AI_CONNECT_TIMEOUT")
+    ai_read_timeout: float = Field(default=60.0, alias="AI_READ_TIMEOUT")
+    ai_write_timeout: float = Field(default=10.0, alias="AI_WRITE_TIMEOUT")
+    ai_pool_timeout: float = Field(default=10.0, alias="AI_POOL_TIMEOUT")
+
+    # Storage for the response caches: memory (per process), sqlite (shared by
+    # the workers on one host) or redis (shared by every instance)
+    cache_backend: CacheBackendName = Field(default="memory", alias="CACHE_BACKEND")
+    cache_sqlite_path: str = Field(default="data/cache.db", alias="CACHE_SQLITE_PATH")
+    cache_redis_url: str = Field(
+        default="redis://localhost:6379/0", alias="CACHE_REDIS_URL"
+    )
+    cache_redis_timeout: float = Field(default=0.25, alias="CACHE_REDIS_TIMEOUT")
+    cache_key_prefix: str = Field(default="interview-coach:", alias="CACHE_KEY_PREFIX")
+
+    # Question generation response cache
+    question_cache_enabled: bool = Field(default=True, alias="QUESTION_CACHE_ENABLED")
+    question_cache_max_keys: int = Field(default=1024, alias="QUESTION_CACHE_MAX_KEYS")
+    question_cache_pool_size: int = Field(default=3, alias="QUESTION_CACHE_POOL_SIZE")
+    question_cache_ttl_seconds: float = Field(
+        default=6 * 3600, alias="QUESTION_CACHE_TTL_SECONDS"
+    )
+
+    # Pre-generated question bank (served before calling the LLM)
+    question_bank_enabled: bool = Field(default=True, alias="QUESTION_BANK_ENABLED")
+    question_bank_path: str = Field(
+        default="data/question_bank.db", alias="QUESTION_BANK_PATH"
+    )
+    question_bank_target_size: int = Field(
+        default=40, alias="QUESTION_BANK_TARGET_SIZE"
+    )
+    question_bank_refill_enabled: bool = Field(
+        default=True, alias="QUESTION_BANK_REFILL_ENABLED"
+    )
+    question_bank_dedupe_threshold: float = Field(
+        default=0.8, alias="QUESTION_BANK_DEDUPE_THRESHOLD"
+    )
+    # Rate-limit budget a refill round must leave for interactive calls.
+    question_bank_reserve_tokens: int = Field(
+        default=3000, alias="QUESTION_BANK_RESERVE_TOKENS"
+    )
+    question_bank_reserve_requests: int = Field(
+        default=10, alias="QUESTION_BANK_RESERVE_REQUESTS"
+    )
+
+    # Evaluation response cache
+    evaluation_cache_enabled: bool = Field(
+        default=True, alias="EVALUATION_CACHE_ENABLED"
+    )
+    evaluation_cache_max_entries: int = Field(
+        default=4096, alias="EVALUATION_CACHE_MAX_ENTRIES"
+    )
+    evaluation_cache_ttl_seconds: float = Field(
+        default=24 * 3600, alias="EVALUATION_CACHE_TTL_SECONDS"
+    )
+
+    # Reference answers generated in the background for issued questions
+    reference_answers_enabled: bool = Field(
+        default=True, alias="REFERENCE_ANSWERS_ENABLED"
+    )
+    reference_answers_max_entries: int = Field(
+        default=4096, alias="REFERENCE_ANSWERS_MAX_ENTRIES"
+    )
+    reference_answers_ttl_seconds: float = Field(
+        default=7 * 24 * 3600, alias="REFERENCE_ANSWERS_TTL_SECONDS"
+    )
+    reference_answers_max_pending: int = Field(
+        default=100, alias="REFERENCE_ANSWERS_MAX_PENDING"
+    )
+    # Rate-limit budget a prefetch must leave for interactive calls.
+    reference_answers_reserve_tokens: int = Field(
+        default=3000, alias="REFERENCE_ANSWERS_RESERVE_TOKENS"
+    )
+    reference_answers_reserve_requests: int = Field(
+        default=10, alias="REFERENCE_ANSWERS_RESERVE_REQUESTS"
+    )
+
+    # Local scoring of degenerate answers (empty, "I don't know", gibberish, ...)
+    fast_path_enabled: bool = Field(default=True, alias="FAST_PATH_ENABLED")
+    fast_path_min_words: int = Field(default=2, alias="FAST_PATH_MIN_WORDS")
+    fast_path_copy_threshold: float = Field(
+        default=0.9, alias="FAST_PATH_COPY_THRESHOLD"
+    )
+    fast_path_gibberish_threshold: float = Field(
+        default=0.5, alias="FAST_PATH_GIBBERISH_THRESHOLD"
+    )
+    fast_path_off_topic_max_overlap: float = Field(
+        default=0.0, alias="FAST_PATH_OFF_TOPIC_MAX_OVERLAP"
+    )
+
+    # Admission control: cap concurrent AI calls, shed load past a bounded queue
+    ai_admission_enabled: bool = Field(default=True, alias="AI_ADMISSION_ENABLED")
+    ai_max_concurrency: int = Field(default=32, alias="AI_MAX_CONCURRENCY")
+    ai_admission_max_queue: int = Field(default=64, alias="AI_ADMISSION_MAX_QUEUE")
+    ai_admission_max_queue_time: float = Field(
+        default=10.0, alias="AI_ADMISSION_MAX_QUEUE_TIME"
+    )
+
+    # Share one upstream call among identical concurrent AI calls
+    ai_coalescing_enabled: bool = Field(default=True, alias="AI_COALESCING_ENABLED")
+
+    # Client-side upstream rate limiting, per model (adjusted from provider headers)
+    ai_rate_limit_enabled: bool = Field(default=True, alias="AI_RATE_LIMIT_ENABLED")
+    ai_requests_per_minute: int = Field(default=30, alias="AI_REQUESTS_PER_MINUTE")
+    ai_tokens_per_minute: int = Field(default=6000, alias="AI_TOKENS_PER_MINUTE")
+    ai_rate_limit_max_wait: float = Field(default=30.0, alias="AI_RATE_LIMIT_MAX_WAIT")
+    ai_rate_limit_max_retries: int = Field(default=3, alias="AI_RATE_LIMIT_MAX_RETRIES")
+    ai_rate_limit_backoff_base: float = Field(
+        default=1.0, alias="AI_RATE_LIMIT_BACKOFF_BASE"
+    )
+
+    # Resilience: deadline budget, retries, hedging and circuit breaker
+    ai_resilience_enabled: bool = Field(default=True, alias="AI_RESILIENCE_ENABLED")
+    ai_request_deadline: float = Field(default=30.0, alias="AI_REQUEST_DEADLINE")
+    ai_max_retries: int = Field(default=2, alias="AI_MAX_RETRIES")
+    ai_retry_backoff_base: float = Field(default=0.25, alias="AI_RETRY_BACKOFF_BASE")
+    ai_hedge_enabled: bool = Field(default=False, alias="AI_HEDGE_ENABLED")
+    ai_hedge_min_samples: int = Field(default=20, alias="AI_HEDGE_MIN_SAMPLES")
+    ai_circuit_failure_threshold: int = Field(
+        default=5, alias="AI_CIRCUIT_FAILURE_THRESHOLD"
+    )
+    ai_circuit_reset_timeout: float = Field(
+        default=30.0, alias="AI_CIRCUIT_RESET_TIMEOUT"
+    )
+    # Retries inside the provider SDK; the layers above own retry policy.
+    ai_sdk_max_retries: int = Field(default=0, alias="AI_SDK_MAX_RETRIES")
+    # Completions requested again when their output cannot be repaired locally.
+    ai_max_regenerations: int = Field(default=1, alias="AI_MAX_REGENERATIONS")
+
+    # Prompt token budgets (inputs are compacted to fit) and completion caps
+    ai_token_budget_enabled: bool = Field(default=True, alias="AI_TOKEN_BUDGET_ENABLED")
+    ai_question_max_tokens: int = Field(default=300, alias="AI_QUESTION_MAX_TOKENS")
+    ai_answer_max_tokens: int = Field(default=1500, alias="AI_ANSWER_MAX_TOKENS")
+    ai_prompt_max_tokens: int = Field(default=2000, alias="AI_PROMPT_MAX_TOKENS")
+    ai_questions_completion_tokens: int = Field(
+        default=400, alias="AI_QUESTIONS_COMPLETION_TOKENS"
+    )
+    ai_evaluation_completion_tokens: int = Field(
+        default=700, alias="AI_EVALUATION_COMPLETION_TOKENS"
+    )
+
+    # Batch evaluation endpoint
+    batch_max_items: int = Field(default=10, alias="BATCH_MAX_ITEMS")
+    batch_max_concurrency: int = Field(default=5, alias="BATCH_MAX_CONCURRENCY")
+
+    # Background evaluation jobs (submit, then poll or long-poll for the result)
+    jobs_enabled: bool = Field(default=True, alias="JOBS_ENABLED")
+    job_workers: int = Field(default=4, alias="JOB_WORKERS")
+    job_queue_max_size: int = Field(default=1000, alias="JOB_QUEUE_MAX_SIZE")
+    job_result_ttl_seconds: float = Field(default=600.0, alias="JOB_RESULT_TTL_SECONDS")
+    job_max_stored: int = Field(default=10_000, alias="JOB_MAX_STORED")
+    job_max_wait_seconds: float = Field(default=30.0, alias="JOB_MAX_WAIT_SECONDS")
+
+    # WebSocket interview sessions (state is held server-side)
+    session_max_sessions: int = Field(default=1000, alias="SESSION_MAX_SESSIONS")
+    session_ttl_seconds: float = Field(default=1800.0, alias="SESSION_TTL_SECONDS")
+    session_max_concurrent_evaluations: int = Field(
+        default=3, alias="SESSION_MAX_CONCURRENT_EVALUATIONS"
+    )
+
+    # Prometheus `/metrics` endpoint and request/stage timing
+    metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
+
+    # Serve the bundled frontend from memory with precompressed variants
+    static_in_memory: bool = Field(default=True, alias="STATIC_IN_MEMORY")
+
     # CORS settings
     cors_origins: str = Field(
         default="http://localhost:3000,http://localhost:5173",
@@ -0,0 +1,37 @@
+"""
+Background evaluation jobs.
+
+Submitting an evaluation returns a job ID at once; a bounded in-process
+worker pool runs it and the client polls (or long-polls) for the result.
+"""
+
+from typing import Optional
+
+from app.application.interview.interfaces import AsyncAIService, ReferenceAnswers
+from app.infrastructure.ai.factory import build_answer_scorer
+from app.infrastructure.config.settings import Settings
+
+from .runner import EvaluationJobRunner
+from .store import InMemoryJobStore, JobStore  # noqa: F401
+
+
+def build_evaluation_jobs(
+    settings: Settings,
+    ai_service: AsyncAIService,
+    references: Optional[ReferenceAnswers] = None,
+) -> Optional[EvaluationJobRunner]:
+    """
+    Build the job runner (not yet started), or None when jobs are disabled.
+    """
+    if not settings.jobs_enabled:
+        return None
+    return EvaluationJobRunner(
+        ai_service,
+        InMemoryJobStore(
+            ttl=settings.job_result_ttl_seconds, max_jobs=settings.job_max_stored
+        ),
+        workers=settings.job_workers,
+        max_queue=settings.job_queue_max_size,
+        references=references,
+        scorer=build_answer_scorer(settings),
+    )
@@ -0,0 +1,134 @@
+"""
+In-process worker pool for evaluation jobs.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.application.interview.dto import EvaluationJob, EvaluationRequest
+from app.application.interview.interfaces import (
+    AsyncAIService,
+    EvaluationJobQueue,
+    ReferenceAnswers,
+)
+from app.application.interview.use_cases import AsyncEvaluateAnswerUseCase
+from app.domain.interview.scoring import TrivialAnswerScorer
+from app.infrastructure.jobs.store import JobStore
+from app.infrastructure.logging.logger import get_logger
+from app.shared.context import correlation_id
+from app.shared.errors import ServiceUnavailableError
+from app.shared.metrics import REGISTRY
+
+
+logger = get_logger(__name__)
+
+_JOBS = REGISTRY.counter(
+    "evaluation_jobs_total", "Evaluation jobs by outcome.", ("outcome",)
+)
+_JOB_QUEUE = REGISTRY.gauge(
+    "evaluation_job_queue", "Queued and running evaluation jobs.", ("stat",)
+)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class EvaluationJobRunner(EvaluationJobQueue):
+    """
+    Runs queued evaluations on a fixed pool of asyncio workers.
+
+    At most `workers` evaluations run at once and at most `max_queue` wait;
+    submissions beyond that fail fast with ServiceUnavailableError instead
+    of growing the backlog without bound. Each job runs under the
+    correlation ID of the request that submitted it.
+    """
+
+    def __init__(
+        self,
+        ai_service: AsyncAIService,
+        store: JobStore,
+        *,
+        workers: int = 4,
+        max_queue: int = 1000,
+        references: Optional[ReferenceAnswers] = None,
+        scorer: Optional[TrivialAnswerScorer] = None,
+    ) -> None:
+        self._evaluate = AsyncEvaluateAnswerUseCase(ai_service, references, scorer)
+        self.store = store
+        self._queue: "asyncio.Queue[tuple[EvaluationJob, EvaluationRequest, str]]" = (
+            asyncio.Queue(maxsize=max_queue)
+        )
+        self._worker_count = max(1, workers)
+        self._workers: list["asyncio.Task[None]"] = []
+        self._running = 0
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [
+                asyncio.ensure_future(self._work()) for _ in range(self._worker_count)
+            ]
+
+    async def submit(self, request: EvaluationRequest) -> EvaluationJob:
+        if self._queue.full():
+            _JOBS.inc(outcome="rejected")
+            raise ServiceUnavailableError(
+                "Evaluation queue is full, try again later",
+                retry_after=5.0,
+                details={"queued": self._queue.qsize()},
+            )
+        job = EvaluationJob(job_id=uuid.uuid4().hex, status="queued", created_at=_now())
+        await self.store.save(job)
+        self._queue.put_nowait((job, request, correlation_id.get()))
+        _JOBS.inc(outcome="submitted")
+        return job
+
+    async def get(
+        self, job_id: str, *, wait: float = 0.0
+    ) -> Optional[EvaluationJob]:
+        if wait > 0:
+            return await self.store.wait(job_id, wait)
+        return await self.store.get(job_id)
+
+    async def _work(self) -> None:
+        while True:
+            job, request, request_id = await self._queue.get()
+            token = correlation_id.set(request_id)
+            self._running += 1
+            try:
+                await self._run(job, request)
+            except Exception:
+                logger.exception("Evaluation job crashed", extra={"job_id": job.job_id})
+            finally:
+                self._running -= 1
+                correlation_id.reset(token)
+                self._queue.task_done()
+
+    async def _run(self, job: EvaluationJob, request: EvaluationRequest) -> None:
+        await self.store.save(job.model_copy(update={"status": "running"}))
+        result = await self._evaluate.execute(request)
+        if result.is_ok:
+            update = {"status": "succeeded", "result": result.value}
+        else:
+            update = {"status": "failed", "error": result.error.to_dict()}  # type: ignore[union-attr]
+        await self.store.save(job.model_copy(update={**update, "finished_at": _now()}))
+        _JOBS.inc(outcome=update["status"])
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "running": self._running,
+            "workers": self._worker_count,
+        }
+
+    def collect_metrics(self) -> None:
+        for stat, value in self.stats().items():
+            _JOB_QUEUE.set(value, stat=stat)
+
+    async def aclose(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
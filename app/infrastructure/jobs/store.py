@@ -0,0 +1,91 @@
+"""
+Storage for evaluation job state.
+
+`JobStore` is the seam for an external store (Redis, a database): the
+runner only saves jobs, reads them back and waits for them to finish. The
+default `InMemoryJobStore` needs no outside services; it holds a job until
+`ttl` seconds after it finishes.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+from app.application.interview.dto import EvaluationJob
+
+
+class JobStore(Protocol):
+    """
+    Persistence for job state shared by submitters, workers and pollers.
+    """
+
+    async def save(self, job: EvaluationJob) -> None:
+        """Insert or replace a job."""
+        ...
+
+    async def get(self, job_id: str) -> Optional[EvaluationJob]:
+        """Return a job, or None if it is unknown or has expired."""
+        ...
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[EvaluationJob]:
+        """
+        Return the job once it has finished, or as it stands after `timeout`
+        seconds. Stores without notifications may implement this by polling.
+        """
+        ...
+
+
+class InMemoryJobStore(JobStore):
+    """
+    Process-local job store with TTL retention of finished jobs.
+
+    Finished jobs expire `ttl` seconds after completion; when more than
+    `max_jobs` are held, the oldest finished ones are dropped first. Pollers
+    long-poll on a per-job event instead of re-reading in a loop.
+    """
+
+    def __init__(self, *, ttl: float = 600.0, max_jobs: int = 10_000) -> None:
+        self._ttl = ttl
+        self._max_jobs = max_jobs
+        self._jobs: dict[str, EvaluationJob] = {}
+        # Finished job IDs in completion order, with their expiry times.
+        self._expiry: "OrderedDict[str, float]" = OrderedDict()
+        self._done: dict[str, asyncio.Event] = {}
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        while self._expiry:
+            job_id, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now and len(self._jobs) <= self._max_jobs:
+                break
+            self._expiry.popitem(last=False)
+            self._jobs.pop(job_id, None)
+            self._done.pop(job_id, None)
+
+    async def save(self, job: EvaluationJob) -> None:
+        self._jobs[job.job_id] = job
+        if job.finished:
+            self._expiry[job.job_id] = time.monotonic() + self._ttl
+            event = self._done.pop(job.job_id, None)
+            if event is not None:
+                event.set()
+        self._purge()
+
+    async def get(self, job_id: str) -> Optional[EvaluationJob]:
+        self._purge()
+        return self._jobs.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[EvaluationJob]:
+        job = await self.get(job_id)
+        if job is None or job.finished or timeout <= 0:
+            return job
+        event = self._done.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self._jobs.get(job_id)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
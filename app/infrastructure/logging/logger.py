@@ -1,60 +1,144 @@
+import atexit
+import copy
+import json
 import logging
-from logging.config import dictConfig
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
 from app.infrastructure.config.settings import Settings
+from app.shared.context import correlation_id
+
+
+TEXT_FORMAT = (
+    "%(asctime)s %(levelname)s [%(name)s] "
+    "%(message)s "
+    "(correlation_id=%(correlation_id)s)"
+)
+
+# Attributes every LogRecord has; anything else was passed via `extra=`.
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "correlation_id"}
+
+# Server loggers that would otherwise write synchronously on their own handlers.
+_ADOPTED_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+_listener: Optional[QueueListener] = None
+
+
+class CorrelationIdFilter(logging.Filter):
+    """
+    Stamp each record with the current request's correlation ID.
+
+    Runs in the thread that logs (before the record is queued), so the
+    request-scoped context variable is still visible.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line, with `extra=` fields included at top level.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "correlation_id": getattr(record, "correlation_id", "-"),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, default=str)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps records structured for the listener's formatter.
+
+    The stock `prepare` pre-formats the whole record into `msg`; here only the
+    message arguments and traceback are rendered (they may not be picklable or
+    may change later), leaving formatting to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def configure_logging(settings: Settings) -> None:
     """
     Configure application-wide logging.
 
-    This uses a simple, structured-friendly format and can be extended
-    later to integrate with centralized logging solutions.
+    Records are stamped with the correlation ID, put on an in-memory queue
+    and written by a background listener thread, so a slow stdout never
+    blocks the event loop or request workers. Output is JSON lines unless
+    `LOG_FORMAT=text`.
     """
+    global _listener
 
     level = logging.INFO if settings.environment != "production" else logging.WARNING
 
-    dictConfig(
-        {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "default": {
-                    "format": (
-                        "%(asctime)s %(levelname)s [%(name)s] "
-                        "%(message)s "
-                        "(correlation_id=%(correlation_id)s)"
-                    ),
-                },
-            },
-            "filters": {
-                "correlation": {
-                    "()": "logging.Filter",
-                },
-            },
-            "handlers": {
-                "console": {
-                    "class": "logging.StreamHandler",
-                    "formatter": "default",
-                },
-            },
-            "root": {
-                "level": level,
-                "handlers": ["console"],
-            },
-        }
+    stop_logging()
+
+    console = logging.StreamHandler()
+    console.setFormatter(
+        JsonFormatter() if settings.log_format == "json" else logging.Formatter(TEXT_FORMAT)
     )
 
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _RecordQueueHandler(log_queue)  # type: ignore[arg-type]
+    queue_handler.addFilter(CorrelationIdFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    for name in _ADOPTED_LOGGERS:
+        adopted = logging.getLogger(name)
+        adopted.handlers = []
+        adopted.propagate = True
+
+    _listener = QueueListener(log_queue, console, respect_handler_level=True)  # type: ignore[arg-type]
+    _listener.start()
+
+
+atexit.register(stop_logging)
+
 
 def get_logger(name: str) -> logging.Logger:
     """
     Convenience helper to get a logger with the configured settings applied.
-    """
 
-    logger = logging.getLogger(name)
-    # Ensure correlation_id attribute exists to satisfy formatter.
-    if not hasattr(logger, "correlation_id"):
-        # Logging records will pick this up via `extra` in practice.
-        logger.correlation_id = "-"  # type: ignore[attr-defined]
-    return logger
+    Correlation IDs are added to records by the root handler's filter, so any
+    standard logger works.
+    """
 
+    return logging.getLogger(name)
@@ -0,0 +1,11 @@
+"""
+Pre-generated question bank.
+
+Question generation for common roles is served from a local store that is
+filled offline (`python -m app.infrastructure.question_bank`) or in the
+background after a miss.
+"""
+
+from .filler import fill_bucket, refill_bucket  # noqa: F401
+from .service import QuestionBankAIService  # noqa: F401
+from .store import QuestionBank, classify_topic, seniority_bucket  # noqa: F401
@@ -0,0 +1,89 @@
+"""
+Offline question bank fill job.
+
+Usage:
+    python -m app.infrastructure.question_bank \
+        --roles "Software Engineer,Data Scientist,Frontend Developer" \
+        --experience "1 year,3 years,7 years,12 years"
+
+Uses the server's async AI stack configured by the usual settings
+(GROQ_API_KEY, AI_BACKEND, QUESTION_BANK_PATH, ...), so generation is paced
+by the same rate limiter, retries and circuit breaker.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from app.infrastructure.ai.factory import build_ai_runtime
+from app.infrastructure.ai.prompts import QUESTIONS
+from app.infrastructure.config.settings import Settings, get_settings
+from app.infrastructure.question_bank.filler import refill_bucket
+from app.infrastructure.question_bank.store import QuestionBank
+
+
+def _split(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+async def _fill(
+    settings: Settings,
+    bank: QuestionBank,
+    roles: list[str],
+    levels: list[str],
+    target: int,
+) -> None:
+    # Generate through the stack without its own bank lookup, which would
+    # answer from the very buckets being filled.
+    runtime = build_ai_runtime(
+        settings.model_copy(update={"question_bank_enabled": False})
+    )
+    try:
+        for role in roles:
+            for experience in levels:
+                added = await refill_bucket(
+                    bank,
+                    runtime.service,
+                    role,
+                    experience,
+                    target_size=target,
+                    completion_tokens=settings.ai_questions_completion_tokens,
+                )
+                count = await asyncio.to_thread(bank.count, role, experience)
+                print(f"{role!r} / {experience!r}: +{added} ({count} banked)")
+    finally:
+        await runtime.aclose()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Fill the interview question bank.")
+    parser.add_argument("--roles", required=True, help="Comma-separated job roles")
+    parser.add_argument(
+        "--experience",
+        default="1 year,3 years,7 years,12 years",
+        help="Comma-separated experience levels (one per seniority bucket)",
+    )
+    parser.add_argument("--target", type=int, default=settings.question_bank_target_size)
+    parser.add_argument("--path", default=settings.question_bank_path)
+    args = parser.parse_args(argv)
+
+    bank = QuestionBank(
+        args.path,
+        prompt_version=QUESTIONS.id,
+        dedupe_threshold=settings.question_bank_dedupe_threshold,
+    )
+    try:
+        asyncio.run(
+            _fill(
+                settings, bank, _split(args.roles), _split(args.experience), args.target
+            )
+        )
+    finally:
+        bank.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
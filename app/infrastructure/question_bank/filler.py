@@ -0,0 +1,97 @@
+"""
+Jobs that grow the question bank by asking the LLM for more questions.
+"""
+
+import asyncio
+from typing import Optional
+
+from app.application.interview.interfaces import AIService, AsyncAIService
+from app.infrastructure.ai.groq_service import QUESTIONS_MAX_COMPLETION_TOKENS
+from app.infrastructure.ai.rate_limiter import BudgetReserve, estimate_questions_tokens
+from app.infrastructure.logging.logger import get_logger
+from app.infrastructure.question_bank.store import QuestionBank
+from app.shared.context import bypassing_cache, in_background
+from app.shared.errors import OverloadedError
+
+
+logger = get_logger(__name__)
+
+# Stop after this many rounds in a row add nothing new (the model repeats itself).
+DEFAULT_PATIENCE = 3
+
+
+def fill_bucket(
+    bank: QuestionBank,
+    ai_service: AIService,
+    role: str,
+    experience: str,
+    *,
+    target_size: int,
+    max_rounds: int = 20,
+    patience: int = DEFAULT_PATIENCE,
+) -> int:
+    """
+    Generate questions until the bucket holds `target_size`, blocking.
+
+    Returns:
+        Number of questions added
+    """
+    added = stale = 0
+    with bypassing_cache():
+        for _ in range(max_rounds):
+            if bank.count(role, experience) >= target_size or stale >= patience:
+                break
+            new = bank.add(role, experience, ai_service.generate_questions(role, experience))
+            added += new
+            stale = 0 if new else stale + 1
+    return added
+
+
+async def refill_bucket(
+    bank: QuestionBank,
+    ai_service: AsyncAIService,
+    role: str,
+    experience: str,
+    *,
+    target_size: int,
+    max_rounds: int = 20,
+    patience: int = DEFAULT_PATIENCE,
+    reserve: Optional[BudgetReserve] = None,
+    completion_tokens: int = QUESTIONS_MAX_COMPLETION_TOKENS,
+) -> int:
+    """
+    Asynchronous counterpart of `fill_bucket`, for background refills and
+    the offline fill job.
+
+    Runs as background work, so it stops (quietly) as soon as admission
+    control has no spare capacity, or before a round that would cut into
+    the rate-limit `reserve` kept for interactive calls. Other failures are
+    logged and end the refill too; the bank is only ever an optimization,
+    so they never reach a caller.
+    """
+    added = stale = 0
+    try:
+        with bypassing_cache(), in_background():
+            for _ in range(max_rounds):
+                count = await asyncio.to_thread(bank.count, role, experience)
+                if count >= target_size or stale >= patience:
+                    break
+                if reserve is not None and not reserve.allows(
+                    estimate_questions_tokens(role, experience, completion_tokens)
+                ):
+                    break
+                questions = await ai_service.generate_questions(role, experience)
+                new = await asyncio.to_thread(bank.add, role, experience, questions)
+                added += new
+                stale = 0 if new else stale + 1
+    except asyncio.CancelledError:
+        raise
+    except OverloadedError:
+        pass
+    except Exception as e:
+        logger.warning(
+            "Question bank refill failed",
+            extra={"role": role, "experience": experience, "error": str(e)},
+        )
+    return added
+
@@ -0,0 +1,112 @@
+"""
+AsyncAIService decorator that serves question generation from the bank.
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional
+
+from app.application.interview.interfaces import (
+    AsyncAIService,
+    EvaluationStreamItem,
+)
+from app.domain.interview.entities import InterviewEvaluation, ReferenceAnswer
+from app.infrastructure.ai.groq_service import QUESTIONS_MAX_COMPLETION_TOKENS
+from app.infrastructure.ai.rate_limiter import BudgetReserve
+from app.infrastructure.question_bank.filler import refill_bucket
+from app.infrastructure.question_bank.store import BankKey, QuestionBank
+
+
+class QuestionBankAIService(AsyncAIService):
+    """
+    Serve question sets from a QuestionBank, calling the LLM only on a miss.
+
+    A miss is answered live and its questions are banked; when a bucket is
+    below `target_size`, one background task per bucket keeps generating
+    until it is full, so later requests for that role and seniority become
+    local lookups. With a `reserve`, refills only spend rate-limit budget
+    beyond it and resume on a later request. Bank reads run in a worker
+    thread: they wait on the bank's lock during writes and periodically
+    query SQLite.
+    """
+
+    def __init__(
+        self,
+        inner: AsyncAIService,
+        bank: QuestionBank,
+        *,
+        set_size: int = 5,
+        target_size: int = 40,
+        refill: bool = True,
+        reserve: Optional[BudgetReserve] = None,
+        completion_tokens: int = QUESTIONS_MAX_COMPLETION_TOKENS,
+    ) -> None:
+        self._inner = inner
+        self.bank = bank
+        self._set_size = set_size
+        self._target_size = target_size
+        self._refill = refill
+        self._reserve = reserve
+        self._completion_tokens = completion_tokens
+        self._refills: dict[BankKey, "asyncio.Task[int]"] = {}
+
+    async def _schedule_refill(self, role: str, experience: str) -> None:
+        key = self.bank.key(role, experience)
+        if not self._refill or key in self._refills:
+            return
+        count = await asyncio.to_thread(self.bank.count, role, experience)
+        if count >= self._target_size or key in self._refills:
+            return
+        task = asyncio.ensure_future(
+            refill_bucket(
+                self.bank,
+                self._inner,
+                role,
+                experience,
+                target_size=self._target_size,
+                reserve=self._reserve,
+                completion_tokens=self._completion_tokens,
+            )
+        )
+        self._refills[key] = task
+        task.add_done_callback(lambda _: self._refills.pop(key, None))
+
+    async def generate_questions(self, role: str, experience: str) -> list[str]:
+        questions = await asyncio.to_thread(
+            self.bank.sample, role, experience, self._set_size
+        )
+        if questions is None:
+            questions = await self._inner.generate_questions(role, experience)
+            await asyncio.to_thread(self.bank.add, role, experience, questions)
+        await self._schedule_refill(role, experience)
+        return questions
+
+    async def evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> InterviewEvaluation:
+        return await self._inner.evaluate_answer(question, answer, reference=reference)
+
+    def stream_evaluate_answer(
+        self,
+        question: str,
+        answer: str,
+        *,
+        reference: Optional[ReferenceAnswer] = None,
+    ) -> AsyncIterator[EvaluationStreamItem]:
+        return self._inner.stream_evaluate_answer(question, answer, reference=reference)
+
+    async def generate_reference(self, question: str) -> ReferenceAnswer:
+        return await self._inner.generate_reference(question)
+
+    def stats(self) -> dict[str, int]:
+        return {**self.bank.stats(), "refills_running": len(self._refills)}
+
+    async def aclose(self) -> None:
+        for task in list(self._refills.values()):
+            task.cancel()
+        await asyncio.gather(*self._refills.values(), return_exceptions=True)
+        self.bank.close()
+        await self._inner.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,290 @@
+"""
+SQLite-backed bank of pre-generated interview questions.
+
+Questions are indexed by the prompt that generated them, normalized role,
+seniority bucket and topic. Each (role, seniority) bucket is loaded into
+memory on first use, so sampling a question set is a local,
+sub-millisecond operation; SQLite provides durability across restarts and
+sharing with other workers and the offline fill job. A loaded bucket picks
+up rows added by others at most `refresh_seconds` later.
+"""
+
+import random
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.infrastructure.ai.question_cache import normalize_experience, normalize_role
+
+
+BankKey = tuple[str, str]
+
+_SENIORITY_WORDS = (
+    ("intern", "junior"),
+    ("entry", "junior"),
+    ("junior", "junior"),
+    ("graduate", "junior"),
+    ("mid", "mid"),
+    ("senior", "senior"),
+    ("lead", "staff"),
+    ("staff", "staff"),
+    ("principal", "staff"),
+)
+
+_TOPIC_KEYWORDS = {
+    "behavioral": (
+        "tell me about", "describe a time", "conflict", "disagree", "mistake",
+        "stakeholder", "mentor", "feedback",
+    ),
+    "system_design": (
+        "design", "architect", "scal", "distributed", "microservice",
+        "availability", "load balanc", "cach",
+    ),
+    "data": ("database", "sql", "index", "query", "schema", "transaction", "nosql"),
+    "algorithms": (
+        "algorithm", "complexity", "big o", "sort", "tree", "graph", "array",
+        "linked list", "recurs", "dynamic programming",
+    ),
+    "testing": ("test", "debug", "bug", "quality", "ci/cd", "monitor"),
+}
+
+_STOPWORDS = frozenset(
+    "a an the and or of to in on for with how what why when which would you "
+    "your is are do does can could explain describe".split()
+)
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    role TEXT NOT NULL,
+    seniority TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    question TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS questions_bucket ON questions (role, seniority, topic);
+"""
+
+# Banks created before questions were keyed by prompt version.
+_MIGRATIONS = (
+    (
+        "prompt_version",
+        "ALTER TABLE questions ADD COLUMN prompt_version TEXT NOT NULL DEFAULT ''",
+    ),
+)
+
+_VERSION_INDEX = """
+CREATE INDEX IF NOT EXISTS questions_prompt_bucket
+    ON questions (prompt_version, role, seniority, id);
+"""
+
+
+def seniority_bucket(experience: str) -> str:
+    """
+    Map an experience string to junior/mid/senior/staff.
+
+    Durations are bucketed by years (<2, <5, <10, 10+); otherwise title
+    words ("Senior", "Lead", ...) are used, defaulting to mid.
+    """
+    text = normalize_experience(experience)
+    match = re.fullmatch(r"(\d+(?:\.\d+)?) (years|months)", text)
+    if match:
+        years = float(match.group(1)) / (12 if match.group(2) == "months" else 1)
+        if years < 2:
+            return "junior"
+        if years < 5:
+            return "mid"
+        if years < 10:
+            return "senior"
+        return "staff"
+    for word, bucket in _SENIORITY_WORDS:
+        if word in text:
+            return bucket
+    return "mid"
+
+
+def classify_topic(question: str) -> str:
+    """Assign a question to a coarse topic by keyword, or "general"."""
+    text = question.lower()
+    for topic, keywords in _TOPIC_KEYWORDS.items():
+        if any(keyword in text for keyword in keywords):
+            return topic
+    return "general"
+
+
+def _terms(question: str) -> frozenset[str]:
+    return frozenset(w for w in _WORD.findall(question.lower()) if w not in _STOPWORDS)
+
+
+def _similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 1.0 if a == b else 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class _BankedQuestion:
+    text: str
+    topic: str
+    terms: frozenset[str]
+
+
+@dataclass
+class _Bucket:
+    questions: list[_BankedQuestion]
+    max_id: int = 0
+    checked_at: float = 0.0
+
+
+class QuestionBank:
+    """
+    Thread-safe question store with near-duplicate rejection.
+
+    A new question is dropped when its content words overlap an existing
+    question in the same bucket by at least `dedupe_threshold` (Jaccard).
+    Only questions stored under `prompt_version` are served, so a changed
+    questions prompt starts new buckets.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        prompt_version: str = "",
+        dedupe_threshold: float = 0.8,
+        refresh_seconds: float = 5.0,
+    ) -> None:
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(questions)")}
+        for column, statement in _MIGRATIONS:
+            if column not in columns:
+                self._conn.execute(statement)
+        self._conn.executescript(_VERSION_INDEX)
+        self._lock = threading.Lock()
+        self._prompt_version = prompt_version
+        self._dedupe_threshold = dedupe_threshold
+        self._refresh_seconds = refresh_seconds
+        self._buckets: dict[BankKey, _Bucket] = {}
+        self.hits = 0
+        self.misses = 0
+        self.duplicates = 0
+
+    @staticmethod
+    def key(role: str, experience: str) -> BankKey:
+        return normalize_role(role), seniority_bucket(experience)
+
+    def _bucket(self, key: BankKey, *, refresh: bool = False) -> list[_BankedQuestion]:
+        """
+        The bucket's questions, first reading any rows other processes have
+        added since the last check (at most every `refresh_seconds`, or now
+        when `refresh` is set). Caller holds the lock.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket([])
+            refresh = True
+        now = time.monotonic()
+        if refresh or now - bucket.checked_at >= self._refresh_seconds:
+            rows = self._conn.execute(
+                "SELECT id, question, topic FROM questions"
+                " WHERE prompt_version = ? AND role = ? AND seniority = ? AND id > ?"
+                " ORDER BY id",
+                (self._prompt_version, *key, bucket.max_id),
+            ).fetchall()
+            for row_id, text, topic in rows:
+                bucket.questions.append(_BankedQuestion(text, topic, _terms(text)))
+                bucket.max_id = row_id
+            bucket.checked_at = now
+        return bucket.questions
+
+    def count(self, role: str, experience: str) -> int:
+        with self._lock:
+            return len(self._bucket(self.key(role, experience)))
+
+    def sample(self, role: str, experience: str, k: int) -> Optional[list[str]]:
+        """
+        Draw `k` distinct questions spread across topics, or None if the
+        bucket holds fewer than `k`.
+        """
+        with self._lock:
+            bucket = self._bucket(self.key(role, experience))
+            if len(bucket) < k:
+                self.misses += 1
+                return None
+            self.hits += 1
+            by_topic: dict[str, list[str]] = {}
+            for item in random.sample(bucket, len(bucket)):
+                by_topic.setdefault(item.topic, []).append(item.text)
+        # Round-robin over topics so one set is not all the same kind.
+        picked: list[str] = []
+        groups = list(by_topic.values())
+        while len(picked) < k:
+            for group in groups:
+                if group and len(picked) < k:
+                    picked.append(group.pop())
+        return picked
+
+    def add(self, role: str, experience: str, questions: list[str]) -> int:
+        """Store new questions, skipping near-duplicates; return how many were added."""
+        key = self.key(role, experience)
+        now = time.time()
+        with self._lock:
+            bucket = self._bucket(key, refresh=True)
+            fresh: list[_BankedQuestion] = []
+            for text in questions:
+                text = text.strip()
+                terms = _terms(text)
+                if not text or any(
+                    _similarity(terms, other.terms) >= self._dedupe_threshold
+                    for other in bucket + fresh
+                ):
+                    self.duplicates += 1
+                    continue
+                fresh.append(_BankedQuestion(text, classify_topic(text), terms))
+            if fresh:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        "INSERT INTO questions"
+                        " (prompt_version, role, seniority, topic, question, created_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (self._prompt_version, *key, q.topic, q.text, now)
+                            for q in fresh
+                        ],
+                    )
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._conn.execute("COMMIT")
+                # Read the new rows back (with any added concurrently elsewhere).
+                self._bucket(key, refresh=True)
+            return len(fresh)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            (size,) = self._conn.execute(
+                "SELECT COUNT(*) FROM questions WHERE prompt_version = ?",
+                (self._prompt_version,),
+            ).fetchone()
+            return {
+                "questions": size,
+                "buckets_loaded": len(self._buckets),
+                "hits": self.hits,
+                "misses": self.misses,
+                "duplicates": self.duplicates,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,48 @@
+"""
+Reference answers prepared while the candidate is still answering.
+
+Every issued question gets a model answer and grading rubric generated in
+the background; evaluations that find one only ask the model to grade.
+"""
+
+from typing import Optional
+
+from app.application.interview.interfaces import AsyncAIService
+from app.infrastructure.ai.factory import build_cache_backend
+from app.infrastructure.ai.rate_limiter import BudgetReserve, ModelSchedulers
+from app.infrastructure.config.settings import Settings
+
+from .prefetcher import ReferencePrefetcher, reference_key  # noqa: F401
+
+
+def build_reference_answers(
+    settings: Settings,
+    ai_service: AsyncAIService,
+    *,
+    model: str,
+    schedulers: Optional[ModelSchedulers] = None,
+) -> Optional[ReferencePrefetcher]:
+    """
+    Build the reference prefetcher, or None when reference answers are disabled.
+    """
+    if not settings.reference_answers_enabled:
+        return None
+    reserve = None
+    if schedulers is not None:
+        reserve = BudgetReserve(
+            schedulers,
+            tokens=settings.reference_answers_reserve_tokens,
+            requests=settings.reference_answers_reserve_requests,
+        )
+    return ReferencePrefetcher(
+        ai_service,
+        build_cache_backend(
+            settings,
+            namespace="references",
+            max_entries=settings.reference_answers_max_entries,
+        ),
+        model=model,
+        ttl_seconds=settings.reference_answers_ttl_seconds,
+        max_pending=settings.reference_answers_max_pending,
+        reserve=reserve,
+    )
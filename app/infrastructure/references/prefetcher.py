@@ -0,0 +1,151 @@
+"""
+Background generation of reference answers for issued questions.
+"""
+
+import asyncio
+import hashlib
+import zlib
+from typing import Optional
+
+from app.application.interview.interfaces import AsyncAIService, ReferenceAnswers
+from app.domain.interview.entities import ReferenceAnswer
+from app.infrastructure.ai.evaluation_cache import normalize_text
+from app.infrastructure.ai.prompts import REFERENCE
+from app.infrastructure.ai.rate_limiter import BudgetReserve, estimate_reference_tokens
+from app.infrastructure.cache.backends import CacheBackend
+from app.infrastructure.cache.codec import decode_reference, encode_reference
+from app.infrastructure.logging.logger import get_logger
+from app.shared.context import in_background
+from app.shared.errors import OverloadedError
+from app.shared.metrics import REGISTRY
+
+
+logger = get_logger(__name__)
+
+_REFERENCES = REGISTRY.counter(
+    "reference_answers_total",
+    "Reference answer generations and lookups, by outcome.",
+    ("outcome",),
+)
+
+
+def reference_key(question: str, *, model: str, prompt_version: str) -> str:
+    """Storage key for a question's reference answer."""
+    digest = hashlib.sha256()
+    for part in (model, prompt_version, normalize_text(question)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return "reference:" + digest.hexdigest()
+
+
+class ReferencePrefetcher(ReferenceAnswers):
+    """
+    Generates reference answers in background tasks and stores them in a
+    CacheBackend by question hash.
+
+    Generation runs as background work, so admission control drops it
+    whenever there is no spare upstream capacity; a question whose
+    reference was dropped is simply graded the usual way. At most
+    `max_pending` generations are outstanding; further questions are skipped
+    until some finish.
+
+    With a `reserve`, a question is also skipped unless its generation, on
+    top of the others this call starts, leaves the reserved rate-limit
+    budget for interactive calls.
+    """
+
+    def __init__(
+        self,
+        ai_service: AsyncAIService,
+        backend: CacheBackend,
+        *,
+        model: str,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_pending: int = 100,
+        reserve: Optional[BudgetReserve] = None,
+    ) -> None:
+        self._ai_service = ai_service
+        self.backend = backend
+        self._model = model
+        self._ttl = ttl_seconds
+        self._max_pending = max(1, max_pending)
+        self._pending: dict[str, "asyncio.Task[None]"] = {}
+        self._reserve = reserve
+
+    def key(self, question: str) -> str:
+        return reference_key(
+            question, model=self._model, prompt_version=REFERENCE.version
+        )
+
+    async def _load(self, key: str) -> Optional[ReferenceAnswer]:
+        if self.backend.blocking:
+            data = await asyncio.to_thread(self.backend.get, key)
+        else:
+            data = self.backend.get(key)
+        if data is None:
+            return None
+        try:
+            return decode_reference(data)
+        except (ValueError, TypeError, zlib.error):
+            return None
+
+    async def _store(self, key: str, reference: ReferenceAnswer) -> None:
+        data = encode_reference(reference)
+        if self.backend.blocking:
+            await asyncio.to_thread(self.backend.set, key, data, self._ttl)
+        else:
+            self.backend.set(key, data, self._ttl)
+
+    def prefetch(self, questions: list[str]) -> None:
+        # Budget already promised to generations started by this call.
+        planned_tokens = planned_requests = 0
+        for question in questions:
+            key = self.key(question)
+            if key in self._pending:
+                continue
+            if len(self._pending) >= self._max_pending:
+                _REFERENCES.inc(outcome="dropped")
+                continue
+            tokens = estimate_reference_tokens(question)
+            if self._reserve is not None and not self._reserve.allows(
+                planned_tokens + tokens, planned_requests + 1
+            ):
+                _REFERENCES.inc(outcome="throttled")
+                continue
+            planned_tokens += tokens
+            planned_requests += 1
+            task = asyncio.ensure_future(self._generate(key, question))
+            self._pending[key] = task
+            task.add_done_callback(lambda _, key=key: self._pending.pop(key, None))
+
+    async def _generate(self, key: str, question: str) -> None:
+        try:
+            if await self._load(key) is not None:
+                return
+            with in_background():
+                reference = await self._ai_service.generate_reference(question)
+            await self._store(key, reference)
+            _REFERENCES.inc(outcome="generated")
+        except asyncio.CancelledError:
+            raise
+        except OverloadedError:
+            _REFERENCES.inc(outcome="shed")
+        except Exception as e:
+            _REFERENCES.inc(outcome="failed")
+            logger.warning(
+                "Reference answer generation failed", extra={"error": str(e)}
+            )
+
+    async def get(self, question: str) -> Optional[ReferenceAnswer]:
+        reference = await self._load(self.key(question))
+        _REFERENCES.inc(outcome="hit" if reference is not None else "miss")
+        return reference
+
+    def stats(self) -> dict[str, int]:
+        return {"pending": len(self._pending), **self.backend.stats()}
+
+    async def aclose(self) -> None:
+        for task in list(self._pending.values()):
+            task.cancel()
+        await asyncio.gather(*self._pending.values(), return_exceptions=True)
+        self.backend.close()
@@ -0,0 +1,5 @@
+"""
+Server-side state for WebSocket interview sessions.
+"""
+
+from .store import InMemorySessionStore  # noqa: F401
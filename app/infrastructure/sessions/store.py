@@ -0,0 +1,59 @@
+"""
+In-memory store for interview sessions.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.application.interview.interfaces import SessionStore
+from app.domain.interview.entities import InterviewSession
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Thread-safe LRU store of sessions with an idle TTL.
+
+    A session expires `ttl_seconds` after it was last saved or read; when
+    more than `max_sessions` are live, the least recently used is evicted.
+    """
+
+    def __init__(self, *, max_sessions: int = 1000, ttl_seconds: float = 1800.0) -> None:
+        self._sessions: "OrderedDict[str, tuple[float, InterviewSession]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_sessions = max(1, max_sessions)
+        self._ttl = ttl_seconds
+
+    def get(self, session_id: str) -> Optional[InterviewSession]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            touched, session = entry
+            if now - touched > self._ttl:
+                del self._sessions[session_id]
+                return None
+            self._sessions[session_id] = (now, session)
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def save(self, session: InterviewSession) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._sessions[session.session_id] = (now, session)
+            self._sessions.move_to_end(session.session_id)
+            # Entries are in last-touched order, so expired ones are at the front.
+            while self._sessions:
+                touched, _ = next(iter(self._sessions.values()))
+                if len(self._sessions) <= self._max_sessions and now - touched <= self._ttl:
+                    break
+                self._sessions.popitem(last=False)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
@@ -8,10 +8,14 @@ This package includes:
 
 from .errors import (  # noqa: F401
     AppError,
+    CircuitOpenError,
     ConflictError,
     DomainError,
     InfrastructureError,
     NotFoundError,
+    OverloadedError,
+    RateLimitError,
+    ServiceUnavailableError,
     ValidationError,
 )
 from .result import Result  # noqa: F401
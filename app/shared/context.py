@@ -0,0 +1,46 @@
+"""
+Request-scoped context shared across layers.
+
+Values are held in context variables so they follow a request through
+awaits and into worker threads started with `contextvars.copy_context`,
+without threading extra parameters through every port.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+
+# Identifies the current request in logs and in the X-Request-ID header.
+correlation_id: ContextVar[str] = ContextVar("correlation_id", default="-")
+
+# When set, cache layers skip lookups (fresh results are still stored).
+cache_bypass: ContextVar[bool] = ContextVar("cache_bypass", default=False)
+
+# Set for work nobody is waiting on (e.g. question bank refills); admission
+# control only runs it on spare capacity.
+background_work: ContextVar[bool] = ContextVar("background_work", default=False)
+
+
+@contextmanager
+def bypassing_cache(enabled: bool = True) -> Iterator[None]:
+    """
+    Bypass response caches for the duration of the block.
+    """
+    token = cache_bypass.set(enabled)
+    try:
+        yield
+    finally:
+        cache_bypass.reset(token)
+
+
+@contextmanager
+def in_background() -> Iterator[None]:
+    """
+    Mark calls made in the block as background work.
+    """
+    token = background_work.set(True)
+    try:
+        yield
+    finally:
+        background_work.reset(token)
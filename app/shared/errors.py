@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 class AppError(Exception):
@@ -52,3 +52,55 @@ class InfrastructureError(AppError):
     status_code = HTTPStatus.SERVICE_UNAVAILABLE
     code = "infrastructure_error"
 
+
+class MalformedOutputError(InfrastructureError):
+    """
+    The upstream model returned output that could not be decoded or repaired
+    into the expected schema.
+    """
+
+    status_code = HTTPStatus.BAD_GATEWAY
+    code = "malformed_output"
+
+
+class ServiceUnavailableError(InfrastructureError):
+    """
+    A dependency is temporarily unable to serve requests. `retry_after` is a
+    hint in seconds, when known.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        retry_after: Optional[float] = None,
+        details: Dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(message, details=details)
+        self.retry_after = retry_after
+
+
+class RateLimitError(ServiceUnavailableError):
+    """
+    The upstream provider (or our client-side budget for it) is at its rate
+    limit.
+    """
+
+    code = "rate_limited"
+
+
+class CircuitOpenError(ServiceUnavailableError):
+    """
+    Calls to an unhealthy upstream are being failed fast by a circuit breaker.
+    """
+
+    code = "circuit_open"
+
+
+class OverloadedError(ServiceUnavailableError):
+    """
+    This instance is at its concurrency limit and is shedding load instead
+    of queueing the request.
+    """
+
+    code = "overloaded"
@@ -0,0 +1,140 @@
+"""
+Cold-start benchmark: how long a fresh process takes to import `main` and
+build the app.
+
+Each run starts a new interpreter (as a serverless cold start does), so
+nothing is shared between runs. The report gives median timings and the
+heaviest packages from `python -X importtime`.
+
+Usage:
+    python -m benchmarks.import_time --runs 10
+    python -m benchmarks.import_time --max-ms 1500    # gate a deploy pipeline
+
+Exit status is 1 when the median import + build time exceeds `--max-ms`.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_CHILD = """
+import json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.get_app()
+built = time.perf_counter()
+print(json.dumps({"import_s": imported - started, "build_s": built - imported}))
+"""
+
+
+def _parse_importtime(stderr: str) -> list[tuple[str, int]]:
+    """
+    Cumulative import time (microseconds) per root package, taken from the
+    package's outermost import.
+    """
+    packages: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        root = name.strip().split(".")[0]
+        if root != "main":
+            packages[root] = max(packages.get(root, 0), int(cumulative))
+    return list(packages.items())
+
+
+def _run_once(env: dict[str, str]) -> tuple[dict[str, float], list[tuple[str, int]]]:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = time.perf_counter() - started
+    timings = json.loads(proc.stdout.strip().splitlines()[-1])
+    timings["process_s"] = total
+    return timings, _parse_importtime(proc.stderr)
+
+
+def run(runs: int, top: int, backend: Optional[str]) -> dict[str, Any]:
+    env = dict(os.environ)
+    if backend:
+        env["AI_BACKEND"] = backend
+    samples = []
+    packages: dict[str, list[int]] = {}
+    for _ in range(runs):
+        timings, imported = _run_once(env)
+        samples.append(timings)
+        for name, cumulative in imported:
+            packages.setdefault(name, []).append(cumulative)
+
+    def median_ms(key: str) -> float:
+        return round(statistics.median(s[key] for s in samples) * 1000, 1)
+
+    heaviest = sorted(
+        ((name, statistics.median(us) / 1000) for name, us in packages.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:top]
+    return {
+        "runs": runs,
+        "import_ms": median_ms("import_s"),
+        "build_ms": median_ms("build_s"),
+        "cold_start_ms": round(median_ms("import_s") + median_ms("build_s"), 1),
+        "process_ms": median_ms("process_s"),
+        "heaviest_packages_ms": {name: round(ms, 1) for name, ms in heaviest},
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(
+        f"runs={report['runs']} import={report['import_ms']}ms "
+        f"build={report['build_ms']}ms cold_start={report['cold_start_ms']}ms "
+        f"process={report['process_ms']}ms (medians)"
+    )
+    print(f"{'package':40} {'cumulative ms':>14}")
+    for name, ms in report["heaviest_packages_ms"].items():
+        print(f"{name:40} {ms:>14.1f}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure cold-start import time.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Heaviest packages to list")
+    parser.add_argument("--backend", choices=["groq", "fake"], help="Override AI_BACKEND")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument(
+        "--max-ms", type=float, help="Fail if median import + build exceeds this"
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.runs, args.top, args.backend)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+    if args.max_ms is not None and report["cold_start_ms"] > args.max_ms:
+        print(
+            f"FAIL: cold start {report['cold_start_ms']}ms > {args.max_ms}ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
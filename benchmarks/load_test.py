@@ -0,0 +1,220 @@
+"""
+Load-test benchmark for the interview API.
+
+Drives the full FastAPI app from `main.create_app()` in-process (through
+httpx's ASGI transport, lifespan included) at a fixed concurrency and reports
+throughput, latency percentiles and error rate per endpoint. By default the
+upstream LLM is replaced by the deterministic local fake (`AI_BACKEND=fake`),
+so the run is offline, free and repeatable.
+
+Usage:
+    python -m benchmarks.load_test --requests 2000 --concurrency 100
+    python -m benchmarks.load_test --endpoint evaluate --fake-latency-ms 800
+    python -m benchmarks.load_test --url http://localhost:8000   # live server
+
+Exit status is 1 when `--max-p95-ms` or `--max-error-rate` is exceeded, so
+the benchmark can gate a deploy pipeline.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import httpx
+
+
+ENDPOINTS = {
+    "generate-questions": "/v1/interview/generate-questions",
+    "evaluate": "/v1/interview/evaluate",
+}
+
+
+@dataclass
+class EndpointStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        return {
+            "requests": self.count,
+            "rps": round(self.count / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 2),
+            "p95_ms": round(self.percentile(95) * 1000, 2),
+            "p99_ms": round(self.percentile(99) * 1000, 2),
+            "mean_ms": round(statistics.fmean(self.latencies) * 1000, 2)
+            if self.latencies
+            else 0.0,
+            "error_rate": round(self.errors / self.count, 4) if self.count else 0.0,
+        }
+
+
+def _payload(endpoint: str, i: int, unique: bool) -> dict[str, str]:
+    n = i if unique else i % 8
+    if endpoint == "generate-questions":
+        return {"role": f"Software Engineer {n}", "experience": f"{n % 10} years"}
+    return {
+        "question": f"Explain how you would design a rate limiter ({n}).",
+        "answer": f"I would use a token bucket per client, variant {n}. " * 8,
+    }
+
+
+async def _run(
+    client: httpx.AsyncClient,
+    endpoints: list[str],
+    total: int,
+    concurrency: int,
+    unique: bool,
+) -> tuple[dict[str, EndpointStats], float]:
+    stats = {name: EndpointStats() for name in endpoints}
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        for i in counter:
+            name = endpoints[i % len(endpoints)]
+            started = time.perf_counter()
+            try:
+                response = await client.post(ENDPOINTS[name], json=_payload(name, i, unique))
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            stats[name].latencies.append(time.perf_counter() - started)
+            if not ok:
+                stats[name].errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return stats, time.perf_counter() - started
+
+
+def _configure_offline(args: argparse.Namespace) -> None:
+    """Point the app at the fake backend before settings are first read."""
+    os.environ["AI_BACKEND"] = "fake"
+    os.environ["FAKE_AI_LATENCY_MS"] = str(args.fake_latency_ms)
+    os.environ["FAKE_AI_LATENCY_DISTRIBUTION"] = args.fake_distribution
+    os.environ["FAKE_AI_ERROR_RATE"] = str(args.fake_error_rate)
+    os.environ["FAKE_AI_ANSWER_WORDS"] = str(args.fake_answer_words)
+    # Upstream rate limits are not what is being measured offline.
+    os.environ.setdefault("AI_RATE_LIMIT_ENABLED", "false")
+    if args.no_cache:
+        os.environ["QUESTION_CACHE_ENABLED"] = "false"
+        os.environ["EVALUATION_CACHE_ENABLED"] = "false"
+    os.environ.setdefault("QUESTION_BANK_PATH", ":memory:")
+    os.environ.setdefault("APP_ENV", "test")
+
+
+async def _benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    endpoints = list(ENDPOINTS) if args.endpoint == "all" else [args.endpoint]
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    if args.url:
+        async with httpx.AsyncClient(
+            base_url=args.url, timeout=args.timeout, limits=limits
+        ) as client:
+            stats, elapsed = await _run(
+                client, endpoints, args.requests, args.concurrency, args.unique
+            )
+    else:
+        _configure_offline(args)
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from main import create_app
+
+        app = create_app()
+        # The load generator's own per-request logs would drown the report.
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench", timeout=args.timeout
+            ) as client:
+                stats, elapsed = await _run(
+                    client, endpoints, args.requests, args.concurrency, args.unique
+                )
+
+    return {
+        "target": args.url or "in-process (fake backend)",
+        "concurrency": args.concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "endpoints": {name: s.summary(elapsed) for name, s in stats.items()},
+    }
+
+
+def _print_table(report: dict[str, Any], out: Callable[[str], None] = print) -> None:
+    out(
+        f"target={report['target']} concurrency={report['concurrency']} "
+        f"elapsed={report['elapsed_s']}s"
+    )
+    out(
+        f"{'endpoint':<20}{'requests':>9}{'rps':>9}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'errors':>9}"
+    )
+    for name, s in report["endpoints"].items():
+        out(
+            f"{name:<20}{s['requests']:>9}{s['rps']:>9}{s['p50_ms']:>10}"
+            f"{s['p95_ms']:>10}{s['p99_ms']:>10}{s['error_rate']:>9.2%}"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="Benchmark a running server instead of in-process")
+    parser.add_argument("--endpoint", choices=["all", *ENDPOINTS], default="all")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument(
+        "--unique", action="store_true", help="Never repeat a payload (defeats caches)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable response caches")
+    parser.add_argument("--fake-latency-ms", type=float, default=300.0)
+    parser.add_argument(
+        "--fake-distribution",
+        choices=["constant", "uniform", "lognormal"],
+        default="lognormal",
+    )
+    parser.add_argument("--fake-error-rate", type=float, default=0.0)
+    parser.add_argument("--fake-answer-words", type=int, default=120)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--max-p95-ms", type=float, help="Fail if any endpoint p95 exceeds this")
+    parser.add_argument("--max-error-rate", type=float, help="Fail if any error rate exceeds this")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_benchmark(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_table(report)
+
+    failed = False
+    for name, s in report["endpoints"].items():
+        if args.max_p95_ms is not None and s["p95_ms"] > args.max_p95_ms:
+            print(f"FAIL {name}: p95 {s['p95_ms']}ms > {args.max_p95_ms}ms", file=sys.stderr)
+            failed = True
+        if args.max_error_rate is not None and s["error_rate"] > args.max_error_rate:
+            print(
+                f"FAIL {name}: error rate {s['error_rate']} > {args.max_error_rate}",
+                file=sys.stderr,
+            )
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
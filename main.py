@@ -1,12 +1,65 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
 from app.api.error_handlers import register_error_handlers
+from app.api.middleware import CorrelationIdMiddleware, MetricsMiddleware
 from app.api.routes import api_router
+from app.api.static_files import InMemoryStaticFiles
+from app.infrastructure.ai.factory import build_ai_runtime, build_answer_scorer
 from app.infrastructure.config.settings import get_settings
+from app.infrastructure.jobs import build_evaluation_jobs
+from app.infrastructure.references import build_reference_answers
+from app.infrastructure.sessions import InMemorySessionStore
 from app.infrastructure.logging.logger import configure_logging
+from app.shared.metrics import REGISTRY
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Build process-wide resources on startup and release them on shutdown.
+
+    The AI service stack (and its pooled HTTP client), the reference answer
+    prefetcher, the answer scorer, the evaluation job workers and the
+    interview session store are created once here and shared by every request through
+    `app.api.dependencies`.
+    """
+    settings = get_settings()
+    runtime = build_ai_runtime(settings)
+    references = build_reference_answers(
+        settings, runtime.service, model=runtime.model, schedulers=runtime.schedulers
+    )
+    jobs = build_evaluation_jobs(settings, runtime.service, references)
+    app.state.ai_runtime = runtime
+    app.state.ai_service = runtime.service
+    app.state.reference_answers = references
+    app.state.answer_scorer = build_answer_scorer(settings)
+    app.state.evaluation_jobs = jobs
+    app.state.session_store = InMemorySessionStore(
+        max_sessions=settings.session_max_sessions,
+        ttl_seconds=settings.session_ttl_seconds,
+    )
+    REGISTRY.add_collector(runtime.collect_metrics)
+    if jobs is not None:
+        jobs.start()
+        REGISTRY.add_collector(jobs.collect_metrics)
+    try:
+        yield
+    finally:
+        if jobs is not None:
+            REGISTRY.remove_collector(jobs.collect_metrics)
+            await jobs.aclose()
+        if references is not None:
+            await references.aclose()
+        REGISTRY.remove_collector(runtime.collect_metrics)
+        await runtime.aclose()
 
 
 def create_app() -> FastAPI:
@@ -15,9 +68,12 @@ def create_app() -> FastAPI:
 
     This wires together:
     - Settings and logging configuration.
+    - Lifespan-managed shared resources (AI service, connection pool).
     - API routers.
     - Global exception handlers.
     - CORS middleware for frontend integration.
+    - Request metrics and the Prometheus `/metrics` endpoint.
+    - Correlation IDs for every request (logs and `X-Request-ID`).
     """
     settings = get_settings()
     configure_logging(settings)
@@ -27,6 +83,7 @@ def create_app() -> FastAPI:
         version=settings.version,
         docs_url="/docs" if settings.enable_docs else None,
         redoc_url="/redoc" if settings.enable_docs else None,
+        lifespan=lifespan,
     )
 
     # Enable CORS for React frontend
@@ -38,12 +95,42 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+    # Added last so it runs first: everything below sees the correlation ID.
+    app.add_middleware(CorrelationIdMiddleware)
 
     # Health check endpoint (before static files)
     @app.get("/ping")
-    def ping():
-        """Health check endpoint."""
-        return {"status": "alive"}
+    def ping(request: Request):
+        """
+        Health check endpoint, including upstream AI circuit state.
+
+        `in_flight` and `queued` count AI calls running and waiting for
+        admission, so a load balancer can steer traffic away from hot
+        instances.
+        """
+        runtime = getattr(request.app.state, "ai_runtime", None)
+        jobs = getattr(request.app.state, "evaluation_jobs", None)
+        references = getattr(request.app.state, "reference_answers", None)
+        admission = runtime.admission if runtime is not None else None
+        return {
+            "status": "alive",
+            "in_flight": admission.in_flight if admission is not None else 0,
+            "queued": admission.queued if admission is not None else 0,
+            "ai": runtime.health() if runtime is not None else {},
+            "jobs": jobs.stats() if jobs is not None else {},
+            "references": references.stats() if references is not None else {},
+        }
+
+    if settings.metrics_enabled:
+
+        @app.get("/metrics", include_in_schema=False)
+        def metrics() -> PlainTextResponse:
+            """Prometheus scrape endpoint."""
+            return PlainTextResponse(
+                REGISTRY.render(), media_type="text/plain; version=0.0.4"
+            )
 
     # Include versioned API router
     app.include_router(api_router, prefix="/v1")
@@ -55,10 +142,31 @@ def create_app() -> FastAPI:
     static_dir = Path(__file__).parent / "static"
     if static_dir.exists():
         # Mount static files, but exclude API routes
-        app.mount("/", StaticFiles(directory=str(static_dir), html=True), name="static")
+        static_app = (
+            InMemoryStaticFiles(str(static_dir))
+            if settings.static_in_memory
+            else StaticFiles(directory=str(static_dir), html=True)
+        )
+        app.mount("/", static_app, name="static")
 
     return app
 
 
-app = create_app()
+@lru_cache
+def get_app() -> FastAPI:
+    """
+    The process-wide app, built on first use.
+
+    Serverless runtimes (`api/index.py`) and `uvicorn main:app` both go
+    through this, so each process builds the app exactly once, and importing
+    `main` for `create_app` alone (tests, benchmarks) builds nothing.
+    """
+    return create_app()
+
+
+def __getattr__(name: str) -> Any:
+    # `main.app` is resolved lazily (PEP 562) so importing the module is cheap.
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from app.infrastructure.ai.incremental_json import IncrementalObjectParser
+
+
+def _feed(chunks, stream_keys=()):
+    parser = IncrementalObjectParser(stream_keys)
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    return parser, events
+
+
+def _splits(text):
+    """Every way of cutting `text` into two chunks, plus one char at a time."""
+    for i in range(len(text) + 1):
+        yield [text[:i], text[i:]]
+    yield list(text)
+
+
+def _values(events):
+    return {key: value for kind, key, value in events if kind == "value"}
+
+
+def _streamed(events, key):
+    return "".join(text for kind, name, text in events if kind == "delta" and name == key)
+
+
+DOCUMENT = json.dumps(
+    {
+        "score": 7,
+        "strengths": ["clear", "uses \"quotes\""],
+        "weaknesses": [],
+        "passed": True,
+        "notes": None,
+        "improved_answer": "Line one\nTab\there \\ slash é \U0001F600 end",
+    }
+)
+
+
+@pytest.mark.parametrize("chunks", list(_splits(DOCUMENT)))
+def test_values_do_not_depend_on_chunk_boundaries(chunks):
+    parser, events = _feed(chunks, stream_keys=["improved_answer"])
+
+    assert parser.done
+    assert _values(events) == json.loads(DOCUMENT)
+    assert _streamed(events, "improved_answer") == json.loads(DOCUMENT)["improved_answer"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": "\\ud83d\\ude00"}',
+        '{"a": "x\\u00e9y"}',
+        '{"a": "\\"quoted\\" and \\\\"}',
+        '{"a": "\\n\\t\\r\\b\\f\\/"}',
+    ],
+)
+def test_escapes_split_anywhere_are_decoded_once_complete(text):
+    expected = json.loads(text)["a"]
+    for chunks in _splits(text):
+        _, events = _feed(chunks, stream_keys=["a"])
+        deltas = [t for kind, _, t in events if kind == "delta"]
+
+        assert "".join(deltas) == expected
+        assert _values(events) == {"a": expected}
+        # A surrogate pair is never emitted half at a time.
+        for delta in deltas:
+            delta.encode("utf-8")
+
+
+def test_only_stream_keys_emit_deltas():
+    _, events = _feed(['{"answer": "abc", ', '"other": "def"}'], stream_keys=["answer"])
+
+    assert [kind for kind, key, _ in events if key == "other"] == ["value"]
+    assert _streamed(events, "answer") == "abc"
+
+
+def test_each_member_is_reported_as_soon_as_it_completes():
+    parser = IncrementalObjectParser()
+
+    assert parser.feed('{"score": 8, "strengths": ["a"') == [("value", "score", 8)]
+    assert parser.feed('], "weaknesses": [') == [("value", "strengths", ["a"])]
+    assert not parser.done
+    assert parser.feed("]}") == [("value", "weaknesses", [])]
+    assert parser.done
+
+
+def test_primitive_at_end_of_object_is_completed_by_closing_brace():
+    _, events = _feed(['{"score": 1', "0}"])
+
+    assert _values(events) == {"score": 10}
+
+
+def test_text_around_the_object_is_ignored():
+    parser, events = _feed(['```json\n{"score"', ': 5}\n```\nThanks!'])
+
+    assert parser.done
+    assert _values(events) == {"score": 5}
+
+
+def test_trailing_commas_are_tolerated():
+    _, events = _feed(['{"strengths": ["a", "b",], "weaknesses": [],}'])
+
+    assert _values(events) == {"strengths": ["a", "b"], "weaknesses": []}
+
+
+@pytest.mark.parametrize("text", ['{score: 5}', '{"score" 5}', '{"a": 1 "b": 2}'])
+def test_malformed_structure_raises(text):
+    with pytest.raises(json.JSONDecodeError):
+        _feed([text])
@@ -0,0 +1,137 @@
+import pytest
+
+from app.domain.interview.entities import ReferenceAnswer
+from app.infrastructure.ai.output_parsing import (
+    drop_trailing_commas,
+    parse_evaluation,
+    parse_questions,
+    parse_reference,
+    repair_json,
+)
+from app.shared.errors import MalformedOutputError
+
+
+EVALUATION = (
+    '{"score": 7, "strengths": ["a"], "weaknesses": ["b"], "improved_answer": "c"}'
+)
+
+
+@pytest.mark.parametrize(
+    "content, text, repairs",
+    [
+        (EVALUATION, EVALUATION, []),
+        (f"```json\n{EVALUATION}\n```", EVALUATION, ["code_fence"]),
+        (f"```\n{EVALUATION}\n```", EVALUATION, ["code_fence"]),
+        (f"Evaluation:\n{EVALUATION}\nGood luck!", EVALUATION, ["surrounding_text"]),
+        (f"{EVALUATION} Hope this helps.", EVALUATION, ["surrounding_text"]),
+        ('{"a": [1, 2,],}', '{"a": [1, 2]}', ["trailing_comma"]),
+        (
+            '```json\nSure: {"a": 1,}\n```',
+            '{"a": 1}',
+            ["code_fence", "surrounding_text", "trailing_comma"],
+        ),
+    ],
+)
+def test_repair_json(content, text, repairs):
+    assert repair_json(content) == (text, repairs)
+
+
+def test_drop_trailing_commas_leaves_strings_alone():
+    text = '{"a": ",}", "b": "\\",]",}'
+
+    assert drop_trailing_commas(text) == '{"a": ",}", "b": "\\",]"}'
+
+
+@pytest.mark.parametrize(
+    "content, score",
+    [
+        (EVALUATION, 7),
+        ('{"score": "8"}', 8),
+        ('{"score": "8/10"}', 8),
+        ('{"score": " 6.6 / 10 "}', 7),
+        ('{"score": 7.4}', 7),
+        ('{"score": 0}', 1),
+        ('{"score": -3}', 1),
+        ('{"score": 11}', 10),
+        ('{"score": "85"}', 10),
+    ],
+)
+def test_scores_are_coerced_and_clamped(content, score):
+    assert parse_evaluation(content).score == score
+
+
+def test_evaluation_fields_are_repaired():
+    evaluation = parse_evaluation(
+        '```json\n{"score": "9", "strengths": "concise", "weaknesses": [" ", 3],'
+        ' "improved_answer": "  Better.  ",}\n```'
+    )
+
+    assert evaluation.score == 9
+    assert evaluation.strengths == ["concise"]
+    assert evaluation.weaknesses == ["3"]
+    assert evaluation.improved_answer == "Better."
+
+
+def test_graded_evaluation_takes_improved_answer_from_reference():
+    reference = ReferenceAnswer(answer="Reference.", rubric=["x"])
+
+    evaluation = parse_evaluation('{"score": 5, "improved_answer": 42}', reference)
+
+    assert evaluation.improved_answer == "Reference."
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        None,
+        "",
+        "   ",
+        "I cannot evaluate this answer.",
+        '{"score": 7',
+        "[7]",
+        '{"strengths": ["a"]}',
+        '{"score": null}',
+        '{"score": "seven"}',
+        '{"score": true}',
+        '{"score": [7]}',
+        '{"score": "NaN"}',
+        '{"score": 7, "strengths": {"a": 1}}',
+        '{"score": 7, "weaknesses": [["nested"]]}',
+        '{"score": 7, "improved_answer": ["a"]}',
+    ],
+)
+def test_unrepairable_evaluations_raise(content):
+    with pytest.raises(MalformedOutputError) as info:
+        parse_evaluation(content)
+
+    assert info.value.details["operation"] == "evaluation"
+
+
+def test_questions_are_repaired():
+    assert parse_questions('```json\n{"questions": ["One?", " ", "Two?",]}\n```') == [
+        "One?",
+        "Two?",
+    ]
+    assert parse_questions('{"questions": "Only one?"}') == ["Only one?"]
+
+
+@pytest.mark.parametrize(
+    "content", ['{"questions": []}', '{"questions": [""]}', '{"items": ["a"]}', "{}"]
+)
+def test_missing_questions_raise(content):
+    with pytest.raises(MalformedOutputError):
+        parse_questions(content)
+
+
+def test_reference_is_repaired():
+    reference = parse_reference('Reference: {"answer": " A. ", "rubric": "covers x",}')
+
+    assert reference == ReferenceAnswer(answer="A.", rubric=["covers x"])
+
+
+@pytest.mark.parametrize(
+    "content", ['{"answer": ""}', '{"answer": 5}', '{"rubric": ["x"]}']
+)
+def test_missing_reference_answer_raises(content):
+    with pytest.raises(MalformedOutputError):
+        parse_reference(content)
@@ -0,0 +1,79 @@
+import pytest
+
+from app.domain.interview.entities import ReferenceAnswer
+from app.domain.interview.scoring import TriageThresholds, TrivialAnswerScorer
+
+
+QUESTION = "What is the difference between TCP and UDP?"
+REFERENCE = ReferenceAnswer(
+    answer="TCP is connection-oriented and reliable; UDP is connectionless and faster.",
+    rubric=["reliability", "ordering", "latency"],
+)
+
+
+@pytest.fixture
+def scorer():
+    return TrivialAnswerScorer()
+
+
+@pytest.mark.parametrize(
+    "answer, reason, score",
+    [
+        ("", "empty", 1),
+        ("   \n\t", "empty", 1),
+        ("?!...", "empty", 1),
+        ("I don't know", "no_answer", 1),
+        ("  IDK. ", "no_answer", 1),
+        ("No idea!", "no_answer", 1),
+        ("Reliability", "too_short", 2),
+        ("asdfgh qwrtzp xcvbnm", "gibberish", 1),
+        ("sdfsdfsdf hjkhjkhjk lkjlkjlkj ok", "gibberish", 1),
+        ("What is the difference between TCP and UDP", "copied_question", 1),
+    ],
+)
+def test_degenerate_answers_are_scored_locally(scorer, answer, reason, score):
+    triage = scorer.triage(QUESTION, answer)
+
+    assert triage is not None
+    assert triage.reason == reason
+    assert triage.evaluation.score == score
+    assert triage.evaluation.strengths == []
+    assert len(triage.evaluation.weaknesses) == 1
+
+
+@pytest.mark.parametrize(
+    "answer",
+    [
+        "TCP guarantees ordered delivery with retransmission; UDP just sends datagrams.",
+        "TCP очень надёжный протокол, а UDP быстрый и без соединения.",
+        "TCP 是面向连接的可靠协议，UDP 是无连接的。",
+        "HTTP/2 over TLS, gRPC, QUIC, TCP",
+        "Café résumé naïve façade: accents are words too.",
+        "Use SO_REUSEADDR and IPv6 sockets, e.g. getaddrinfo().",
+    ],
+)
+def test_genuine_answers_go_to_the_model(scorer, answer):
+    assert scorer.triage(QUESTION, answer) is None
+
+
+def test_improved_answer_comes_from_the_reference(scorer):
+    triage = scorer.triage(QUESTION, "", REFERENCE)
+
+    assert triage is not None
+    assert triage.evaluation.improved_answer == REFERENCE.answer
+
+
+def test_off_topic_needs_a_reference_and_enough_words(scorer):
+    off_topic = "My favourite pasta recipe uses garlic butter."
+
+    assert scorer.triage(QUESTION, off_topic) is None
+    assert scorer.triage(QUESTION, off_topic, REFERENCE).reason == "off_topic"
+    assert scorer.triage(QUESTION, "Pasta garlic", REFERENCE) is None
+    assert scorer.triage(QUESTION, "TCP retransmits lost packets", REFERENCE) is None
+
+
+def test_thresholds_are_configurable():
+    strict = TrivialAnswerScorer(TriageThresholds(min_words=5))
+
+    assert strict.triage(QUESTION, "UDP is faster").reason == "too_short"
+    assert TrivialAnswerScorer().triage(QUESTION, "UDP is faster") is None